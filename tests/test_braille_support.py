@@ -0,0 +1,117 @@
+# tests/test_braille_support.py
+
+import dataclasses
+
+import pytest
+from tkaria11y.braille_support import (
+    BrailleCell,
+    BrailleManager,
+    GenericBrailleDisplay,
+)
+
+
+def test_from_char_cells_are_immutable():
+    """Test shared cells from from_char cannot be modified by callers"""
+    cell = BrailleCell.from_char("a")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cell.dots = 0x3F
+
+    assert BrailleCell.from_char("A").dots == 0x01
+    assert BrailleCell.from_char("a") is cell
+
+
+def test_braille_cell_clamps_dots():
+    """Test BrailleCell keeps dots within 0-255"""
+    assert BrailleCell(300).dots == 255
+    assert BrailleCell(-1).dots == 0
+
+
+def _connected_display(cell_count=8):
+    """Create a connected simulated display recording each dirty range sent"""
+    display = GenericBrailleDisplay(cell_count)
+    display.connect()
+    display.sent_ranges = []
+    dirty_range = display._dirty_range
+
+    def record():
+        sent = dirty_range()
+        display.sent_ranges.append(sent)
+        return sent
+
+    display._dirty_range = record
+    return display
+
+
+def test_first_write_renders_whole_display():
+    """Test the first write after connecting sends every cell"""
+    display = _connected_display()
+    display.set_text("ab")
+
+    assert display.sent_ranges == [(0, 8)]
+    assert display.get_simulated_text() == "\u2801\u2803" + "\u2800" * 6
+
+
+def test_single_cell_change_sends_only_that_cell():
+    """Test changing one character only re-renders its cell"""
+    display = _connected_display()
+    display.set_text("abc")
+    display.set_text("axc")
+
+    assert display.sent_ranges[-1] == (1, 2)
+    assert display.get_simulated_text() == "\u2801\u282d\u2809" + "\u2800" * 5
+
+
+def test_unchanged_write_is_not_rendered():
+    """Test writing the same content again sends nothing"""
+    display = _connected_display()
+    display.set_text("abc")
+    display.set_text("abc")
+
+    assert display.sent_ranges == [(0, 8), None]
+    assert display.get_simulated_text() == "\u2801\u2803\u2809" + "\u2800" * 5
+
+
+def test_cursor_blink_sends_only_cursor_cell():
+    """Test toggling the cursor re-sends just the cursor cell"""
+    display = _connected_display()
+    display.set_text("abc")
+    display.set_cursor_position(2)
+
+    # Blink the cursor off and on again the way the braille worker does
+    display._cursor[2] = 0
+    display.write_cells(display._cells)
+    display._cursor[2] = 1
+    display.write_cells(display._cells)
+
+    assert display.sent_ranges == [(0, 8), (2, 3), (2, 3), (2, 3)]
+    assert display.get_simulated_text() == "\u2801\u2803\u2809" + "\u2800" * 5
+
+
+def test_write_after_reconnect_renders_whole_display():
+    """Test reconnecting forgets what was sent and re-renders every cell"""
+    display = _connected_display()
+    display.set_text("abc")
+    display.disconnect()
+
+    assert not display.write_cells([BrailleCell.from_char("a")])
+    assert display.get_simulated_text() == ""
+
+    display.connect()
+    display.set_text("abc")
+
+    assert display.sent_ranges == [(0, 8), (0, 8)]
+    assert display.get_simulated_text() == "\u2801\u2803\u2809" + "\u2800" * 5
+
+
+def test_malformed_routing_keys_are_ignored():
+    """Test routing keys without a usable cell number do not raise"""
+    manager = BrailleManager()
+    routed = []
+    manager._handle_cursor_routing = routed.append
+
+    for key in ("routing_\u00b2", "routing_", "routing_x", "routing_-1", "routing_5"):
+        manager._handle_braille_key(key)
+
+    assert routed == [5]
+    manager.shutdown()
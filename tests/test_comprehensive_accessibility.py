@@ -41,12 +41,15 @@ from tkaria11y import (
     validate_screen_reader_compatibility,
     ValidationLevel,
     AccessibilityValidator,
+    AccessibilityTester,
+    IssueKind,
     # Platform integration
     get_platform_adapter,
     is_screen_reader_active,
     # ARIA compliance
     ARIARole,
     calculate_contrast_ratio,
+    calculate_contrast_ratios,
     validate_contrast_ratio,
     # Braille support
     get_braille_manager,
@@ -239,6 +242,18 @@ class TestComprehensiveAccessibility:
         assert validate_contrast_ratio("#FFFFFF", "#757575", "AA")
         assert not validate_contrast_ratio("#FFFFFF", "#757575", "AAA")
 
+    def test_batch_contrast_ratios(self):
+        """Test batch contrast ratios match the single-pair calculation"""
+        pairs = [
+            ("#000000", "#FFFFFF"),
+            ("#888", "#999999"),
+            ("#FFFFFF", "#757575"),
+            ("#000000", "not-a-color"),
+        ]
+        ratios = calculate_contrast_ratios(pairs)
+        assert ratios == [calculate_contrast_ratio(fg, bg) for fg, bg in pairs]
+        assert ratios[-1] == 1.0
+
     def test_keyboard_navigation(self):
         """Test keyboard navigation functionality"""
         # Create focusable widgets
@@ -479,6 +494,17 @@ class TestComprehensiveAccessibility:
         assert "total_issues" in quick_result
         assert "critical_issues" in quick_result
 
+    def test_full_audit_keeps_validator_issues(self):
+        """Test a full audit leaves its issues on the validator"""
+        unlabeled = tk.Button(self.root, text="")
+        unlabeled.pack()
+
+        tester = AccessibilityTester(self.root)
+        report = tester.run_full_audit()
+
+        assert len(tester.validator.issues) == report["total_issues"]
+        assert report["total_issues"] > 0
+
     def test_validation_edge_cases(self):
         """Test validation with edge cases and complex scenarios"""
         # Test empty application
@@ -762,6 +788,20 @@ class TestComprehensiveAccessibility:
         )
         assert total_severity_issues == report["total_issues"]
 
+    def test_issue_kind_dispatches_auto_fix(self):
+        """Test that issue kinds select the matching automatic fix"""
+        unfocusable = tk.Button(self.root, text="Go", takefocus=0)
+        unfocusable.pack()
+
+        validator = AccessibilityValidator(ValidationLevel.AA)
+        issues = validator.validate_application(self.root)
+
+        kinds = {issue.kind for issue in issues if issue.widget is unfocusable}
+        assert IssueKind.NOT_FOCUSABLE in kinds
+
+        assert validator.auto_fix_issues(self.root) > 0
+        assert str(unfocusable.cget("takefocus")) not in ("0", "")
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -56,8 +56,10 @@ from .aria_compliance import (
     ARIARole,
     ARIAProperty,
     get_default_role,
+    get_role_for_class,
     validate_aria_compliance,
     calculate_contrast_ratio,
+    calculate_contrast_ratios,
     validate_contrast_ratio,
 )
 
@@ -76,6 +78,7 @@ from .accessibility_validator import (
     ValidationLevel,
     ValidationCategory,
     IssueSeverity,
+    IssueKind,
     validate_accessibility,
     auto_fix_accessibility_issues,
     run_accessibility_audit,
@@ -201,8 +204,10 @@ __all__ = [
     "ARIARole",
     "ARIAProperty",
     "get_default_role",
+    "get_role_for_class",
     "validate_aria_compliance",
     "calculate_contrast_ratio",
+    "calculate_contrast_ratios",
     "validate_contrast_ratio",
     "validate_keyboard_navigation",
     # Mixins
@@ -216,6 +221,7 @@ __all__ = [
     "ValidationLevel",
     "ValidationCategory",
     "IssueSeverity",
+    "IssueKind",
     "validate_accessibility",
     "auto_fix_accessibility_issues",
     "run_accessibility_audit",
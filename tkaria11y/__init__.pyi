@@ -21,6 +21,7 @@ class AccessibleApp(tk.Tk):
         dyslexic_font: bool = ...,
         scaling: float = ...,
         enable_inspector: bool = ...,
+        shutdown_tts_on_close: bool = ...,
     ) -> None: ...
     def announce(self, message: str, priority: str = ...) -> None: ...
     def set_theme(self, theme_name: str) -> None: ...
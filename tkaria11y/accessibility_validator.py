@@ -6,17 +6,33 @@ Provides automated testing for WCAG 2.1 compliance, ARIA validation,
 keyboard navigation, and screen reader compatibility.
 """
 
+import sys
 import tkinter as tk
-from typing import List, Dict, Any, Optional, Set
+from typing import (
+    List,
+    Dict,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 import time
-from dataclasses import dataclass
+from collections import Counter, defaultdict
+from functools import lru_cache
 from enum import Enum
 from .aria_compliance import (
     ARIARole,
     calculate_contrast_ratio,
+    get_role_for_class,
     validate_keyboard_navigation,
 )
 from .platform_adapter import is_screen_reader_active
+from .themes import HighContrastTheme
 
 
 class ValidationLevel(Enum):
@@ -46,8 +62,38 @@ class IssueSeverity(Enum):
     INFO = "info"
 
 
-@dataclass
-class AccessibilityIssue:
+class IssueKind(Enum):
+    """Kinds of accessibility issues, used to dispatch automatic fixes"""
+
+    OTHER = "other"
+    MISSING_ALT_TEXT = "missing_alt_text"
+    LOW_CONTRAST = "low_contrast"
+    SMALL_FONT = "small_font"
+    MISSING_AUDIO_DESCRIPTION = "missing_audio_description"
+    CANVAS_MULTIMEDIA = "canvas_multimedia"
+    COLOR_ONLY = "color_only"
+    NOT_FOCUSABLE = "not_focusable"
+    KEYBOARD_NAVIGATION = "keyboard_navigation"
+    FOCUS_ORDER = "focus_order"
+    TIMING_CONSTRAINT = "timing_constraint"
+    CANVAS_FLASHING = "canvas_flashing"
+    BRIGHT_RED_BACKGROUND = "bright_red_background"
+    MISSING_LABEL = "missing_label"
+    MISSING_REQUIRED_INDICATOR = "missing_required_indicator"
+    HARD_TO_READ_FONT = "hard_to_read_font"
+    FOCUS_CONTEXT_CHANGE = "focus_context_change"
+    DUPLICATE_BUTTON_TEXT = "duplicate_button_text"
+    INVALID_ARIA_ROLE = "invalid_aria_role"
+    MISSING_ACCESSIBILITY_SUPPORT = "missing_accessibility_support"
+    DEPRECATED_OPTION = "deprecated_option"
+    EXCESSIVE_NESTING = "excessive_nesting"
+    EMPTY_CONTAINER = "empty_container"
+    MISSING_INPUT_VALIDATION = "missing_input_validation"
+    SMALL_TARGET = "small_target"
+    HARDCODED_TEXT = "hardcoded_text"
+
+
+class AccessibilityIssue(NamedTuple):
     """Represents an accessibility issue"""
 
     severity: IssueSeverity
@@ -60,6 +106,282 @@ class AccessibilityIssue:
     recommendation: str = ""
     wcag_criterion: str = ""
     auto_fixable: bool = False
+    kind: IssueKind = IssueKind.OTHER
+
+
+# Ordering of compliance levels; each level includes the ones below it
+_LEVEL_RANK = {ValidationLevel.A: 1, ValidationLevel.AA: 2, ValidationLevel.AAA: 3}
+
+# Role names accepted as valid ARIA roles
+_VALID_ARIA_ROLES = frozenset(role.value for role in ARIARole)
+
+# Widget classes that need a text alternative, and the severity of a missing one
+_ALT_TEXT_CLASSES = frozenset(
+    {"Button", "Canvas", "Label", "Checkbutton", "Radiobutton"}
+)
+_ALT_TEXT_SEVERITY = {
+    "Button": IssueSeverity.CRITICAL,
+    "Checkbutton": IssueSeverity.HIGH,
+    "Radiobutton": IssueSeverity.HIGH,
+}
+
+# Widget classes the user interacts with directly
+_INTERACTIVE_CLASSES = frozenset(
+    {
+        "Button",
+        "Entry",
+        "Text",
+        "Checkbutton",
+        "Radiobutton",
+        "Scale",
+        "Listbox",
+        "Scrollbar",
+        "Spinbox",
+    }
+)
+
+# Widget classes the tester expects to have keyboard bindings, and the event
+# sequence prefixes that count as one
+_KEYBOARD_TESTED_CLASSES = frozenset(
+    {
+        "Button",
+        "Entry",
+        "Text",
+        "Listbox",
+        "Scale",
+        "Checkbutton",
+        "Radiobutton",
+        "Menu",
+    }
+)
+_KEY_BINDING_PREFIXES = ("<Key", "<Return", "<Tab", "<Space")
+
+# Widget classes that accept typed input
+_INPUT_CLASSES = frozenset({"Entry", "Text", "Spinbox"})
+
+# Widget classes that make up a form
+_FORM_CLASSES = frozenset(
+    {"Entry", "Text", "Spinbox", "Checkbutton", "Radiobutton", "Scale", "Listbox"}
+)
+
+# Widget classes whose focus bindings may change context
+_CONTEXT_CHANGE_CLASSES = frozenset({"Button", "Checkbutton", "Radiobutton"})
+
+# Widget classes that support input validation
+_VALIDATED_INPUT_CLASSES = frozenset({"Entry", "Spinbox"})
+
+# Saturated colors that may be used as the only means of conveying information
+_SIGNAL_COLORS = frozenset(
+    {
+        "red",
+        "#ff0000",
+        "#f00",
+        "green",
+        "#00ff00",
+        "#0f0",
+        "yellow",
+        "#ffff00",
+        "#ff0",
+        "blue",
+        "#0000ff",
+        "#00f",
+    }
+)
+_BRIGHT_RED_COLORS = frozenset({"red", "#ff0000", "#f00"})
+
+# Font family fragments that are harder to read
+_PROBLEMATIC_FONTS = ("times", "serif", "script", "cursive")
+
+
+@lru_cache(maxsize=256)
+def _is_problematic_font(font_family: str) -> bool:
+    """Check whether a font family is likely to be difficult to read
+
+    Applications use only a handful of font families, so the case-folded
+    substring scan is cached per family rather than repeated per widget.
+    """
+    folded = font_family.casefold()
+    return any(prob in folded for prob in _PROBLEMATIC_FONTS)
+
+
+# Options considered deprecated for future compatibility
+_DEPRECATED_OPTIONS = ("bd", "highlightcolor", "selectcolor")
+
+# Button captions that suggest hardcoded, unlocalized text
+_ENGLISH_PATTERNS = frozenset(
+    {"OK", "Cancel", "Yes", "No", "Submit", "Close", "Save", "Open", "Delete"}
+)
+
+
+def _walk_widgets(
+    root: tk.Misc, children_of: Optional[Dict[int, Sequence[tk.Misc]]] = None
+) -> Iterator[Tuple[tk.Misc, str, str, int]]:
+    """Yield (widget, class, path, depth) for a widget tree in depth-first order
+
+    Uses an explicit stack rather than recursion so deep widget hierarchies
+    cannot exhaust the interpreter stack. Widgets that have been destroyed
+    are skipped along with their children. If children_of is given, each
+    widget's child list is recorded in it under id(widget).
+    """
+    stack: List[Tuple[tk.Misc, str, int]] = [(root, "", 0)]
+    while stack:
+        widget, parent_path, depth = stack.pop()
+        try:
+            # Interned so lookups in the class tables compare by identity
+            widget_class = sys.intern(widget.winfo_class())
+        except tk.TclError:
+            continue
+        path = f"{parent_path}/{widget_class}" if parent_path else widget_class
+
+        yield widget, widget_class, path, depth
+
+        try:
+            children = widget.winfo_children()
+        except tk.TclError:
+            continue
+        if children_of is not None:
+            children_of[id(widget)] = children
+        stack.extend((child, path, depth + 1) for child in reversed(children))
+
+
+def _iter_descendants(root: tk.Misc) -> Iterator[tk.Misc]:
+    """Yield root and every widget below it, without querying widget classes"""
+    stack: List[tk.Misc] = [root]
+    while stack:
+        widget = stack.pop()
+        yield widget
+        try:
+            stack.extend(reversed(widget.winfo_children()))
+        except tk.TclError:
+            pass
+
+
+# Automatic fixes, dispatched on IssueKind
+def _fix_small_font(root: tk.Tk, widget: tk.Misc) -> int:
+    """Increase font size to the recommended minimum"""
+    try:
+        current_font = widget.cget("font")
+        if isinstance(current_font, tuple) and len(current_font) >= 2:
+            new_font = (
+                current_font[0],
+                max(12, current_font[1]),
+                *current_font[2:],
+            )
+            widget.configure(font=new_font)
+            return 1
+    except (tk.TclError, AttributeError):
+        pass
+    return 0
+
+
+def _fix_not_focusable(root: tk.Tk, widget: tk.Misc) -> int:
+    """Enable keyboard focus"""
+    try:
+        widget.configure(takefocus=True)
+        return 1
+    except (tk.TclError, AttributeError):
+        return 0
+
+
+def _fix_hard_to_read_font(root: tk.Tk, widget: tk.Misc) -> int:
+    """Change to a readable font family"""
+    try:
+        current_font = widget.cget("font")
+        if isinstance(current_font, tuple):
+            new_font = (
+                "Arial",
+                current_font[1] if len(current_font) > 1 else 12,
+                *current_font[2:],
+            )
+            widget.configure(font=new_font)
+            return 1
+    except (tk.TclError, AttributeError):
+        pass
+    return 0
+
+
+def _fix_empty_container(root: tk.Tk, widget: tk.Misc) -> int:
+    """Remove empty containers"""
+    try:
+        if not widget.winfo_children():
+            widget.destroy()
+            return 1
+    except (tk.TclError, AttributeError):
+        pass
+    return 0
+
+
+def _fix_small_target(root: tk.Tk, widget: tk.Misc) -> int:
+    """Increase widget size for touch targets"""
+    fixed_count = 0
+    try:
+        current_width = widget.cget("width")
+        current_height = widget.cget("height")
+
+        new_width = (
+            max(44, current_width) if isinstance(current_width, int) else current_width
+        )
+        new_height = (
+            max(44, current_height)
+            if isinstance(current_height, int)
+            else current_height
+        )
+
+        if new_width != current_width:
+            widget.configure(width=new_width)
+            fixed_count += 1
+        if new_height != current_height:
+            widget.configure(height=new_height)
+            fixed_count += 1
+    except (tk.TclError, AttributeError):
+        pass
+    return fixed_count
+
+
+def _fix_bright_red_background(root: tk.Tk, widget: tk.Misc) -> int:
+    """Change problematic red background to a darker red"""
+    try:
+        widget.configure(bg="#cc0000")
+        return 1
+    except (tk.TclError, AttributeError):
+        return 0
+
+
+def _fix_invalid_aria_role(root: tk.Tk, widget: tk.Misc) -> int:
+    """Remove invalid ARIA role"""
+    try:
+        if hasattr(widget, "accessible_role"):
+            widget.accessible_role = None
+            return 1
+    except (tk.TclError, AttributeError):
+        pass
+    return 0
+
+
+_FIXERS: Dict[IssueKind, Callable[[tk.Tk, tk.Misc], int]] = {
+    IssueKind.SMALL_FONT: _fix_small_font,
+    IssueKind.NOT_FOCUSABLE: _fix_not_focusable,
+    IssueKind.HARD_TO_READ_FONT: _fix_hard_to_read_font,
+    IssueKind.EMPTY_CONTAINER: _fix_empty_container,
+    IssueKind.SMALL_TARGET: _fix_small_target,
+    IssueKind.BRIGHT_RED_BACKGROUND: _fix_bright_red_background,
+    IssueKind.INVALID_ARIA_ROLE: _fix_invalid_aria_role,
+}
+
+
+def _issue_to_dict(issue: AccessibilityIssue) -> Dict[str, Any]:
+    """Serialize an issue into the plain dict used by reports"""
+    return {
+        "severity": issue.severity.value,
+        "category": issue.category.value,
+        "title": issue.title,
+        "description": issue.description,
+        "widget_class": issue.widget_class,
+        "widget_path": issue.widget_path,
+        "recommendation": issue.recommendation,
+        "wcag_criterion": issue.wcag_criterion,
+        "auto_fixable": issue.auto_fixable,
+    }
 
 
 class AccessibilityValidator:
@@ -68,80 +390,134 @@ class AccessibilityValidator:
     def __init__(self, compliance_level: ValidationLevel = ValidationLevel.AA):
         self.compliance_level = compliance_level
         self.issues: List[AccessibilityIssue] = []
-        self.validated_widgets: Set[tk.Misc] = set()
+        # Keyed by id(); widgets outlive the validation pass that records them
+        self.validated_widgets: Set[int] = set()
+        self._widget_nodes: Optional[List[Tuple[tk.Misc, str, str, int]]] = None
+        # Child lists read during the walk, keyed by id() for the same pass
+        self._children_of: Dict[int, Sequence[tk.Misc]] = {}
+        # (kind, id(widget)) pairs already reported by an earlier validator
+        self._seen: Set[Tuple[IssueKind, int]] = set()
 
     def validate_application(self, root: tk.Tk) -> List[AccessibilityIssue]:
         """Validate entire application for accessibility compliance"""
         self.issues.clear()
-        self.validated_widgets.clear()
-
-        # Validate all four WCAG principles
-        self._validate_perceivable(root)
-        self._validate_operable(root)
-        self._validate_understandable(root)
-        self._validate_robust(root)
-
-        # Additional comprehensive validations
-        self._validate_widget_hierarchy(root)
-        self._validate_error_handling(root)
-        self._validate_responsive_design(root)
-        self._validate_internationalization(root)
-
+        self.issues.extend(self.iter_issues(root))
         return self.issues.copy()
 
-    def _validate_perceivable(self, root: tk.Tk) -> None:
+    def iter_issues(self, root: tk.Tk) -> Iterator[AccessibilityIssue]:
+        """Validate an application, yielding issues as they are found
+
+        Unlike validate_application, issues are not stored on the validator,
+        so callers can aggregate or stop early without holding every issue.
+        """
+        # Read the widget tree once and share it between all validators
+        children_of: Dict[int, Sequence[tk.Misc]] = {}
+        nodes = list(_walk_widgets(root, children_of))
+        yield from self._iter_snapshot_issues(root, nodes, children_of)
+
+    def _iter_snapshot_issues(
+        self,
+        root: tk.Tk,
+        nodes: List[Tuple[tk.Misc, str, str, int]],
+        children_of: Dict[int, Sequence[tk.Misc]],
+    ) -> Iterator[AccessibilityIssue]:
+        """Validate an application from an existing walk of its widget tree"""
+        self.validated_widgets.clear()
+        self._seen.clear()
+
+        self._widget_nodes = nodes
+        self._children_of = children_of
+        try:
+            # Validate all four WCAG principles
+            yield from self._validate_perceivable(root)
+            yield from self._validate_operable(root)
+            yield from self._validate_understandable(root)
+            yield from self._validate_robust(root)
+
+            # Additional comprehensive validations
+            yield from self._unique(self._validate_widget_hierarchy(root))
+            yield from self._unique(self._validate_error_handling(root))
+            yield from self._unique(self._validate_responsive_design(root))
+            yield from self._unique(self._validate_internationalization(root))
+        finally:
+            self._widget_nodes = None
+            self._children_of = {}
+
+    def _unique(
+        self, issues: Iterator[AccessibilityIssue]
+    ) -> Iterator[AccessibilityIssue]:
+        """Drop issues another validator already reported for the same widget
+
+        Repeats within one validator are kept, as they describe different
+        problems of the same kind (e.g. target width and height).
+        """
+        emitted: Set[Tuple[IssueKind, int]] = set()
+        for issue in issues:
+            key = (issue.kind, id(issue.widget))
+            if key in self._seen:
+                continue
+            emitted.add(key)
+            yield issue
+        self._seen |= emitted
+
+    def _requires(self, level: ValidationLevel) -> bool:
+        """Check whether the configured compliance level includes level"""
+        return _LEVEL_RANK[self.compliance_level] >= _LEVEL_RANK[level]
+
+    def _iter_widgets(self, root: tk.Misc) -> Iterable[Tuple[tk.Misc, str, str, int]]:
+        """Return the widget tree snapshot for this pass, or walk root directly"""
+        if self._widget_nodes is not None:
+            return self._widget_nodes
+        return _walk_widgets(root)
+
+    def _winfo_children(self, widget: tk.Misc) -> Sequence[tk.Misc]:
+        """Return widget's children, reusing the list read during the walk"""
+        children = self._children_of.get(id(widget))
+        if children is None:
+            return widget.winfo_children()
+        return children
+
+    def _validate_perceivable(self, root: tk.Tk) -> Iterator[AccessibilityIssue]:
         """Validate Perceivable principle (WCAG 1.x)"""
-        self._validate_text_alternatives(root)
-        self._validate_color_contrast(root)
-        self._validate_text_sizing(root)
-        self._validate_audio_content(root)
-        self._validate_color_usage(root)
+        yield from self._unique(self._validate_text_alternatives(root))
+        yield from self._unique(self._validate_color_contrast(root))
+        yield from self._unique(self._validate_text_sizing(root))
+        yield from self._unique(self._validate_audio_content(root))
+        yield from self._unique(self._validate_color_usage(root))
 
-    def _validate_operable(self, root: tk.Tk) -> None:
+    def _validate_operable(self, root: tk.Tk) -> Iterator[AccessibilityIssue]:
         """Validate Operable principle (WCAG 2.x)"""
-        self._validate_keyboard_accessibility(root)
-        self._validate_focus_management(root)
-        self._validate_timing_requirements(root)
-        self._validate_seizure_safety(root)
-        self._validate_form_structure(root)
+        yield from self._unique(self._validate_keyboard_accessibility(root))
+        yield from self._unique(self._validate_focus_management(root))
+        yield from self._unique(self._validate_timing_requirements(root))
+        yield from self._unique(self._validate_seizure_safety(root))
+        yield from self._unique(self._validate_form_structure(root))
 
-    def _validate_understandable(self, root: tk.Tk) -> None:
+    def _validate_understandable(self, root: tk.Tk) -> Iterator[AccessibilityIssue]:
         """Validate Understandable principle (WCAG 3.x)"""
-        self._validate_readable_content(root)
-        self._validate_predictable_functionality(root)
-        self._validate_input_assistance(root)
+        yield from self._unique(self._validate_readable_content(root))
+        yield from self._unique(self._validate_predictable_functionality(root))
+        yield from self._unique(self._validate_input_assistance(root))
 
-    def _validate_robust(self, root: tk.Tk) -> None:
+    def _validate_robust(self, root: tk.Tk) -> Iterator[AccessibilityIssue]:
         """Validate Robust principle (WCAG 4.x)"""
-        self._validate_markup_compatibility(root)
-        self._validate_assistive_technology_support(root)
-        self._validate_future_compatibility(root)
+        yield from self._unique(self._validate_markup_compatibility(root))
+        yield from self._unique(self._validate_assistive_technology_support(root))
+        yield from self._unique(self._validate_future_compatibility(root))
 
     # Perceivable validations
-    def _validate_text_alternatives(self, root: tk.Tk) -> None:
+    def _validate_text_alternatives(self, root: tk.Tk) -> Iterator[AccessibilityIssue]:
         """Validate text alternatives for non-text content (WCAG 1.1.1)"""
 
-        def check_widget(widget: tk.Misc, path: str = "") -> None:
-            if widget in self.validated_widgets:
-                return
-            self.validated_widgets.add(widget)
-
-            widget_class = widget.winfo_class()
-            current_path = f"{path}/{widget_class}" if path else widget_class
+        for widget, widget_class, current_path, _ in self._iter_widgets(root):
+            widget_id = id(widget)
+            if widget_id in self.validated_widgets:
+                continue
+            self.validated_widgets.add(widget_id)
 
             # Check for widgets that need text alternatives
-            needs_alt_text = widget_class in [
-                "Button",
-                "Canvas",
-                "Label",
-                "Checkbutton",
-                "Radiobutton",
-            ]
-
-            if needs_alt_text:
-                has_accessible_name = (
-                    hasattr(widget, "accessible_name") and widget.accessible_name
-                )
+            if widget_class in _ALT_TEXT_CLASSES:
+                has_accessible_name = getattr(widget, "accessible_name", None)
                 has_text = False
 
                 try:
@@ -151,48 +527,40 @@ class AccessibilityValidator:
                     pass
 
                 if not has_accessible_name and not has_text:
-                    if widget_class == "Button":
-                        severity = IssueSeverity.CRITICAL
-                    elif widget_class in ["Checkbutton", "Radiobutton"]:
-                        severity = IssueSeverity.HIGH
-                    else:
-                        severity = IssueSeverity.MEDIUM
-
-                    self.issues.append(
-                        AccessibilityIssue(
-                            severity=severity,
-                            category=ValidationCategory.PERCEIVABLE,
-                            title="Missing text alternative",
-                            description=f"{widget_class} widget lacks accessible name "
-                            f"or text",
-                            widget=widget,
-                            widget_class=widget_class,
-                            widget_path=current_path,
-                            recommendation="Add accessible_name parameter or text "
-                            "attribute",
-                            wcag_criterion="1.1.1 Non-text Content",
-                            auto_fixable=False,
-                        )
+                    yield AccessibilityIssue(
+                        severity=_ALT_TEXT_SEVERITY.get(
+                            widget_class, IssueSeverity.MEDIUM
+                        ),
+                        category=ValidationCategory.PERCEIVABLE,
+                        title="Missing text alternative",
+                        description=f"{widget_class} widget lacks accessible name "
+                        f"or text",
+                        widget=widget,
+                        widget_class=widget_class,
+                        widget_path=current_path,
+                        recommendation="Add accessible_name parameter or text "
+                        "attribute",
+                        wcag_criterion="1.1.1 Non-text Content",
+                        auto_fixable=False,
+                        kind=IssueKind.MISSING_ALT_TEXT,
                     )
 
-            # Check children
-            try:
-                for child in widget.winfo_children():
-                    check_widget(child, current_path)
-            except tk.TclError:
-                pass
-
-        check_widget(root)
-
-    def _validate_color_contrast(self, root: tk.Tk) -> None:
+    def _validate_color_contrast(self, root: tk.Tk) -> Iterator[AccessibilityIssue]:
         """Validate color contrast ratios (WCAG 1.4.3, 1.4.6)"""
+        if not self._requires(ValidationLevel.AA):
+            return
 
-        def check_widget(widget: tk.Misc, path: str = "") -> None:
-            if widget in self.validated_widgets:
-                return
+        # Determine required ratio based on compliance level
+        if self.compliance_level == ValidationLevel.AAA:
+            required_ratio = 7.0
+            criterion = "1.4.6 Contrast (Enhanced)"
+        else:
+            required_ratio = 4.5
+            criterion = "1.4.3 Contrast (Minimum)"
 
-            widget_class = widget.winfo_class()
-            current_path = f"{path}/{widget_class}" if path else widget_class
+        for widget, widget_class, current_path, _ in self._iter_widgets(root):
+            if id(widget) in self.validated_widgets:
+                continue
 
             try:
                 fg_color = widget.cget("fg") or widget.cget("foreground")
@@ -201,14 +569,6 @@ class AccessibilityValidator:
                 if fg_color and bg_color:
                     contrast_ratio = calculate_contrast_ratio(fg_color, bg_color)
 
-                    # Determine required ratio based on compliance level
-                    if self.compliance_level == ValidationLevel.AAA:
-                        required_ratio = 7.0
-                        criterion = "1.4.6 Contrast (Enhanced)"
-                    else:
-                        required_ratio = 4.5
-                        criterion = "1.4.3 Contrast (Minimum)"
-
                     if contrast_ratio < required_ratio:
                         severity = (
                             IssueSeverity.HIGH
@@ -216,478 +576,326 @@ class AccessibilityValidator:
                             else IssueSeverity.MEDIUM
                         )
 
-                        self.issues.append(
-                            AccessibilityIssue(
-                                severity=severity,
-                                category=ValidationCategory.PERCEIVABLE,
-                                title="Insufficient color contrast",
-                                description=f"Contrast ratio {contrast_ratio:.2f} is "
-                                f"below required {required_ratio}",
-                                widget=widget,
-                                widget_class=widget_class,
-                                widget_path=current_path,
-                                recommendation=f"Adjust colors to achieve "
-                                f"{required_ratio}:1 contrast ratio",
-                                wcag_criterion=criterion,
-                                auto_fixable=True,
-                            )
+                        yield AccessibilityIssue(
+                            severity=severity,
+                            category=ValidationCategory.PERCEIVABLE,
+                            title="Insufficient color contrast",
+                            description=f"Contrast ratio {contrast_ratio:.2f} is "
+                            f"below required {required_ratio}",
+                            widget=widget,
+                            widget_class=widget_class,
+                            widget_path=current_path,
+                            recommendation=f"Adjust colors to achieve "
+                            f"{required_ratio}:1 contrast ratio",
+                            wcag_criterion=criterion,
+                            auto_fixable=True,
+                            kind=IssueKind.LOW_CONTRAST,
                         )
 
             except (tk.TclError, AttributeError):
                 pass
 
-            # Check children
-            try:
-                for child in widget.winfo_children():
-                    check_widget(child, current_path)
-            except tk.TclError:
-                pass
-
-        check_widget(root)
-
-    def _validate_text_sizing(self, root: tk.Tk) -> None:
+    def _validate_text_sizing(self, root: tk.Tk) -> Iterator[AccessibilityIssue]:
         """Validate text can be resized (WCAG 1.4.4)"""
+        if not self._requires(ValidationLevel.AA):
+            return
 
-        def check_widget(widget: tk.Misc, path: str = "") -> None:
-            widget_class = widget.winfo_class()
-            current_path = f"{path}/{widget_class}" if path else widget_class
-
+        for widget, widget_class, current_path, _ in self._iter_widgets(root):
             try:
                 font = widget.cget("font")
                 if font:
                     if isinstance(font, tuple) and len(font) >= 2:
                         size = font[1]
                         if isinstance(size, int) and size < 12:
-                            self.issues.append(
-                                AccessibilityIssue(
-                                    severity=IssueSeverity.MEDIUM,
-                                    category=ValidationCategory.PERCEIVABLE,
-                                    title="Font size too small",
-                                    description=f"Font size {size}pt is below "
-                                    f"recommended minimum of 12pt",
-                                    widget=widget,
-                                    widget_class=widget_class,
-                                    widget_path=current_path,
-                                    recommendation="Use font size of at least 12pt",
-                                    wcag_criterion="1.4.4 Resize text",
-                                    auto_fixable=True,
-                                )
+                            yield AccessibilityIssue(
+                                severity=IssueSeverity.MEDIUM,
+                                category=ValidationCategory.PERCEIVABLE,
+                                title="Font size too small",
+                                description=f"Font size {size}pt is below "
+                                f"recommended minimum of 12pt",
+                                widget=widget,
+                                widget_class=widget_class,
+                                widget_path=current_path,
+                                recommendation="Use font size of at least 12pt",
+                                wcag_criterion="1.4.4 Resize text",
+                                auto_fixable=True,
+                                kind=IssueKind.SMALL_FONT,
                             )
             except (tk.TclError, AttributeError):
                 pass
 
-            # Check children
-            try:
-                for child in widget.winfo_children():
-                    check_widget(child, current_path)
-            except tk.TclError:
-                pass
-
-        check_widget(root)
-
-    def _validate_audio_content(self, root: tk.Tk) -> None:
+    def _validate_audio_content(self, root: tk.Tk) -> Iterator[AccessibilityIssue]:
         """Validate audio content accessibility (WCAG 1.2.x)"""
 
-        def check_widget(widget: tk.Misc, path: str = "") -> None:
-            widget_class = widget.winfo_class()
-            current_path = f"{path}/{widget_class}" if path else widget_class
-
+        for widget, widget_class, current_path, _ in self._iter_widgets(root):
             # Check for audio-related widgets or attributes
             if hasattr(widget, "audio_manager") or hasattr(widget, "tts_enabled"):
                 # Check if audio has text alternatives
-                if not (
-                    hasattr(widget, "accessible_description")
-                    and widget.accessible_description
-                ):
-                    self.issues.append(
-                        AccessibilityIssue(
-                            severity=IssueSeverity.HIGH,
-                            category=ValidationCategory.PERCEIVABLE,
-                            title="Audio content lacks text alternative",
-                            description=f"{widget_class} with audio lacks description",
-                            widget=widget,
-                            widget_class=widget_class,
-                            widget_path=current_path,
-                            recommendation="Provide text description for audio "
-                            "content",
-                            wcag_criterion="1.2.1 Audio-only and Video-only",
-                            auto_fixable=False,
-                        )
-                    )
-
-            # Check for Canvas widgets that might contain multimedia
-            if widget_class == "Canvas":
-                self.issues.append(
-                    AccessibilityIssue(
-                        severity=IssueSeverity.INFO,
+                if not getattr(widget, "accessible_description", None):
+                    yield AccessibilityIssue(
+                        severity=IssueSeverity.HIGH,
                         category=ValidationCategory.PERCEIVABLE,
-                        title="Canvas may contain multimedia content",
-                        description="Canvas widgets should be checked for audio/video",
+                        title="Audio content lacks text alternative",
+                        description=f"{widget_class} with audio lacks description",
                         widget=widget,
                         widget_class=widget_class,
                         widget_path=current_path,
-                        recommendation="Ensure any multimedia has text alternatives",
+                        recommendation="Provide text description for audio content",
                         wcag_criterion="1.2.1 Audio-only and Video-only",
                         auto_fixable=False,
+                        kind=IssueKind.MISSING_AUDIO_DESCRIPTION,
                     )
-                )
-
-            # Check children
-            try:
-                for child in widget.winfo_children():
-                    check_widget(child, current_path)
-            except tk.TclError:
-                pass
 
-        check_widget(root)
+            # Check for Canvas widgets that might contain multimedia
+            if widget_class == "Canvas":
+                yield AccessibilityIssue(
+                    severity=IssueSeverity.INFO,
+                    category=ValidationCategory.PERCEIVABLE,
+                    title="Canvas may contain multimedia content",
+                    description="Canvas widgets should be checked for audio/video",
+                    widget=widget,
+                    widget_class=widget_class,
+                    widget_path=current_path,
+                    recommendation="Ensure any multimedia has text alternatives",
+                    wcag_criterion="1.2.1 Audio-only and Video-only",
+                    auto_fixable=False,
+                    kind=IssueKind.CANVAS_MULTIMEDIA,
+                )
 
-    def _validate_color_usage(self, root: tk.Tk) -> None:
+    def _validate_color_usage(self, root: tk.Tk) -> Iterator[AccessibilityIssue]:
         """Validate that color is not the only means of conveying information"""
 
-        def check_widget(widget: tk.Misc, path: str = "") -> None:
-            widget_class = widget.winfo_class()
-            current_path = f"{path}/{widget_class}" if path else widget_class
-
+        for widget, widget_class, current_path, _ in self._iter_widgets(root):
             # Check for widgets that might rely solely on color
-            if widget_class in ["Button", "Label"]:
+            if widget_class in ("Button", "Label"):
                 try:
                     bg_color = widget.cget("bg") or widget.cget("background")
                     text = widget.cget("text")
 
                     # Check for color-coded buttons without text
-                    if bg_color and bg_color.lower() in [
-                        "red",
-                        "#ff0000",
-                        "#f00",
-                        "green",
-                        "#00ff00",
-                        "#0f0",
-                        "yellow",
-                        "#ffff00",
-                        "#ff0",
-                        "blue",
-                        "#0000ff",
-                        "#00f",
-                    ]:
+                    if bg_color and bg_color.lower() in _SIGNAL_COLORS:
                         if not text or len(text.strip()) < 2:
-                            self.issues.append(
-                                AccessibilityIssue(
-                                    severity=IssueSeverity.HIGH,
-                                    category=ValidationCategory.PERCEIVABLE,
-                                    title="Color used as only means of information",
-                                    description=f"{widget_class} relies on color "
-                                    f"without text alternative",
-                                    widget=widget,
-                                    widget_class=widget_class,
-                                    widget_path=current_path,
-                                    recommendation="Add text labels or icons to "
-                                    "supplement color coding",
-                                    wcag_criterion="1.4.1 Use of Color",
-                                    auto_fixable=False,
-                                )
+                            yield AccessibilityIssue(
+                                severity=IssueSeverity.HIGH,
+                                category=ValidationCategory.PERCEIVABLE,
+                                title="Color used as only means of information",
+                                description=f"{widget_class} relies on color "
+                                f"without text alternative",
+                                widget=widget,
+                                widget_class=widget_class,
+                                widget_path=current_path,
+                                recommendation="Add text labels or icons to "
+                                "supplement color coding",
+                                wcag_criterion="1.4.1 Use of Color",
+                                auto_fixable=False,
+                                kind=IssueKind.COLOR_ONLY,
                             )
                 except tk.TclError:
                     pass
 
-            # Check children
-            try:
-                for child in widget.winfo_children():
-                    check_widget(child, current_path)
-            except tk.TclError:
-                pass
-
-        check_widget(root)
-
     # Operable validations
-    def _validate_keyboard_accessibility(self, root: tk.Tk) -> None:
+    def _validate_keyboard_accessibility(
+        self, root: tk.Tk
+    ) -> Iterator[AccessibilityIssue]:
         """Validate keyboard accessibility (WCAG 2.1.1, 2.1.2)"""
 
-        def check_widget(widget: tk.Misc, path: str = "") -> None:
-            widget_class = widget.winfo_class()
-            current_path = f"{path}/{widget_class}" if path else widget_class
-
+        for widget, widget_class, current_path, _ in self._iter_widgets(root):
             # Check if interactive widget can receive focus
-            interactive_widgets = [
-                "Button",
-                "Entry",
-                "Text",
-                "Checkbutton",
-                "Radiobutton",
-                "Scale",
-                "Listbox",
-                "Scrollbar",
-                "Spinbox",
-            ]
-
-            if widget_class in interactive_widgets:
+            if widget_class in _INTERACTIVE_CLASSES:
                 try:
                     takefocus = widget.cget("takefocus")
                     if takefocus == 0:
-                        self.issues.append(
-                            AccessibilityIssue(
-                                severity=IssueSeverity.HIGH,
-                                category=ValidationCategory.OPERABLE,
-                                title="Interactive widget not keyboard accessible",
-                                description=f"{widget_class} cannot receive "
-                                f"keyboard focus",
-                                widget=widget,
-                                widget_class=widget_class,
-                                widget_path=current_path,
-                                recommendation="Set takefocus=True or remove "
-                                "takefocus=0",
-                                wcag_criterion="2.1.1 Keyboard",
-                                auto_fixable=True,
-                            )
-                        )
-                except tk.TclError:
-                    pass
-
-                # Validate keyboard navigation
-                nav_errors = validate_keyboard_navigation(widget)
-                for error in nav_errors:
-                    self.issues.append(
-                        AccessibilityIssue(
-                            severity=IssueSeverity.MEDIUM,
+                        yield AccessibilityIssue(
+                            severity=IssueSeverity.HIGH,
                             category=ValidationCategory.OPERABLE,
-                            title="Keyboard navigation issue",
-                            description=error,
+                            title="Interactive widget not keyboard accessible",
+                            description=f"{widget_class} cannot receive "
+                            f"keyboard focus",
                             widget=widget,
                             widget_class=widget_class,
                             widget_path=current_path,
-                            recommendation="Add appropriate keyboard event bindings",
+                            recommendation="Set takefocus=True or remove "
+                            "takefocus=0",
                             wcag_criterion="2.1.1 Keyboard",
-                            auto_fixable=False,
+                            auto_fixable=True,
+                            kind=IssueKind.NOT_FOCUSABLE,
                         )
-                    )
-
-            # Check children
-            try:
-                for child in widget.winfo_children():
-                    check_widget(child, current_path)
-            except tk.TclError:
-                pass
+                except tk.TclError:
+                    pass
 
-        check_widget(root)
+                # Validate keyboard navigation
+                nav_errors = validate_keyboard_navigation(widget, widget_class)
+                for error in nav_errors:
+                    yield AccessibilityIssue(
+                        severity=IssueSeverity.MEDIUM,
+                        category=ValidationCategory.OPERABLE,
+                        title="Keyboard navigation issue",
+                        description=error,
+                        widget=widget,
+                        widget_class=widget_class,
+                        widget_path=current_path,
+                        recommendation="Add appropriate keyboard event bindings",
+                        wcag_criterion="2.1.1 Keyboard",
+                        auto_fixable=False,
+                        kind=IssueKind.KEYBOARD_NAVIGATION,
+                    )
 
-    def _validate_focus_management(self, root: tk.Tk) -> None:
+    def _validate_focus_management(self, root: tk.Tk) -> Iterator[AccessibilityIssue]:
         """Validate focus management (WCAG 2.4.3, 2.4.7)"""
-        # Check for focus traps and logical focus order
-        focusable_widgets = []
+        # Check for focus traps and logical focus order. The vertical position
+        # is read once per widget while collecting, so the comparison below
+        # needs no further Tk calls.
+        focusable_widgets: List[Tuple[tk.Misc, int, str]] = []
 
-        def collect_focusable(widget: tk.Misc) -> None:
+        for widget, widget_class, _, _ in self._iter_widgets(root):
             try:
                 takefocus = widget.cget("takefocus")
                 if takefocus != 0:
-                    focusable_widgets.append(widget)
+                    focusable_widgets.append((widget, widget.winfo_y(), widget_class))
             except tk.TclError:
                 pass
 
-            try:
-                for child in widget.winfo_children():
-                    collect_focusable(child)
-            except tk.TclError:
-                pass
-
-        collect_focusable(root)
-
-        # Check if focus order is logical (simplified check)
-        if len(focusable_widgets) > 1:
-            # Check if widgets have logical tab order
-            for i, widget in enumerate(focusable_widgets[:-1]):
-                next_widget = focusable_widgets[i + 1]
-
-                try:
-                    widget_y = widget.winfo_y()
-                    next_y = next_widget.winfo_y()
-
-                    # If next widget is significantly above current widget,
-                    # focus order might be illogical
-                    if next_y < widget_y - 50:  # 50 pixel threshold
-                        self.issues.append(
-                            AccessibilityIssue(
-                                severity=IssueSeverity.LOW,
-                                category=ValidationCategory.OPERABLE,
-                                title="Potentially illogical focus order",
-                                description="Focus order may not follow visual layout",
-                                widget=widget,
-                                widget_class=widget.winfo_class(),
-                                widget_path="",
-                                recommendation="Review and adjust tab order",
-                                wcag_criterion="2.4.3 Focus Order",
-                                auto_fixable=False,
-                            )
-                        )
-                        break
-
-                except tk.TclError:
-                    pass
+        # Check if widgets have logical tab order (simplified check)
+        for (widget, widget_y, widget_class), (_, next_y, _) in zip(
+            focusable_widgets, focusable_widgets[1:]
+        ):
+            # If next widget is significantly above current widget,
+            # focus order might be illogical
+            if next_y < widget_y - 50:  # 50 pixel threshold
+                yield AccessibilityIssue(
+                    severity=IssueSeverity.LOW,
+                    category=ValidationCategory.OPERABLE,
+                    title="Potentially illogical focus order",
+                    description="Focus order may not follow visual layout",
+                    widget=widget,
+                    widget_class=widget_class,
+                    widget_path="",
+                    recommendation="Review and adjust tab order",
+                    wcag_criterion="2.4.3 Focus Order",
+                    auto_fixable=False,
+                    kind=IssueKind.FOCUS_ORDER,
+                )
+                break
 
-    def _validate_timing_requirements(self, root: tk.Tk) -> None:
+    def _validate_timing_requirements(
+        self, root: tk.Tk
+    ) -> Iterator[AccessibilityIssue]:
         """Validate timing requirements (WCAG 2.2.1, 2.2.2)"""
 
         # Check for widgets with after() calls that might create time limits
-        def check_widget(widget: tk.Misc, path: str = "") -> None:
-            widget_class = widget.winfo_class()
-            current_path = f"{path}/{widget_class}" if path else widget_class
-
+        for widget, widget_class, current_path, _ in self._iter_widgets(root):
             # Check if widget has timing-related attributes or methods
             if hasattr(widget, "_after_ids") or hasattr(widget, "after_idle"):
                 # This is a basic check - in practice, you'd need to analyze
                 # the actual timing behavior
-                self.issues.append(
-                    AccessibilityIssue(
-                        severity=IssueSeverity.INFO,
-                        category=ValidationCategory.OPERABLE,
-                        title="Widget may have timing constraints",
-                        description=f"{widget_class} may implement timing behavior",
-                        widget=widget,
-                        widget_class=widget_class,
-                        widget_path=current_path,
-                        recommendation="Ensure timing can be extended or disabled",
-                        wcag_criterion="2.2.1 Timing Adjustable",
-                        auto_fixable=False,
-                    )
+                yield AccessibilityIssue(
+                    severity=IssueSeverity.INFO,
+                    category=ValidationCategory.OPERABLE,
+                    title="Widget may have timing constraints",
+                    description=f"{widget_class} may implement timing behavior",
+                    widget=widget,
+                    widget_class=widget_class,
+                    widget_path=current_path,
+                    recommendation="Ensure timing can be extended or disabled",
+                    wcag_criterion="2.2.1 Timing Adjustable",
+                    auto_fixable=False,
+                    kind=IssueKind.TIMING_CONSTRAINT,
                 )
 
-            # Check children
-            try:
-                for child in widget.winfo_children():
-                    check_widget(child, current_path)
-            except tk.TclError:
-                pass
-
-        check_widget(root)
-
-    def _validate_seizure_safety(self, root: tk.Tk) -> None:
+    def _validate_seizure_safety(self, root: tk.Tk) -> Iterator[AccessibilityIssue]:
         """Validate seizure and vestibular disorder safety (WCAG 2.3.1)"""
 
         # Check for potentially problematic visual effects
-        def check_widget(widget: tk.Misc, path: str = "") -> None:
-            widget_class = widget.winfo_class()
-            current_path = f"{path}/{widget_class}" if path else widget_class
-
+        for widget, widget_class, current_path, _ in self._iter_widgets(root):
             # Check for Canvas widgets that might contain animations
             if widget_class == "Canvas":
-                self.issues.append(
-                    AccessibilityIssue(
-                        severity=IssueSeverity.INFO,
-                        category=ValidationCategory.OPERABLE,
-                        title="Canvas may contain flashing content",
-                        description="Canvas widgets should be checked for flashing "
-                        "or rapidly changing content",
-                        widget=widget,
-                        widget_class=widget_class,
-                        widget_path=current_path,
-                        recommendation="Ensure no content flashes more than 3 times "
-                        "per second",
-                        wcag_criterion="2.3.1 Three Flashes or Below Threshold",
-                        auto_fixable=False,
-                    )
+                yield AccessibilityIssue(
+                    severity=IssueSeverity.INFO,
+                    category=ValidationCategory.OPERABLE,
+                    title="Canvas may contain flashing content",
+                    description="Canvas widgets should be checked for flashing "
+                    "or rapidly changing content",
+                    widget=widget,
+                    widget_class=widget_class,
+                    widget_path=current_path,
+                    recommendation="Ensure no content flashes more than 3 times "
+                    "per second",
+                    wcag_criterion="2.3.1 Three Flashes or Below Threshold",
+                    auto_fixable=False,
+                    kind=IssueKind.CANVAS_FLASHING,
                 )
 
             # Check for widgets with background color changes
             try:
                 bg_color = widget.cget("bg") or widget.cget("background")
-                if bg_color and bg_color.lower() in ["red", "#ff0000", "#f00"]:
-                    self.issues.append(
-                        AccessibilityIssue(
-                            severity=IssueSeverity.LOW,
-                            category=ValidationCategory.OPERABLE,
-                            title="Bright red background may be problematic",
-                            description="Bright red backgrounds can be problematic "
-                            "for some users",
-                            widget=widget,
-                            widget_class=widget_class,
-                            widget_path=current_path,
-                            recommendation="Consider using less intense colors",
-                            wcag_criterion="2.3.1 Three Flashes or Below Threshold",
-                            auto_fixable=True,
-                        )
+                if bg_color and bg_color.lower() in _BRIGHT_RED_COLORS:
+                    yield AccessibilityIssue(
+                        severity=IssueSeverity.LOW,
+                        category=ValidationCategory.OPERABLE,
+                        title="Bright red background may be problematic",
+                        description="Bright red backgrounds can be problematic "
+                        "for some users",
+                        widget=widget,
+                        widget_class=widget_class,
+                        widget_path=current_path,
+                        recommendation="Consider using less intense colors",
+                        wcag_criterion="2.3.1 Three Flashes or Below Threshold",
+                        auto_fixable=True,
+                        kind=IssueKind.BRIGHT_RED_BACKGROUND,
                     )
             except tk.TclError:
                 pass
 
-            # Check children
-            try:
-                for child in widget.winfo_children():
-                    check_widget(child, current_path)
-            except tk.TclError:
-                pass
-
-        check_widget(root)
-
-    def _validate_form_structure(self, root: tk.Tk) -> None:
+    def _validate_form_structure(self, root: tk.Tk) -> Iterator[AccessibilityIssue]:
         """Validate form structure and grouping (WCAG 2.4.6, 3.3.2)"""
-        form_widgets = []
+        form_widgets: List[Tuple[tk.Misc, str, str]] = []
 
-        def collect_form_widgets(widget: tk.Misc, path: str = "") -> None:
-            widget_class = widget.winfo_class()
-            current_path = f"{path}/{widget_class}" if path else widget_class
-
-            if widget_class in [
-                "Entry",
-                "Text",
-                "Spinbox",
-                "Checkbutton",
-                "Radiobutton",
-                "Scale",
-                "Listbox",
-            ]:
+        for widget, widget_class, current_path, _ in self._iter_widgets(root):
+            if widget_class in _FORM_CLASSES:
                 form_widgets.append((widget, widget_class, current_path))
 
-            # Check children
-            try:
-                for child in widget.winfo_children():
-                    collect_form_widgets(child, current_path)
-            except tk.TclError:
-                pass
-
-        collect_form_widgets(root)
-
         # Validate each form widget
         for widget, widget_class, path in form_widgets:
             # Check for proper labeling
-            has_label = hasattr(widget, "accessible_name") and widget.accessible_name
+            has_label = getattr(widget, "accessible_name", None)
 
             if not has_label:
                 # Look for nearby Label widgets
                 nearby_label = self._find_nearby_label(widget)
                 if not nearby_label:
-                    self.issues.append(
-                        AccessibilityIssue(
-                            severity=IssueSeverity.HIGH,
-                            category=ValidationCategory.OPERABLE,
-                            title="Form control lacks proper label",
-                            description=f"{widget_class} has no associated label",
-                            widget=widget,
-                            widget_class=widget_class,
-                            widget_path=path,
-                            recommendation="Add accessible_name or associate "
-                            "with Label widget",
-                            wcag_criterion="2.4.6 Headings and Labels",
-                            auto_fixable=False,
-                        )
+                    yield AccessibilityIssue(
+                        severity=IssueSeverity.HIGH,
+                        category=ValidationCategory.OPERABLE,
+                        title="Form control lacks proper label",
+                        description=f"{widget_class} has no associated label",
+                        widget=widget,
+                        widget_class=widget_class,
+                        widget_path=path,
+                        recommendation="Add accessible_name or associate "
+                        "with Label widget",
+                        wcag_criterion="2.4.6 Headings and Labels",
+                        auto_fixable=False,
+                        kind=IssueKind.MISSING_LABEL,
                     )
 
             # Check for required field indicators
-            if widget_class in ["Entry", "Text", "Spinbox"]:
+            if widget_class in _INPUT_CLASSES:
                 # This is a basic check - in practice, you'd check for
                 # visual indicators or validation rules
-                if not hasattr(widget, "required") or not widget.required:
-                    self.issues.append(
-                        AccessibilityIssue(
-                            severity=IssueSeverity.INFO,
-                            category=ValidationCategory.OPERABLE,
-                            title="Form field may need required indicator",
-                            description=f"{widget_class} should indicate if required",
-                            widget=widget,
-                            widget_class=widget_class,
-                            widget_path=path,
-                            recommendation="Add visual and programmatic "
-                            "required indicators",
-                            wcag_criterion="3.3.2 Labels or Instructions",
-                            auto_fixable=False,
-                        )
+                if not getattr(widget, "required", None):
+                    yield AccessibilityIssue(
+                        severity=IssueSeverity.INFO,
+                        category=ValidationCategory.OPERABLE,
+                        title="Form field may need required indicator",
+                        description=f"{widget_class} should indicate if required",
+                        widget=widget,
+                        widget_class=widget_class,
+                        widget_path=path,
+                        recommendation="Add visual and programmatic "
+                        "required indicators",
+                        wcag_criterion="3.3.2 Labels or Instructions",
+                        auto_fixable=False,
+                        kind=IssueKind.MISSING_REQUIRED_INDICATOR,
                     )
 
     def _find_nearby_label(self, widget: tk.Misc) -> bool:
@@ -696,7 +904,7 @@ class AccessibilityValidator:
             parent = widget.winfo_parent()
             if parent:
                 parent_widget = widget.nametowidget(parent)
-                for sibling in parent_widget.winfo_children():
+                for sibling in self._winfo_children(parent_widget):
                     if sibling.winfo_class() == "Label":
                         return True
         except tk.TclError:
@@ -704,59 +912,42 @@ class AccessibilityValidator:
         return False
 
     # Understandable validations
-    def _validate_readable_content(self, root: tk.Tk) -> None:
+    def _validate_readable_content(self, root: tk.Tk) -> Iterator[AccessibilityIssue]:
         """Validate readable and understandable content (WCAG 3.1.x)"""
 
-        def check_widget(widget: tk.Misc, path: str = "") -> None:
-            widget_class = widget.winfo_class()
-            current_path = f"{path}/{widget_class}" if path else widget_class
-
+        for widget, widget_class, current_path, _ in self._iter_widgets(root):
             # Check for problematic fonts
             try:
                 font = widget.cget("font")
-                if font and isinstance(font, tuple) and len(font) > 0:
-                    font_family = font[0].lower()
-                    problematic_fonts = ["times", "serif", "script", "cursive"]
-
-                    if any(prob in font_family for prob in problematic_fonts):
-                        self.issues.append(
-                            AccessibilityIssue(
-                                severity=IssueSeverity.LOW,
-                                category=ValidationCategory.UNDERSTANDABLE,
-                                title="Potentially difficult to read font",
-                                description=f"Font family '{font[0]}' may be "
-                                f"difficult to read",
-                                widget=widget,
-                                widget_class=widget_class,
-                                widget_path=current_path,
-                                recommendation="Use sans-serif fonts for better "
-                                "readability",
-                                wcag_criterion="3.1.5 Reading Level",
-                                auto_fixable=True,
-                            )
+                if font and isinstance(font, tuple) and len(font) > 0:
+                    if _is_problematic_font(font[0]):
+                        yield AccessibilityIssue(
+                            severity=IssueSeverity.LOW,
+                            category=ValidationCategory.UNDERSTANDABLE,
+                            title="Potentially difficult to read font",
+                            description=f"Font family '{font[0]}' may be "
+                            f"difficult to read",
+                            widget=widget,
+                            widget_class=widget_class,
+                            widget_path=current_path,
+                            recommendation="Use sans-serif fonts for better "
+                            "readability",
+                            wcag_criterion="3.1.5 Reading Level",
+                            auto_fixable=True,
+                            kind=IssueKind.HARD_TO_READ_FONT,
                         )
             except (tk.TclError, AttributeError):
                 pass
 
-            # Check children
-            try:
-                for child in widget.winfo_children():
-                    check_widget(child, current_path)
-            except tk.TclError:
-                pass
-
-        check_widget(root)
-
-    def _validate_predictable_functionality(self, root: tk.Tk) -> None:
+    def _validate_predictable_functionality(
+        self, root: tk.Tk
+    ) -> Iterator[AccessibilityIssue]:
         """Validate predictable functionality (WCAG 3.2.x)"""
         # Check for consistent navigation and identification
-        button_texts = []
-        button_positions = []
-
-        def check_widget(widget: tk.Misc, path: str = "") -> None:
-            widget_class = widget.winfo_class()
-            current_path = f"{path}/{widget_class}" if path else widget_class
+        button_texts: List[str] = []
+        button_positions: List[Tuple[int, int, str]] = []
 
+        for widget, widget_class, current_path, _ in self._iter_widgets(root):
             # Collect button information for consistency checking
             if widget_class == "Button":
                 try:
@@ -772,362 +963,242 @@ class AccessibilityValidator:
                     pass
 
             # Check for widgets that change context unexpectedly
-            if widget_class in ["Button", "Checkbutton", "Radiobutton"]:
+            if widget_class in _CONTEXT_CHANGE_CLASSES:
                 # Check if widget has focus event bindings that might change context
                 try:
                     bindings = widget.bind()
                     if "<FocusIn>" in str(bindings) or "<FocusOut>" in str(bindings):
-                        self.issues.append(
-                            AccessibilityIssue(
-                                severity=IssueSeverity.INFO,
-                                category=ValidationCategory.UNDERSTANDABLE,
-                                title="Widget has focus event bindings",
-                                description=f"{widget_class} has focus bindings that "
-                                f"might change context",
-                                widget=widget,
-                                widget_class=widget_class,
-                                widget_path=current_path,
-                                recommendation="Ensure focus events don't "
-                                "unexpectedly change context",
-                                wcag_criterion="3.2.1 On Focus",
-                                auto_fixable=False,
-                            )
+                        yield AccessibilityIssue(
+                            severity=IssueSeverity.INFO,
+                            category=ValidationCategory.UNDERSTANDABLE,
+                            title="Widget has focus event bindings",
+                            description=f"{widget_class} has focus bindings that "
+                            f"might change context",
+                            widget=widget,
+                            widget_class=widget_class,
+                            widget_path=current_path,
+                            recommendation="Ensure focus events don't "
+                            "unexpectedly change context",
+                            wcag_criterion="3.2.1 On Focus",
+                            auto_fixable=False,
+                            kind=IssueKind.FOCUS_CONTEXT_CHANGE,
                         )
                 except tk.TclError:
                     pass
 
-            # Check children
-            try:
-                for child in widget.winfo_children():
-                    check_widget(child, current_path)
-            except tk.TclError:
-                pass
-
-        check_widget(root)
-
         # Check for duplicate button texts (potential confusion)
-        seen_texts = set()
+        seen_texts: Set[str] = set()
         for text in button_texts:
             if text in seen_texts and text.strip():
-                self.issues.append(
-                    AccessibilityIssue(
-                        severity=IssueSeverity.LOW,
-                        category=ValidationCategory.UNDERSTANDABLE,
-                        title="Duplicate button text found",
-                        description=f"Multiple buttons with text '{text}' found",
-                        widget=None,
-                        widget_class="Button",
-                        widget_path="",
-                        recommendation="Use unique, descriptive button text",
-                        wcag_criterion="3.2.4 Consistent Identification",
-                        auto_fixable=False,
-                    )
+                yield AccessibilityIssue(
+                    severity=IssueSeverity.LOW,
+                    category=ValidationCategory.UNDERSTANDABLE,
+                    title="Duplicate button text found",
+                    description=f"Multiple buttons with text '{text}' found",
+                    widget=None,
+                    widget_class="Button",
+                    widget_path="",
+                    recommendation="Use unique, descriptive button text",
+                    wcag_criterion="3.2.4 Consistent Identification",
+                    auto_fixable=False,
+                    kind=IssueKind.DUPLICATE_BUTTON_TEXT,
                 )
                 break
             seen_texts.add(text)
 
-    def _validate_input_assistance(self, root: tk.Tk) -> None:
+    def _validate_input_assistance(self, root: tk.Tk) -> Iterator[AccessibilityIssue]:
         """Validate input assistance (WCAG 3.3.x)"""
 
-        def check_widget(widget: tk.Misc, path: str = "") -> None:
-            widget_class = widget.winfo_class()
-            current_path = f"{path}/{widget_class}" if path else widget_class
-
+        for widget, widget_class, current_path, _ in self._iter_widgets(root):
             # Check form inputs for labels and error handling
-            if widget_class in ["Entry", "Text", "Spinbox"]:
-                has_label = (
-                    hasattr(widget, "accessible_name") and widget.accessible_name
-                )
+            if widget_class in _INPUT_CLASSES:
+                has_label = getattr(widget, "accessible_name", None)
 
                 if not has_label:
-                    self.issues.append(
-                        AccessibilityIssue(
-                            severity=IssueSeverity.HIGH,
-                            category=ValidationCategory.UNDERSTANDABLE,
-                            title="Input field missing label",
-                            description=f"{widget_class} lacks accessible label",
-                            widget=widget,
-                            widget_class=widget_class,
-                            widget_path=current_path,
-                            recommendation="Add accessible_name or associate "
-                            "with label",
-                            wcag_criterion="3.3.2 Labels or Instructions",
-                            auto_fixable=False,
-                        )
+                    yield AccessibilityIssue(
+                        severity=IssueSeverity.HIGH,
+                        category=ValidationCategory.UNDERSTANDABLE,
+                        title="Input field missing label",
+                        description=f"{widget_class} lacks accessible label",
+                        widget=widget,
+                        widget_class=widget_class,
+                        widget_path=current_path,
+                        recommendation="Add accessible_name or associate with label",
+                        wcag_criterion="3.3.2 Labels or Instructions",
+                        auto_fixable=False,
+                        kind=IssueKind.MISSING_LABEL,
                     )
 
-            # Check children
-            try:
-                for child in widget.winfo_children():
-                    check_widget(child, current_path)
-            except tk.TclError:
-                pass
-
-        check_widget(root)
-
     # Robust validations
-    def _validate_markup_compatibility(self, root: tk.Tk) -> None:
+    def _validate_markup_compatibility(
+        self, root: tk.Tk
+    ) -> Iterator[AccessibilityIssue]:
         """Validate markup compatibility (WCAG 4.1.1)"""
 
         # Check for proper widget hierarchy and structure
-        def check_widget(widget: tk.Misc, path: str = "") -> None:
-            widget_class = widget.winfo_class()
-
+        for widget, widget_class, current_path, _ in self._iter_widgets(root):
             # Check for proper ARIA roles if widget has accessibility features
-            if hasattr(widget, "accessible_role"):
-                try:
-                    from .aria_compliance import get_default_role
-
-                    expected_role = get_default_role(widget)
-                    actual_role = widget.accessible_role
-
-                    if actual_role and actual_role != expected_role.value:
-                        # Validate the custom role is appropriate
-                        valid_roles = [role.value for role in ARIARole]
-                        if actual_role not in valid_roles:
-                            self.issues.append(
-                                AccessibilityIssue(
-                                    severity=IssueSeverity.MEDIUM,
-                                    category=ValidationCategory.ROBUST,
-                                    title="Invalid ARIA role",
-                                    description=f"Role '{actual_role}' is not a "
-                                    f"valid ARIA role",
-                                    widget=widget,
-                                    widget_class=widget_class,
-                                    widget_path=path,
-                                    recommendation="Use valid ARIA role or remove "
-                                    "custom role",
-                                    wcag_criterion="4.1.1 Parsing",
-                                    auto_fixable=True,
-                                )
-                            )
-
-                except (AttributeError, ImportError):
-                    pass
-
-            # Check children
-            try:
-                for child in widget.winfo_children():
-                    check_widget(
-                        child, f"{path}/{widget_class}" if path else widget_class
-                    )
-            except tk.TclError:
-                pass
-
-        check_widget(root)
-
-    def _validate_assistive_technology_support(self, root: tk.Tk) -> None:
-        """Validate assistive technology support (WCAG 4.1.2)"""
-
-        def check_widget(widget: tk.Misc, path: str = "") -> None:
-            widget_class = widget.winfo_class()
-            current_path = f"{path}/{widget_class}" if path else widget_class
-
-            # Check if widget has proper accessibility properties
-            if not hasattr(widget, "accessible_name"):
-                interactive_widgets = [
-                    "Button",
-                    "Entry",
-                    "Text",
-                    "Checkbutton",
-                    "Radiobutton",
-                    "Scale",
-                    "Listbox",
-                    "Scrollbar",
-                    "Spinbox",
-                ]
-
-                if widget_class in interactive_widgets:
-                    self.issues.append(
-                        AccessibilityIssue(
-                            severity=IssueSeverity.HIGH,
+            actual_role = getattr(widget, "accessible_role", None)
+            if actual_role:
+                expected_role = get_role_for_class(widget_class)
+
+                if actual_role != expected_role.value:
+                    # Validate the custom role is appropriate
+                    if actual_role not in _VALID_ARIA_ROLES:
+                        yield AccessibilityIssue(
+                            severity=IssueSeverity.MEDIUM,
                             category=ValidationCategory.ROBUST,
-                            title="Widget lacks accessibility support",
-                            description=f"{widget_class} missing AccessibleMixin",
+                            title="Invalid ARIA role",
+                            description=f"Role '{actual_role}' is not a "
+                            f"valid ARIA role",
                             widget=widget,
                             widget_class=widget_class,
                             widget_path=current_path,
-                            recommendation="Use accessible widget classes or add "
-                            "AccessibleMixin",
-                            wcag_criterion="4.1.2 Name, Role, Value",
-                            auto_fixable=False,
+                            recommendation="Use valid ARIA role or remove "
+                            "custom role",
+                            wcag_criterion="4.1.1 Parsing",
+                            auto_fixable=True,
+                            kind=IssueKind.INVALID_ARIA_ROLE,
                         )
-                    )
 
-            # Check children
-            try:
-                for child in widget.winfo_children():
-                    check_widget(child, current_path)
-            except tk.TclError:
-                pass
+    def _validate_assistive_technology_support(
+        self, root: tk.Tk
+    ) -> Iterator[AccessibilityIssue]:
+        """Validate assistive technology support (WCAG 4.1.2)"""
 
-        check_widget(root)
+        for widget, widget_class, current_path, _ in self._iter_widgets(root):
+            # Check if widget has proper accessibility properties
+            if not hasattr(widget, "accessible_name"):
+                if widget_class in _INTERACTIVE_CLASSES:
+                    yield AccessibilityIssue(
+                        severity=IssueSeverity.HIGH,
+                        category=ValidationCategory.ROBUST,
+                        title="Widget lacks accessibility support",
+                        description=f"{widget_class} missing AccessibleMixin",
+                        widget=widget,
+                        widget_class=widget_class,
+                        widget_path=current_path,
+                        recommendation="Use accessible widget classes or add "
+                        "AccessibleMixin",
+                        wcag_criterion="4.1.2 Name, Role, Value",
+                        auto_fixable=False,
+                        kind=IssueKind.MISSING_ACCESSIBILITY_SUPPORT,
+                    )
 
-    def _validate_future_compatibility(self, root: tk.Tk) -> None:
+    def _validate_future_compatibility(
+        self, root: tk.Tk
+    ) -> Iterator[AccessibilityIssue]:
         """Validate future compatibility"""
 
         # Check for deprecated patterns or potential compatibility issues
-        def check_widget(widget: tk.Misc, path: str = "") -> None:
-            widget_class = widget.winfo_class()
-            current_path = f"{path}/{widget_class}" if path else widget_class
-
+        for widget, widget_class, current_path, _ in self._iter_widgets(root):
             # Check for deprecated Tkinter patterns
-            deprecated_options = ["bd", "highlightcolor", "selectcolor"]
-            for option in deprecated_options:
+            for option in _DEPRECATED_OPTIONS:
                 try:
                     value = widget.cget(option)
                     if value:
-                        self.issues.append(
-                            AccessibilityIssue(
-                                severity=IssueSeverity.INFO,
-                                category=ValidationCategory.ROBUST,
-                                title=f"Deprecated option '{option}' used",
-                                description=f"Widget uses deprecated option '{option}'",
-                                widget=widget,
-                                widget_class=widget_class,
-                                widget_path=current_path,
-                                recommendation=f"Consider using modern alternatives "
-                                f"to '{option}'",
-                                wcag_criterion="4.1.1 Parsing",
-                                auto_fixable=False,
-                            )
+                        yield AccessibilityIssue(
+                            severity=IssueSeverity.INFO,
+                            category=ValidationCategory.ROBUST,
+                            title=f"Deprecated option '{option}' used",
+                            description=f"Widget uses deprecated option '{option}'",
+                            widget=widget,
+                            widget_class=widget_class,
+                            widget_path=current_path,
+                            recommendation=f"Consider using modern alternatives "
+                            f"to '{option}'",
+                            wcag_criterion="4.1.1 Parsing",
+                            auto_fixable=False,
+                            kind=IssueKind.DEPRECATED_OPTION,
                         )
                 except tk.TclError:
                     pass
 
             # Check for missing modern accessibility features
-            if not hasattr(widget, "accessible_name") and widget_class in [
-                "Button",
-                "Entry",
-                "Text",
-                "Checkbutton",
-                "Radiobutton",
-                "Scale",
-                "Listbox",
-                "Scrollbar",
-                "Spinbox",
-            ]:
-                self.issues.append(
-                    AccessibilityIssue(
-                        severity=IssueSeverity.MEDIUM,
-                        category=ValidationCategory.ROBUST,
-                        title="Widget lacks modern accessibility features",
-                        description=f"{widget_class} doesn't use accessibility mixins",
-                        widget=widget,
-                        widget_class=widget_class,
-                        widget_path=current_path,
-                        recommendation="Upgrade to accessible widget classes",
-                        wcag_criterion="4.1.2 Name, Role, Value",
-                        auto_fixable=False,
-                    )
+            if (
+                not hasattr(widget, "accessible_name")
+                and widget_class in _INTERACTIVE_CLASSES
+            ):
+                yield AccessibilityIssue(
+                    severity=IssueSeverity.MEDIUM,
+                    category=ValidationCategory.ROBUST,
+                    title="Widget lacks modern accessibility features",
+                    description=f"{widget_class} doesn't use accessibility mixins",
+                    widget=widget,
+                    widget_class=widget_class,
+                    widget_path=current_path,
+                    recommendation="Upgrade to accessible widget classes",
+                    wcag_criterion="4.1.2 Name, Role, Value",
+                    auto_fixable=False,
+                    kind=IssueKind.MISSING_ACCESSIBILITY_SUPPORT,
                 )
 
-            # Check children
-            try:
-                for child in widget.winfo_children():
-                    check_widget(child, current_path)
-            except tk.TclError:
-                pass
-
-        check_widget(root)
-
-    def _validate_widget_hierarchy(self, root: tk.Tk) -> None:
+    def _validate_widget_hierarchy(self, root: tk.Tk) -> Iterator[AccessibilityIssue]:
         """Validate proper widget hierarchy and structure"""
 
-        def check_widget(widget: tk.Misc, depth: int = 0, path: str = "") -> None:
-            widget_class = widget.winfo_class()
-            current_path = f"{path}/{widget_class}" if path else widget_class
-
+        for widget, widget_class, current_path, depth in self._iter_widgets(root):
             # Check for excessive nesting depth
             if depth > 10:
-                self.issues.append(
-                    AccessibilityIssue(
-                        severity=IssueSeverity.LOW,
-                        category=ValidationCategory.ROBUST,
-                        title="Excessive widget nesting",
-                        description=f"Widget hierarchy is {depth} levels deep",
-                        widget=widget,
-                        widget_class=widget_class,
-                        widget_path=current_path,
-                        recommendation="Consider flattening widget hierarchy",
-                        wcag_criterion="4.1.1 Parsing",
-                        auto_fixable=False,
-                    )
+                yield AccessibilityIssue(
+                    severity=IssueSeverity.LOW,
+                    category=ValidationCategory.ROBUST,
+                    title="Excessive widget nesting",
+                    description=f"Widget hierarchy is {depth} levels deep",
+                    widget=widget,
+                    widget_class=widget_class,
+                    widget_path=current_path,
+                    recommendation="Consider flattening widget hierarchy",
+                    wcag_criterion="4.1.1 Parsing",
+                    auto_fixable=False,
+                    kind=IssueKind.EXCESSIVE_NESTING,
                 )
 
             # Check for proper container usage
-            if widget_class == "Frame" and not widget.winfo_children():
-                self.issues.append(
-                    AccessibilityIssue(
-                        severity=IssueSeverity.INFO,
-                        category=ValidationCategory.ROBUST,
-                        title="Empty container found",
-                        description="Frame widget contains no children",
-                        widget=widget,
-                        widget_class=widget_class,
-                        widget_path=current_path,
-                        recommendation="Remove empty containers or add content",
-                        wcag_criterion="4.1.1 Parsing",
-                        auto_fixable=True,
-                    )
+            if widget_class == "Frame" and not self._winfo_children(widget):
+                yield AccessibilityIssue(
+                    severity=IssueSeverity.INFO,
+                    category=ValidationCategory.ROBUST,
+                    title="Empty container found",
+                    description="Frame widget contains no children",
+                    widget=widget,
+                    widget_class=widget_class,
+                    widget_path=current_path,
+                    recommendation="Remove empty containers or add content",
+                    wcag_criterion="4.1.1 Parsing",
+                    auto_fixable=True,
+                    kind=IssueKind.EMPTY_CONTAINER,
                 )
 
-            # Check children
-            try:
-                for child in widget.winfo_children():
-                    check_widget(child, depth + 1, current_path)
-            except tk.TclError:
-                pass
-
-        check_widget(root)
-
-    def _validate_error_handling(self, root: tk.Tk) -> None:
+    def _validate_error_handling(self, root: tk.Tk) -> Iterator[AccessibilityIssue]:
         """Validate error handling and user feedback"""
 
-        def check_widget(widget: tk.Misc, path: str = "") -> None:
-            widget_class = widget.winfo_class()
-            current_path = f"{path}/{widget_class}" if path else widget_class
-
+        for widget, widget_class, current_path, _ in self._iter_widgets(root):
             # Check Entry widgets for validation
-            if widget_class in ["Entry", "Spinbox"]:
+            if widget_class in _VALIDATED_INPUT_CLASSES:
                 # Check if widget has validation
                 try:
                     validate_cmd = widget.cget("validate")
                     if not validate_cmd or validate_cmd == "none":
-                        self.issues.append(
-                            AccessibilityIssue(
-                                severity=IssueSeverity.LOW,
-                                category=ValidationCategory.UNDERSTANDABLE,
-                                title="Input field lacks validation",
-                                description=f"{widget_class} has no input validation",
-                                widget=widget,
-                                widget_class=widget_class,
-                                widget_path=current_path,
-                                recommendation="Add input validation and error "
-                                "messages",
-                                wcag_criterion="3.3.1 Error Identification",
-                                auto_fixable=False,
-                            )
+                        yield AccessibilityIssue(
+                            severity=IssueSeverity.LOW,
+                            category=ValidationCategory.UNDERSTANDABLE,
+                            title="Input field lacks validation",
+                            description=f"{widget_class} has no input validation",
+                            widget=widget,
+                            widget_class=widget_class,
+                            widget_path=current_path,
+                            recommendation="Add input validation and error messages",
+                            wcag_criterion="3.3.1 Error Identification",
+                            auto_fixable=False,
+                            kind=IssueKind.MISSING_INPUT_VALIDATION,
                         )
                 except tk.TclError:
                     pass
 
-            # Check children
-            try:
-                for child in widget.winfo_children():
-                    check_widget(child, current_path)
-            except tk.TclError:
-                pass
-
-        check_widget(root)
-
-    def _validate_responsive_design(self, root: tk.Tk) -> None:
+    def _validate_responsive_design(self, root: tk.Tk) -> Iterator[AccessibilityIssue]:
         """Validate responsive design aspects"""
 
-        def check_widget(widget: tk.Misc, path: str = "") -> None:
-            widget_class = widget.winfo_class()
-            current_path = f"{path}/{widget_class}" if path else widget_class
-
+        for widget, widget_class, current_path, _ in self._iter_widgets(root):
             # Check for fixed sizes that might not scale
             try:
                 width = widget.cget("width")
@@ -1135,125 +1206,98 @@ class AccessibilityValidator:
 
                 if isinstance(width, int) and width > 0:
                     if width < 44:  # Minimum touch target size
-                        self.issues.append(
-                            AccessibilityIssue(
-                                severity=IssueSeverity.MEDIUM,
-                                category=ValidationCategory.OPERABLE,
-                                title="Widget too small for touch interaction",
-                                description=f"{widget_class} width {width} is below "
-                                f"minimum 44px",
-                                widget=widget,
-                                widget_class=widget_class,
-                                widget_path=current_path,
-                                recommendation="Increase widget size to at least "
-                                "44x44 pixels",
-                                wcag_criterion="2.5.5 Target Size",
-                                auto_fixable=True,
-                            )
+                        yield AccessibilityIssue(
+                            severity=IssueSeverity.MEDIUM,
+                            category=ValidationCategory.OPERABLE,
+                            title="Widget too small for touch interaction",
+                            description=f"{widget_class} width {width} is below "
+                            f"minimum 44px",
+                            widget=widget,
+                            widget_class=widget_class,
+                            widget_path=current_path,
+                            recommendation="Increase widget size to at least "
+                            "44x44 pixels",
+                            wcag_criterion="2.5.5 Target Size",
+                            auto_fixable=True,
+                            kind=IssueKind.SMALL_TARGET,
                         )
 
                 if isinstance(height, int) and height > 0:
                     if height < 44:  # Minimum touch target size
-                        self.issues.append(
-                            AccessibilityIssue(
-                                severity=IssueSeverity.MEDIUM,
-                                category=ValidationCategory.OPERABLE,
-                                title="Widget too small for touch interaction",
-                                description=f"{widget_class} height {height} is below "
-                                f"minimum 44px",
-                                widget=widget,
-                                widget_class=widget_class,
-                                widget_path=current_path,
-                                recommendation="Increase widget size to at least "
-                                "44x44 pixels",
-                                wcag_criterion="2.5.5 Target Size",
-                                auto_fixable=True,
-                            )
+                        yield AccessibilityIssue(
+                            severity=IssueSeverity.MEDIUM,
+                            category=ValidationCategory.OPERABLE,
+                            title="Widget too small for touch interaction",
+                            description=f"{widget_class} height {height} is below "
+                            f"minimum 44px",
+                            widget=widget,
+                            widget_class=widget_class,
+                            widget_path=current_path,
+                            recommendation="Increase widget size to at least "
+                            "44x44 pixels",
+                            wcag_criterion="2.5.5 Target Size",
+                            auto_fixable=True,
+                            kind=IssueKind.SMALL_TARGET,
                         )
             except tk.TclError:
                 pass
 
-            # Check children
-            try:
-                for child in widget.winfo_children():
-                    check_widget(child, current_path)
-            except tk.TclError:
-                pass
-
-        check_widget(root)
-
-    def _validate_internationalization(self, root: tk.Tk) -> None:
+    def _validate_internationalization(
+        self, root: tk.Tk
+    ) -> Iterator[AccessibilityIssue]:
         """Validate internationalization and localization support"""
 
-        def check_widget(widget: tk.Misc, path: str = "") -> None:
-            widget_class = widget.winfo_class()
-            current_path = f"{path}/{widget_class}" if path else widget_class
-
+        for widget, widget_class, current_path, _ in self._iter_widgets(root):
             # Check for hardcoded text that should be localized
             try:
                 text = widget.cget("text")
                 if text and isinstance(text, str):
                     # Check for English-specific patterns
-                    english_patterns = [
-                        "OK",
-                        "Cancel",
-                        "Yes",
-                        "No",
-                        "Submit",
-                        "Close",
-                        "Save",
-                        "Open",
-                        "Delete",
-                    ]
-                    if text in english_patterns:
-                        self.issues.append(
-                            AccessibilityIssue(
-                                severity=IssueSeverity.INFO,
-                                category=ValidationCategory.UNDERSTANDABLE,
-                                title="Hardcoded text found",
-                                description=f"Widget contains hardcoded text: '{text}'",
-                                widget=widget,
-                                widget_class=widget_class,
-                                widget_path=current_path,
-                                recommendation="Use localization system for text",
-                                wcag_criterion="3.1.2 Language of Parts",
-                                auto_fixable=False,
-                            )
+                    if text in _ENGLISH_PATTERNS:
+                        yield AccessibilityIssue(
+                            severity=IssueSeverity.INFO,
+                            category=ValidationCategory.UNDERSTANDABLE,
+                            title="Hardcoded text found",
+                            description=f"Widget contains hardcoded text: '{text}'",
+                            widget=widget,
+                            widget_class=widget_class,
+                            widget_path=current_path,
+                            recommendation="Use localization system for text",
+                            wcag_criterion="3.1.2 Language of Parts",
+                            auto_fixable=False,
+                            kind=IssueKind.HARDCODED_TEXT,
                         )
             except tk.TclError:
                 pass
 
-            # Check children
-            try:
-                for child in widget.winfo_children():
-                    check_widget(child, current_path)
-            except tk.TclError:
-                pass
+    def generate_report(
+        self, issues: Optional[Iterable[AccessibilityIssue]] = None
+    ) -> Dict[str, Any]:
+        """Generate comprehensive accessibility report
 
-        check_widget(root)
+        Reports on the issues from the last validate_application call, or on
+        any iterable of issues such as the stream from iter_issues.
+        """
+        issues = list(self.issues if issues is None else issues)
 
-    def generate_report(self) -> Dict[str, Any]:
-        """Generate comprehensive accessibility report"""
-        issues_by_severity: Dict[str, List[AccessibilityIssue]] = {}
-        issues_by_category: Dict[str, List[AccessibilityIssue]] = {}
+        issues_by_severity: Dict[str, List[AccessibilityIssue]] = defaultdict(list)
+        issues_by_category: Dict[str, List[AccessibilityIssue]] = defaultdict(list)
+        severity_counts: Counter[str] = Counter()
+        category_counts: Counter[str] = Counter()
 
-        for issue in self.issues:
-            # Group by severity
+        # Group and count every issue in a single pass
+        for issue in issues:
             severity_key = issue.severity.value
-            if severity_key not in issues_by_severity:
-                issues_by_severity[severity_key] = []
-            issues_by_severity[severity_key].append(issue)
-
-            # Group by category
             category_key = issue.category.value
-            if category_key not in issues_by_category:
-                issues_by_category[category_key] = []
+            issues_by_severity[severity_key].append(issue)
             issues_by_category[category_key].append(issue)
+            severity_counts[severity_key] += 1
+            category_counts[category_key] += 1
 
         # Calculate compliance score
-        total_issues = len(self.issues)
-        critical_issues = len(issues_by_severity.get("critical", []))
-        high_issues = len(issues_by_severity.get("high", []))
+        total_issues = len(issues)
+        critical_issues = severity_counts["critical"]
+        high_issues = severity_counts["high"]
 
         # Simple scoring algorithm
         if critical_issues > 0:
@@ -1267,29 +1311,14 @@ class AccessibilityValidator:
             "compliance_level": self.compliance_level.value,
             "total_issues": total_issues,
             "compliance_score": compliance_score,
-            "issues_by_severity": issues_by_severity,
-            "issues_by_category": issues_by_category,
-            "all_issues": [
-                {
-                    "severity": issue.severity.value,
-                    "category": issue.category.value,
-                    "title": issue.title,
-                    "description": issue.description,
-                    "widget_class": issue.widget_class,
-                    "widget_path": issue.widget_path,
-                    "recommendation": issue.recommendation,
-                    "wcag_criterion": issue.wcag_criterion,
-                    "auto_fixable": issue.auto_fixable,
-                }
-                for issue in self.issues
-            ],
+            "issues_by_severity": dict(issues_by_severity),
+            "issues_by_category": dict(issues_by_category),
+            "all_issues": list(map(_issue_to_dict, issues)),
             "summary": {
-                "perceivable_issues": len(issues_by_category.get("perceivable", [])),
-                "operable_issues": len(issues_by_category.get("operable", [])),
-                "understandable_issues": len(
-                    issues_by_category.get("understandable", [])
-                ),
-                "robust_issues": len(issues_by_category.get("robust", [])),
+                "perceivable_issues": category_counts["perceivable"],
+                "operable_issues": category_counts["operable"],
+                "understandable_issues": category_counts["understandable"],
+                "robust_issues": category_counts["robust"],
             },
         }
 
@@ -1297,116 +1326,33 @@ class AccessibilityValidator:
         """Automatically fix issues that can be auto-fixed"""
         fixed_count = 0
 
+        # The high contrast theme fixes every contrast issue at once, so
+        # apply it a single time rather than once per issue
+        contrast_issues = sum(
+            1
+            for issue in self.issues
+            if issue.kind is IssueKind.LOW_CONTRAST
+            and issue.auto_fixable
+            and issue.widget
+        )
+        if contrast_issues:
+            try:
+                HighContrastTheme.apply(root)
+                fixed_count += contrast_issues
+            except (tk.TclError, AttributeError):
+                pass
+
         for issue in self.issues:
-            if not issue.auto_fixable or not issue.widget:
+            widget = issue.widget
+            if not issue.auto_fixable or not widget:
                 continue
 
-            try:
-                if "contrast" in issue.title.lower():
-                    # Apply high contrast theme
-                    from .themes import HighContrastTheme
-
-                    HighContrastTheme.apply(root)
-                    fixed_count += 1
-
-                elif "font size" in issue.title.lower():
-                    # Increase font size
-                    try:
-                        current_font = issue.widget.cget("font")
-                        if isinstance(current_font, tuple) and len(current_font) >= 2:
-                            new_font = (
-                                current_font[0],
-                                max(12, current_font[1]),
-                                *current_font[2:],
-                            )
-                            issue.widget.configure(font=new_font)
-                            fixed_count += 1
-                    except (tk.TclError, AttributeError):
-                        pass
-
-                elif (
-                    "keyboard" in issue.title.lower()
-                    and "takefocus" in issue.description
-                ):
-                    # Enable keyboard focus
-                    try:
-                        issue.widget.configure(takefocus=True)
-                        fixed_count += 1
-                    except (tk.TclError, AttributeError):
-                        pass
-
-                elif (
-                    "font" in issue.title.lower()
-                    and "difficult to read" in issue.description
-                ):
-                    # Change to readable font
-                    try:
-                        current_font = issue.widget.cget("font")
-                        if isinstance(current_font, tuple):
-                            new_font = (
-                                "Arial",
-                                current_font[1] if len(current_font) > 1 else 12,
-                                *current_font[2:],
-                            )
-                            issue.widget.configure(font=new_font)
-                            fixed_count += 1
-                    except (tk.TclError, AttributeError):
-                        pass
-
-                elif "empty container" in issue.title.lower():
-                    # Remove empty containers
-                    try:
-                        if issue.widget and not issue.widget.winfo_children():
-                            issue.widget.destroy()
-                            fixed_count += 1
-                    except (tk.TclError, AttributeError):
-                        pass
-
-                elif (
-                    "too small" in issue.title.lower() and "touch" in issue.description
-                ):
-                    # Increase widget size for touch targets
-                    try:
-                        current_width = issue.widget.cget("width")
-                        current_height = issue.widget.cget("height")
-
-                        new_width = (
-                            max(44, current_width)
-                            if isinstance(current_width, int)
-                            else current_width
-                        )
-                        new_height = (
-                            max(44, current_height)
-                            if isinstance(current_height, int)
-                            else current_height
-                        )
-
-                        if new_width != current_width:
-                            issue.widget.configure(width=new_width)
-                            fixed_count += 1
-                        if new_height != current_height:
-                            issue.widget.configure(height=new_height)
-                            fixed_count += 1
-                    except (tk.TclError, AttributeError):
-                        pass
-
-                elif "bright red background" in issue.title.lower():
-                    # Change problematic red background
-                    try:
-                        issue.widget.configure(bg="#cc0000")  # Darker red
-                        fixed_count += 1
-                    except (tk.TclError, AttributeError):
-                        pass
-
-                elif "invalid aria role" in issue.title.lower():
-                    # Remove invalid ARIA role
-                    try:
-                        if hasattr(issue.widget, "accessible_role"):
-                            issue.widget.accessible_role = None
-                            fixed_count += 1
-                    except (tk.TclError, AttributeError):
-                        pass
+            fixer = _FIXERS.get(issue.kind)
+            if fixer is None:
+                continue
 
+            try:
+                fixed_count += fixer(root, widget)
             except (tk.TclError, AttributeError):
                 # Widget may not support the fix
                 continue
@@ -1426,24 +1372,51 @@ class AccessibilityTester:
         print("Running accessibility audit...")
 
         start_time = time.time()
-        self.validator.validate_application(self.root)
+
+        # Walk the tree once for the validator and the tester checks alike
+        children_of: Dict[int, Sequence[tk.Misc]] = {}
+        nodes = list(_walk_widgets(self.root, children_of))
+        # Store the issues as validate_application does, so auto-fixing and
+        # the other validator queries work after an audit
+        self.validator.issues[:] = self.validator._iter_snapshot_issues(
+            self.root, nodes, children_of
+        )
         end_time = time.time()
 
         report = self.validator.generate_report()
+        keyboard_issues, names, roles, descriptions = self._scan_widgets(nodes)
+
         report["audit_duration"] = end_time - start_time
         report["screen_reader_active"] = is_screen_reader_active()
+        report["keyboard_navigation_issues"] = keyboard_issues
+        report["screen_reader_compatibility"] = {
+            "widgets_with_names": names,
+            "widgets_with_roles": roles,
+            "widgets_with_descriptions": descriptions,
+        }
 
         return report
 
     def test_keyboard_navigation(self) -> List[str]:
         """Test keyboard navigation interactively"""
-        issues = []
-
         # This would implement interactive keyboard navigation testing
         # For now, return basic validation
-        def check_widget(widget: tk.Misc) -> None:
-            # Basic keyboard navigation validation without recursion
-            widget_class = widget.winfo_class()
+        return self._scan_widgets(_walk_widgets(self.root))[0]
+
+    def _scan_widgets(
+        self, nodes: Iterable[Tuple[tk.Misc, str, str, int]]
+    ) -> Tuple[List[str], int, int, int]:
+        """Collect keyboard issues and accessible name/role/description counts"""
+        issues = []
+        names = roles = descriptions = 0
+
+        for widget, widget_class, _, _ in nodes:
+            if getattr(widget, "accessible_name", None):
+                names += 1
+            if getattr(widget, "accessible_role", None):
+                roles += 1
+            if getattr(widget, "accessible_description", None):
+                descriptions += 1
 
             # Check if widget can receive focus
             try:
@@ -1456,102 +1429,59 @@ class AccessibilityTester:
                 pass
 
             # Check for keyboard bindings on interactive widgets
-            interactive_widgets = [
-                "Button",
-                "Entry",
-                "Text",
-                "Listbox",
-                "Scale",
-                "Checkbutton",
-                "Radiobutton",
-                "Menu",
-            ]
-            if widget_class in interactive_widgets:
+            if widget_class in _KEYBOARD_TESTED_CLASSES:
                 bindings = widget.bind()
-                key_bindings = [
-                    b
-                    for b in bindings
-                    if any(key in b for key in ["<Key", "<Return", "<Tab", "<Space"])
-                ]
-                if not key_bindings:
+                if not any(key in b for b in bindings for key in _KEY_BINDING_PREFIXES):
                     issues.append(
                         f"Interactive widget {widget_class} lacks keyboard bindings"
                     )
 
-            try:
-                for child in widget.winfo_children():
-                    check_widget(child)
-            except tk.TclError:
-                pass
-
-        check_widget(self.root)
-        return issues
+        return issues, names, roles, descriptions
 
     def test_screen_reader_compatibility(self) -> Dict[str, Any]:
         """Test screen reader compatibility"""
+        names, roles, descriptions = self._count_accessibility_attrs()
         return {
             "screen_reader_detected": is_screen_reader_active(),
-            "widgets_with_names": self._count_widgets_with_names(),
-            "widgets_with_roles": self._count_widgets_with_roles(),
-            "widgets_with_descriptions": self._count_widgets_with_descriptions(),
+            "widgets_with_names": names,
+            "widgets_with_roles": roles,
+            "widgets_with_descriptions": descriptions,
         }
 
-    def _count_widgets_with_names(self) -> int:
-        """Count widgets with accessible names"""
-        count = 0
-
-        def check_widget(widget: tk.Misc) -> None:
-            nonlocal count
-            if hasattr(widget, "accessible_name") and widget.accessible_name:
-                count += 1
+    def _count_accessibility_attrs(self) -> Tuple[int, int, int]:
+        """Count widgets with accessible names, roles and descriptions"""
+        names = roles = descriptions = 0
 
-            try:
-                for child in widget.winfo_children():
-                    check_widget(child)
-            except tk.TclError:
-                pass
+        for widget in _iter_descendants(self.root):
+            if getattr(widget, "accessible_name", None):
+                names += 1
+            if getattr(widget, "accessible_role", None):
+                roles += 1
+            if getattr(widget, "accessible_description", None):
+                descriptions += 1
 
-        check_widget(self.root)
-        return count
+        return names, roles, descriptions
 
-    def _count_widgets_with_roles(self) -> int:
-        """Count widgets with accessible roles"""
-        count = 0
+    def _count_widgets_with_names(self) -> int:
+        """Count widgets with accessible names
 
-        def check_widget(widget: tk.Misc) -> None:
-            nonlocal count
-            if hasattr(widget, "accessible_role") and widget.accessible_role:
-                count += 1
+        Prefer _count_accessibility_attrs when more than one count is needed.
+        """
+        return self._count_accessibility_attrs()[0]
 
-            try:
-                for child in widget.winfo_children():
-                    check_widget(child)
-            except tk.TclError:
-                pass
+    def _count_widgets_with_roles(self) -> int:
+        """Count widgets with accessible roles
 
-        check_widget(self.root)
-        return count
+        Prefer _count_accessibility_attrs when more than one count is needed.
+        """
+        return self._count_accessibility_attrs()[1]
 
     def _count_widgets_with_descriptions(self) -> int:
-        """Count widgets with accessible descriptions"""
-        count = 0
-
-        def check_widget(widget: tk.Misc) -> None:
-            nonlocal count
-            if (
-                hasattr(widget, "accessible_description")
-                and widget.accessible_description
-            ):
-                count += 1
-
-            try:
-                for child in widget.winfo_children():
-                    check_widget(child)
-            except tk.TclError:
-                pass
+        """Count widgets with accessible descriptions
 
-        check_widget(self.root)
-        return count
+        Prefer _count_accessibility_attrs when more than one count is needed.
+        """
+        return self._count_accessibility_attrs()[2]
 
 
 # Convenience functions
@@ -1581,9 +1511,7 @@ def validate_keyboard_navigation_local(root: tk.Tk) -> List[str]:
     """Test keyboard navigation without recursion"""
     issues = []
 
-    def check_widget_navigation(widget: tk.Misc) -> None:
-        widget_class = widget.winfo_class()
-
+    for widget, widget_class, _, _ in _walk_widgets(root):
         # Check if widget can receive focus
         try:
             takefocus = widget.cget("takefocus")
@@ -1608,14 +1536,6 @@ def validate_keyboard_navigation_local(root: tk.Tk) -> List[str]:
             except tk.TclError:
                 pass
 
-        # Recursively check children
-        try:
-            for child in widget.winfo_children():
-                check_widget_navigation(child)
-        except tk.TclError:
-            pass
-
-    check_widget_navigation(root)
     return issues
 
 
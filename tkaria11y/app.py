@@ -11,8 +11,15 @@ from .themes import HighContrastTheme, set_dyslexic_font
 from .utils_inspector import launch_inspector
 from .a11y_engine import shutdown_tts
 
+# Bits of AccessibleApp._flags
+_HIGH_CONTRAST = 1 << 0
+_DYSLEXIC_FONT = 1 << 1
+
 
 class AccessibleApp(tk.Tk):
+    # tk.Tk instances keep their __dict__; the slot only stores the theme flags
+    __slots__ = ("_flags",)
+
     def __init__(
         self,
         *,
@@ -20,16 +27,16 @@ class AccessibleApp(tk.Tk):
         high_contrast: bool = False,
         dyslexic_font: bool = False,
         scaling: float = 1.0,
-        enable_inspector: bool = False
+        enable_inspector: bool = False,
+        shutdown_tts_on_close: bool = False
     ):
         super().__init__()
         if title:
             self.title(title)
         self.tk.call("tk", "scaling", scaling)
 
-        # Store theme preferences
-        self._high_contrast_enabled = False
-        self._dyslexic_font_enabled = False
+        # Store theme preferences as _HIGH_CONTRAST / _DYSLEXIC_FONT bits
+        self._flags = 0
 
         if high_contrast:
             self.enable_high_contrast()
@@ -41,24 +48,36 @@ class AccessibleApp(tk.Tk):
         if enable_inspector:
             launch_inspector(self)
 
-        # Register cleanup handler for TTS
-        self.protocol("WM_DELETE_WINDOW", self._on_closing)
+        # The TTS engine shuts itself down at exit; stopping it when this
+        # window closes would silence speech for any later windows too
+        if shutdown_tts_on_close:
+            self.protocol("WM_DELETE_WINDOW", self._on_closing)
+
+    @property
+    def _high_contrast_enabled(self) -> bool:
+        """Whether the high contrast theme is applied"""
+        return bool(self._flags & _HIGH_CONTRAST)
+
+    @property
+    def _dyslexic_font_enabled(self) -> bool:
+        """Whether the dyslexic-friendly font is applied"""
+        return bool(self._flags & _DYSLEXIC_FONT)
 
     def enable_high_contrast(self) -> None:
         """Enable high contrast theme"""
-        if not self._high_contrast_enabled:
+        if not self._flags & _HIGH_CONTRAST:
             HighContrastTheme.apply(self)
-            self._high_contrast_enabled = True
+            self._flags |= _HIGH_CONTRAST
 
     def disable_high_contrast(self) -> None:
         """Disable high contrast theme"""
-        if self._high_contrast_enabled:
+        if self._flags & _HIGH_CONTRAST:
             HighContrastTheme.remove(self)
-            self._high_contrast_enabled = False
+            self._flags &= ~_HIGH_CONTRAST
 
     def toggle_high_contrast(self) -> bool:
         """Toggle high contrast theme on/off. Returns new state."""
-        if self._high_contrast_enabled:
+        if self._flags & _HIGH_CONTRAST:
             self.disable_high_contrast()
         else:
             self.enable_high_contrast()
@@ -70,20 +89,20 @@ class AccessibleApp(tk.Tk):
 
     def enable_dyslexic_font(self) -> None:
         """Enable dyslexic-friendly font"""
-        if not self._dyslexic_font_enabled:
+        if not self._flags & _DYSLEXIC_FONT:
             set_dyslexic_font(self)
-            self._dyslexic_font_enabled = True
+            self._flags |= _DYSLEXIC_FONT
 
     def disable_dyslexic_font(self) -> None:
         """Disable dyslexic-friendly font (reset to system default)"""
-        if self._dyslexic_font_enabled:
+        if self._flags & _DYSLEXIC_FONT:
             # Reset to system default font
             set_dyslexic_font(self, family="TkDefaultFont", size=9)
-            self._dyslexic_font_enabled = False
+            self._flags &= ~_DYSLEXIC_FONT
 
     def toggle_dyslexic_font(self) -> bool:
         """Toggle dyslexic-friendly font on/off. Returns new state."""
-        if self._dyslexic_font_enabled:
+        if self._flags & _DYSLEXIC_FONT:
             self.disable_dyslexic_font()
         else:
             self.enable_dyslexic_font()
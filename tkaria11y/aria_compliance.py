@@ -5,12 +5,16 @@ ARIA compliance module providing complete ARIA role mappings, properties,
 and validation for full WCAG 2.1 compliance.
 """
 
-from typing import Dict, Set, List, Optional, Any, Tuple
+from typing import Dict, FrozenSet, Iterable, Set, List, Mapping, Optional, Any, Tuple
+import re
+import string
 import tkinter as tk
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 
 
-class ARIARole(Enum):
+class ARIARole(str, Enum):
     """Complete ARIA roles enumeration"""
 
     # Widget roles
@@ -95,7 +99,7 @@ class ARIARole(Enum):
     DIALOG = "dialog"
 
 
-class ARIAProperty(Enum):
+class ARIAProperty(str, Enum):
     """ARIA properties and states"""
 
     # Widget attributes
@@ -155,7 +159,7 @@ class ARIAProperty(Enum):
 
 
 # Widget class to ARIA role mapping
-WIDGET_ARIA_MAPPING: Dict[str, ARIARole] = {
+_WIDGET_ARIA_MAPPING: Dict[str, ARIARole] = {
     # Standard Tkinter widgets
     "Button": ARIARole.BUTTON,
     "Entry": ARIARole.TEXTBOX,
@@ -212,7 +216,7 @@ WIDGET_ARIA_MAPPING: Dict[str, ARIARole] = {
 
 
 # Required properties for each role
-ROLE_REQUIRED_PROPERTIES: Dict[ARIARole, Set[ARIAProperty]] = {
+_ROLE_REQUIRED_PROPERTIES: Dict[ARIARole, Set[ARIAProperty]] = {
     ARIARole.BUTTON: set(),
     ARIARole.CHECKBOX: {ARIAProperty.CHECKED},
     ARIARole.RADIO: {ARIAProperty.CHECKED},
@@ -244,7 +248,7 @@ ROLE_REQUIRED_PROPERTIES: Dict[ARIARole, Set[ARIAProperty]] = {
 
 
 # Supported properties for each role
-ROLE_SUPPORTED_PROPERTIES: Dict[ARIARole, Set[ARIAProperty]] = {
+_ROLE_SUPPORTED_PROPERTIES: Dict[ARIARole, Set[ARIAProperty]] = {
     ARIARole.BUTTON: {
         ARIAProperty.DISABLED,
         ARIAProperty.EXPANDED,
@@ -377,31 +381,97 @@ ROLE_SUPPORTED_PROPERTIES: Dict[ARIARole, Set[ARIAProperty]] = {
 }
 
 
+def _freeze_role_table(
+    table: Dict[ARIARole, Set[ARIAProperty]],
+) -> Mapping[ARIARole, FrozenSet[ARIAProperty]]:
+    """Return a read-only copy of a role to properties table"""
+    return MappingProxyType({role: frozenset(props) for role, props in table.items()})
+
+
+# Read-only views of the lookup tables above
+WIDGET_ARIA_MAPPING: Mapping[str, ARIARole] = MappingProxyType(_WIDGET_ARIA_MAPPING)
+ROLE_REQUIRED_PROPERTIES = _freeze_role_table(_ROLE_REQUIRED_PROPERTIES)
+ROLE_SUPPORTED_PROPERTIES = _freeze_role_table(_ROLE_SUPPORTED_PROPERTIES)
+
+
+def _allowed_values(*values: str) -> Tuple[FrozenSet[str], str]:
+    """Pair allowed token values with their description, e.g. 'a' or 'b'"""
+    quoted = [f"'{value}'" for value in values]
+    if len(quoted) == 2:
+        return frozenset(values), " or ".join(quoted)
+    return frozenset(values), ", ".join(quoted[:-1]) + ", or " + quoted[-1]
+
+
+# Token properties and the values each accepts
+_PROPERTY_ALLOWED_VALUES: Mapping[ARIAProperty, Tuple[FrozenSet[str], str]] = (
+    MappingProxyType(
+        {
+            ARIAProperty.CHECKED: _allowed_values("true", "false", "mixed"),
+            ARIAProperty.EXPANDED: _allowed_values("true", "false", "undefined"),
+            ARIAProperty.SELECTED: _allowed_values("true", "false", "undefined"),
+            ARIAProperty.DISABLED: _allowed_values("true", "false"),
+            ARIAProperty.HIDDEN: _allowed_values("true", "false"),
+            ARIAProperty.INVALID: _allowed_values(
+                "true", "false", "grammar", "spelling"
+            ),
+            ARIAProperty.LIVE: _allowed_values("off", "polite", "assertive"),
+            ARIAProperty.ORIENTATION: _allowed_values(
+                "horizontal", "vertical", "undefined"
+            ),
+            ARIAProperty.SORT: _allowed_values(
+                "ascending", "descending", "none", "other"
+            ),
+        }
+    )
+)
+
+# Properties whose values must be numbers or integers
+_NUMBER_PROPERTIES = frozenset(
+    {ARIAProperty.VALUEMIN, ARIAProperty.VALUEMAX, ARIAProperty.VALUENOW}
+)
+_INTEGER_PROPERTIES = frozenset(
+    {
+        ARIAProperty.LEVEL,
+        ARIAProperty.POSINSET,
+        ARIAProperty.SETSIZE,
+        ARIAProperty.COLCOUNT,
+        ARIAProperty.COLINDEX,
+        ARIAProperty.COLSPAN,
+        ARIAProperty.ROWCOUNT,
+        ARIAProperty.ROWINDEX,
+        ARIAProperty.ROWSPAN,
+    }
+)
+
+
 class ARIAValidator:
     """Validates ARIA compliance for widgets"""
 
+    __slots__ = ()
+
     @staticmethod
     def validate_widget(
         widget: tk.Widget, role: ARIARole, properties: Dict[ARIAProperty, Any]
     ) -> List[str]:
         """Validate ARIA compliance for a widget"""
-        errors = []
-
         # Check required properties
-        required = ROLE_REQUIRED_PROPERTIES.get(role, set())
-        for prop in required:
-            if prop not in properties:
-                errors.append(
-                    f"Missing required property {prop.value} for role {role.value}"
-                )
+        required = ROLE_REQUIRED_PROPERTIES.get(role, frozenset())
+        missing = required - properties.keys() if properties else required
+        errors = [
+            f"Missing required property {prop.value} for role {role.value}"
+            for prop in missing
+        ]
+        if not properties:
+            return errors
 
         # Check supported properties
-        supported = ROLE_SUPPORTED_PROPERTIES.get(role, set())
-        for prop in properties:
-            if prop not in supported:
-                errors.append(
-                    f"Property {prop.value} not supported for role {role.value}"
-                )
+        supported = ROLE_SUPPORTED_PROPERTIES.get(role, frozenset())
+        if not properties.keys() <= supported:
+            errors.extend(
+                f"Property {prop.value} not supported for role {role.value}"
+                for prop in properties
+                if prop not in supported
+            )
 
         # Validate property values
         for prop, value in properties.items():
@@ -414,63 +484,20 @@ class ARIAValidator:
     @staticmethod
     def _validate_property_value(prop: ARIAProperty, value: Any) -> Optional[str]:
         """Validate individual property values"""
-        if prop == ARIAProperty.CHECKED:
-            if value not in ["true", "false", "mixed"]:
-                return f"Invalid value for {prop.value}: must be 'true', 'false', or 'mixed'"
-
-        elif prop == ARIAProperty.EXPANDED:
-            if value not in ["true", "false", "undefined"]:
-                return f"Invalid value for {prop.value}: must be 'true', 'false', or 'undefined'"
-
-        elif prop == ARIAProperty.SELECTED:
-            if value not in ["true", "false", "undefined"]:
-                return f"Invalid value for {prop.value}: must be 'true', 'false', or 'undefined'"
-
-        elif prop == ARIAProperty.DISABLED:
-            if value not in ["true", "false"]:
-                return f"Invalid value for {prop.value}: must be 'true' or 'false'"
-
-        elif prop == ARIAProperty.HIDDEN:
-            if value not in ["true", "false"]:
-                return f"Invalid value for {prop.value}: must be 'true' or 'false'"
-
-        elif prop == ARIAProperty.INVALID:
-            if value not in ["true", "false", "grammar", "spelling"]:
-                return f"Invalid value for {prop.value}: must be 'true', 'false', 'grammar', or 'spelling'"
-
-        elif prop == ARIAProperty.LIVE:
-            if value not in ["off", "polite", "assertive"]:
-                return f"Invalid value for {prop.value}: must be 'off', 'polite', or 'assertive'"
-
-        elif prop == ARIAProperty.ORIENTATION:
-            if value not in ["horizontal", "vertical", "undefined"]:
-                return f"Invalid value for {prop.value}: must be 'horizontal', 'vertical', or 'undefined'"
-
-        elif prop == ARIAProperty.SORT:
-            if value not in ["ascending", "descending", "none", "other"]:
-                return f"Invalid value for {prop.value}: must be 'ascending', 'descending', 'none', or 'other'"
-
-        elif prop in [
-            ARIAProperty.VALUEMIN,
-            ARIAProperty.VALUEMAX,
-            ARIAProperty.VALUENOW,
-        ]:
+        allowed = _PROPERTY_ALLOWED_VALUES.get(prop)
+        if allowed is not None:
+            values, choices = allowed
+            # Non-string values can never match, and may not be hashable
+            if not isinstance(value, str) or value not in values:
+                return f"Invalid value for {prop.value}: must be {choices}"
+
+        elif prop in _NUMBER_PROPERTIES:
             try:
                 float(value)
             except (ValueError, TypeError):
                 return f"Invalid value for {prop.value}: must be a number"
 
-        elif prop in [
-            ARIAProperty.LEVEL,
-            ARIAProperty.POSINSET,
-            ARIAProperty.SETSIZE,
-            ARIAProperty.COLCOUNT,
-            ARIAProperty.COLINDEX,
-            ARIAProperty.COLSPAN,
-            ARIAProperty.ROWCOUNT,
-            ARIAProperty.ROWINDEX,
-            ARIAProperty.ROWSPAN,
-        ]:
+        elif prop in _INTEGER_PROPERTIES:
             try:
                 int(value)
             except (ValueError, TypeError):
@@ -479,20 +506,25 @@ class ARIAValidator:
         return None
 
 
+@lru_cache(maxsize=128)
+def get_role_for_class(widget_class: str) -> ARIARole:
+    """Get the default ARIA role for a widget class name"""
+    return WIDGET_ARIA_MAPPING.get(widget_class, ARIARole.NONE)
+
+
 def get_default_role(widget: tk.Misc) -> ARIARole:
     """Get the default ARIA role for a widget"""
-    widget_class = widget.winfo_class()
-    return WIDGET_ARIA_MAPPING.get(widget_class, ARIARole.NONE)
+    return get_role_for_class(widget.winfo_class())
 
 
-def get_required_properties(role: ARIARole) -> Set[ARIAProperty]:
+def get_required_properties(role: ARIARole) -> FrozenSet[ARIAProperty]:
     """Get required properties for an ARIA role"""
-    return ROLE_REQUIRED_PROPERTIES.get(role, set())
+    return ROLE_REQUIRED_PROPERTIES.get(role, frozenset())
 
 
-def get_supported_properties(role: ARIARole) -> Set[ARIAProperty]:
+def get_supported_properties(role: ARIARole) -> FrozenSet[ARIAProperty]:
     """Get supported properties for an ARIA role"""
-    return ROLE_SUPPORTED_PROPERTIES.get(role, set())
+    return ROLE_SUPPORTED_PROPERTIES.get(role, frozenset())
 
 
 def validate_aria_compliance(
@@ -503,48 +535,111 @@ def validate_aria_compliance(
 
 
 # Contrast ratio validation for WCAG compliance
-def calculate_contrast_ratio(color1: str, color2: str) -> float:
-    """Calculate contrast ratio between two colors"""
+def _srgb_to_linear(c: int) -> float:
+    """Convert an 8-bit sRGB channel to linear light"""
+    c_float = c / 255.0
+    if c_float <= 0.03928:
+        return c_float / 12.92
+    else:
+        return float(pow((c_float + 0.055) / 1.055, 2.4))
 
-    def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
-        """Convert hex color to RGB"""
-        hex_color = hex_color.lstrip("#")
-        if len(hex_color) == 3:
-            hex_color = "".join([c * 2 for c in hex_color])
-        return (
-            int(hex_color[0:2], 16),
-            int(hex_color[2:4], 16),
-            int(hex_color[4:6], 16),
-        )
-
-    def get_luminance(rgb: Tuple[int, int, int]) -> float:
-        """Calculate relative luminance"""
-
-        def normalize(c: int) -> float:
-            c_float = c / 255.0
-            if c_float <= 0.03928:
-                return c_float / 12.92
-            else:
-                return float(pow((c_float + 0.055) / 1.055, 2.4))
-
-        r, g, b = rgb
-        return 0.2126 * normalize(r) + 0.7152 * normalize(g) + 0.0722 * normalize(b)
 
-    try:
-        rgb1 = hex_to_rgb(color1)
-        rgb2 = hex_to_rgb(color2)
+# Every 8-bit channel value, linearized once at import
+_SRGB_TO_LINEAR: Tuple[float, ...] = tuple(_srgb_to_linear(c) for c in range(256))
 
-        lum1 = get_luminance(rgb1)
-        lum2 = get_luminance(rgb2)
+_HEX_DIGITS = frozenset(string.hexdigits)
 
-        # Ensure lighter color is in numerator
-        if lum1 > lum2:
-            return (lum1 + 0.05) / (lum2 + 0.05)
-        else:
-            return (lum2 + 0.05) / (lum1 + 0.05)
+
+def calculate_contrast_ratio(color1: str, color2: str) -> float:
+    """Calculate contrast ratio between two colors"""
+    try:
+        # Spellings such as "#FFF" and "fff" share one cache entry
+        key1 = color1.lstrip("#").lower()
+        key2 = color2.lstrip("#").lower()
+    except (AttributeError, TypeError):
+        # Not a string (e.g. a Tcl object), so it cannot be cached
+        return _contrast_ratio(color1, color2)
+    return _cached_contrast_ratio(key1, key2)
+
+
+@lru_cache(maxsize=1024)
+def _cached_contrast_ratio(color1: str, color2: str) -> float:
+    """Memoized contrast ratio for a pair of normalized color strings"""
+    return _contrast_ratio(color1, color2)
+
+
+def _hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
+    """Convert hex color to RGB"""
+    hex_color = hex_color.lstrip("#")
+    if not _HEX_DIGITS.issuperset(hex_color):
+        raise ValueError(f"Invalid hex color: {hex_color!r}")
+    if len(hex_color) == 3:
+        value = int(hex_color, 16)
+        # Widen each 4-bit digit to 8 bits, e.g. 0xF -> 0xFF
+        return (value >> 8) * 17, (value >> 4 & 0xF) * 17, (value & 0xF) * 17
+    if len(hex_color) < 6:
+        raise ValueError(f"Invalid hex color: {hex_color!r}")
+    value = int(hex_color[:6], 16)
+    return value >> 16, value >> 8 & 0xFF, value & 0xFF
+
+
+def _luminance(rgb: Tuple[int, int, int]) -> float:
+    """Calculate relative luminance"""
+    r, g, b = rgb
+    return (
+        0.2126 * _SRGB_TO_LINEAR[r]
+        + 0.7152 * _SRGB_TO_LINEAR[g]
+        + 0.0722 * _SRGB_TO_LINEAR[b]
+    )
+
+
+def _contrast_ratio(color1: str, color2: str) -> float:
+    """Compute the contrast ratio between two colors"""
+    try:
+        lum1 = _luminance(_hex_to_rgb(color1))
+        lum2 = _luminance(_hex_to_rgb(color2))
     except (ValueError, TypeError):
         return 1.0  # Return minimum ratio on error
 
+    # Ensure lighter color is in numerator
+    if lum1 > lum2:
+        return (lum1 + 0.05) / (lum2 + 0.05)
+    else:
+        return (lum2 + 0.05) / (lum1 + 0.05)
+
+
+def calculate_contrast_ratios(pairs: Iterable[Tuple[str, str]]) -> List[float]:
+    """Calculate contrast ratios for many color pairs, parsing each color once"""
+    luminances: Dict[str, Optional[float]] = {}
+    ratios = []
+    for color1, color2 in pairs:
+        pair = []
+        for color in (color1, color2):
+            if color not in luminances:
+                try:
+                    luminances[color] = _luminance(_hex_to_rgb(color))
+                except (ValueError, TypeError):
+                    luminances[color] = None  # Not a valid hex color
+            pair.append(luminances[color])
+
+        lum1, lum2 = pair
+        if lum1 is None or lum2 is None:
+            ratios.append(1.0)  # Minimum ratio, as for a single invalid pair
+        elif lum1 > lum2:
+            ratios.append((lum1 + 0.05) / (lum2 + 0.05))
+        else:
+            ratios.append((lum2 + 0.05) / (lum1 + 0.05))
+    return ratios
+
+
+# Minimum contrast ratios by WCAG level and text size
+_MIN_CONTRAST_RATIO: Mapping[str, Mapping[str, float]] = MappingProxyType(
+    {
+        "AA": {"normal": 4.5, "large": 3.0},
+        "AAA": {"normal": 7.0, "large": 4.5},
+    }
+)
+
 
 def validate_contrast_ratio(
     foreground: str, background: str, level: str = "AA", size: str = "normal"
@@ -552,32 +647,66 @@ def validate_contrast_ratio(
     """Validate contrast ratio meets WCAG requirements"""
     ratio = calculate_contrast_ratio(foreground, background)
 
-    if level == "AAA":
-        if size == "large":
-            return ratio >= 4.5
-        else:
-            return ratio >= 7.0
-    else:  # AA level
-        if size == "large":
-            return ratio >= 3.0
-        else:
-            return ratio >= 4.5
+    # Any level other than AAA is held to AA, any size other than large to normal
+    thresholds = _MIN_CONTRAST_RATIO.get(level, _MIN_CONTRAST_RATIO["AA"])
+    return ratio >= thresholds.get(size, thresholds["normal"])
 
 
 # Font size validation for accessibility
+_MIN_FONT_SIZE: Mapping[str, int] = MappingProxyType(
+    {
+        "pt": 12,  # Minimum 12pt for accessibility
+        "px": 16,  # Minimum 16px for accessibility
+    }
+)
+
+
 def validate_font_size(font_size: int, unit: str = "pt") -> bool:
     """Validate font size meets accessibility requirements"""
-    if unit == "pt":
-        return font_size >= 12  # Minimum 12pt for accessibility
-    elif unit == "px":
-        return font_size >= 16  # Minimum 16px for accessibility
-    else:
+    minimum = _MIN_FONT_SIZE.get(unit)
+    if minimum is None:
         return True  # Unknown unit, assume valid
+    return font_size >= minimum
 
 
 # Keyboard navigation validation
-def validate_keyboard_navigation(widget: tk.Misc) -> List[str]:
-    """Validate keyboard navigation compliance"""
+_KEYBOARD_EVENTS = (
+    "<Key>",
+    "<KeyPress>",
+    "<KeyRelease>",
+    "<Return>",
+    "<space>",
+    "<Tab>",
+    "<Shift-Tab>",
+    "<Up>",
+    "<Down>",
+    "<Left>",
+    "<Right>",
+)
+_KEYBOARD_EVENT_PATTERN = re.compile("|".join(map(re.escape, _KEYBOARD_EVENTS)))
+_KEYBOARD_INTERACTIVE_CLASSES = frozenset(
+    {
+        "Button",
+        "Entry",
+        "Text",
+        "Checkbutton",
+        "Radiobutton",
+        "Scale",
+        "Listbox",
+        "Scrollbar",
+        "Spinbox",
+    }
+)
+
+
+def validate_keyboard_navigation(
+    widget: tk.Misc, widget_class: Optional[str] = None
+) -> List[str]:
+    """Validate keyboard navigation compliance
+
+    Callers that already know the widget's class can pass it as widget_class
+    to save asking Tk for it again.
+    """
     errors = []
 
     # Check if widget can receive focus
@@ -589,38 +718,12 @@ def validate_keyboard_navigation(widget: tk.Misc) -> List[str]:
         # Widget doesn't support takefocus
         pass
 
-    # Check for keyboard event bindings
-    bindings = widget.bind()
-    keyboard_events = [
-        "<Key>",
-        "<KeyPress>",
-        "<KeyRelease>",
-        "<Return>",
-        "<space>",
-        "<Tab>",
-        "<Shift-Tab>",
-        "<Up>",
-        "<Down>",
-        "<Left>",
-        "<Right>",
-    ]
-
-    has_keyboard_binding = any(event in str(bindings) for event in keyboard_events)
-
-    widget_class = widget.winfo_class()
-    interactive_widgets = [
-        "Button",
-        "Entry",
-        "Text",
-        "Checkbutton",
-        "Radiobutton",
-        "Scale",
-        "Listbox",
-        "Scrollbar",
-        "Spinbox",
-    ]
-
-    if widget_class in interactive_widgets and not has_keyboard_binding:
-        errors.append("Interactive widget lacks keyboard event bindings")
+    # Only interactive widgets need keyboard bindings, so skip bind() otherwise
+    if widget_class is None:
+        widget_class = widget.winfo_class()
+    if widget_class in _KEYBOARD_INTERACTIVE_CLASSES:
+        bindings = widget.bind()
+        if not any(map(_KEYBOARD_EVENT_PATTERN.search, bindings)):
+            errors.append("Interactive widget lacks keyboard event bindings")
 
     return errors
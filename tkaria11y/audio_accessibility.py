@@ -8,9 +8,21 @@ Provides audio cues, sound feedback, spatial audio, and hearing accessibility fe
 import tkinter as tk
 import threading
 import time
-import queue
 import math
-from typing import Dict, List, Optional, Callable, Any, Tuple, TYPE_CHECKING
+import os
+from collections import deque
+from functools import lru_cache
+from typing import (
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Callable,
+    Any,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
 from enum import Enum
 from dataclasses import dataclass
 
@@ -69,12 +81,80 @@ class SpatialAudioConfig:
     max_delay: float = 0.0006  # maximum interaural time difference
 
 
+# Default minimum interval between repeats of a cue, by pattern (milliseconds)
+_DEFAULT_RATE_LIMITS_MS = {"click": 20, "tick": 20, "tone": 50}
+
+# Sine based cue patterns: pattern -> (frequency multiplier, decay per second).
+# tone is a plain sine; beep, click and tick decay ever faster; thud is a low,
+# quickly decaying sine.
+_SINE_PATTERNS: Dict[str, Tuple[float, float]] = {
+    "tone": (1.0, 0.0),
+    "beep": (1.0, 5.0),
+    "click": (1.0, 50.0),
+    "tick": (1.0, 100.0),
+    "thud": (0.5, 20.0),
+}
+
+
+@lru_cache(maxsize=None)
+def _fade_in_ramp() -> Any:
+    """Half Hann window used to fade cue edges in (reversed to fade out)"""
+    import numpy as np
+
+    return (0.5 * (1.0 - np.cos(np.linspace(0.0, np.pi, 32)))).astype(np.float32)
+
+
+@lru_cache(maxsize=256)
+def _spatial_coefficients(
+    x: float, y: float, head_delay: float, max_delay: float
+) -> Tuple[float, float, float]:
+    """Left gain, right gain and delay in samples for a normalized position"""
+    # Interaural time difference (ITD) from a spherical head (Woodworth model),
+    # where head_delay is the head radius over the speed of sound in samples
+    azimuth = max(-1.0, min(1.0, x)) * (math.pi / 2)
+    delay_samples = head_delay * (azimuth + math.sin(azimuth))
+    delay_samples = max(-max_delay, min(max_delay, delay_samples))
+
+    # Interaural level difference (ILD), attenuated with distance from center
+    distance_attenuation = 1.0 / (1.0 + math.hypot(x, y) * 2.0)
+    left_gain = (1.0 - max(0.0, x) * 0.5) * distance_attenuation
+    right_gain = (1.0 + min(0.0, x) * 0.5) * distance_attenuation
+
+    return left_gain, right_gain, delay_samples
+
+
+def _raise_thread_priority() -> None:
+    """Best-effort raise of the calling thread's scheduling priority"""
+    # Audio playback glitches when the worker is preempted by Tk event
+    # handling; real-time classes usually need extra privileges, so failing
+    # to get one is silently ignored
+    try:
+        if sys.platform.startswith("win"):
+            import ctypes
+
+            kernel32 = ctypes.windll.kernel32
+            thread_priority_time_critical = 15
+            kernel32.SetThreadPriority(
+                kernel32.GetCurrentThread(), thread_priority_time_critical
+            )
+        elif hasattr(os, "sched_setscheduler"):
+            # pid 0 is the calling thread on Linux
+            os.sched_setscheduler(0, os.SCHED_RR, os.sched_param(10))
+    except (OSError, AttributeError):
+        pass
+
+
 class AudioEngine:
     """Audio engine for accessibility sounds"""
 
     def __init__(self) -> None:
         self._audio_available = False
         self._audio_module: Optional[str] = None
+
+        # Frequency and tone generation
+        self._sample_rate = 44100
+        self._bit_depth = 16
+
         self._init_audio()
 
         # Audio settings
@@ -86,14 +166,36 @@ class AudioEngine:
         # Audio cue definitions
         self._audio_cues = self._create_default_cues()
 
-        # Audio queue and processing
-        self._audio_queue: queue.Queue = queue.Queue()
+        # Minimum time between two plays of the same cue, so streams of key,
+        # scroll or focus events do not flood the worker with identical sounds
+        self._last_play_ns: Dict[AudioCueType, int] = {}
+        self._min_interval_ns: Dict[AudioCueType, int] = {
+            cue_type: _DEFAULT_RATE_LIMITS_MS.get(cue.pattern, 0) * 1_000_000
+            for cue_type, cue in self._audio_cues.items()
+        }
+        # Cues whose limit came from set_rate_limit rather than their pattern
+        self._rate_limit_overrides: Set[AudioCueType] = set()
+
+        # Audio queue and processing. deque append/popleft are atomic, so cues
+        # change hands without a queue lock; when full the oldest cue is dropped.
+        self._audio_queue: Deque[Tuple[AudioCue, Optional[Tuple[float, float]]]] = (
+            deque(maxlen=64)
+        )
+        self._audio_wakeup = threading.Event()
         self._worker_thread: Optional[threading.Thread] = None
         self._running = False
 
-        # Frequency and tone generation
-        self._sample_rate = 44100
-        self._bit_depth = 16
+        # Pre-rendered cue data, so playback is a lookup instead of synthesis
+        self._cue_wave_cache: Dict[AudioCueType, Any] = {}
+        self._cue_pcm_cache: Dict[AudioCueType, Any] = {}
+        self._cue_beep_cache: Dict[AudioCueType, Tuple[int, int]] = {}
+        self._cue_sounds: Dict[AudioCueType, Any] = {}
+        self._cue_bytes_cache: Dict[AudioCueType, Tuple[float, bytes]] = {}
+
+        # Reusable stereo buffer for spatial cues, grown to the longest cue
+        self._stereo_scratch: Any = None
+        for cue in self._audio_cues.values():
+            self._cache_cue(cue)
 
         self._start_audio_worker()
 
@@ -128,7 +230,9 @@ class AudioEngine:
                 frequency=self._sample_rate, size=-self._bit_depth, channels=2
             )
             pygame.mixer.init()
-            self._audio_module = pygame
+            # Reserve enough channels that overlapping cues never allocate
+            pygame.mixer.set_num_channels(32)
+            self._audio_module = "pygame"
             return True
         except ImportError:
             return False
@@ -139,7 +243,29 @@ class AudioEngine:
             import pyaudio
             import numpy as np
 
-            self._pyaudio = pyaudio.PyAudio()
+            pa = pyaudio.PyAudio()
+
+            # Keep one mono and one stereo stream open for the engine's lifetime;
+            # opening a PortAudio device per cue costs tens of milliseconds
+            streams = {}
+            try:
+                for channels in (1, 2):
+                    streams[channels] = pa.open(
+                        format=pyaudio.paInt16,
+                        channels=channels,
+                        rate=self._sample_rate,
+                        output=True,
+                        frames_per_buffer=1024,
+                    )
+            except OSError:
+                # No usable output device; release what was opened
+                for stream in streams.values():
+                    stream.close()
+                pa.terminate()
+                return False
+
+            self._pyaudio = pa
+            self._pyaudio_streams = streams
             self._audio_module = "pyaudio"
             self._numpy = np
             return True
@@ -227,6 +353,54 @@ class AudioEngine:
             AudioCueType.DROP: AudioCue(AudioCueType.DROP, 600, 0.15, 0.5, "thud"),
         }
 
+    def _cache_cue(self, cue: AudioCue) -> None:
+        """Pre-render a cue for the active audio backend"""
+        self._cue_wave_cache.pop(cue.cue_type, None)
+        self._cue_pcm_cache.pop(cue.cue_type, None)
+        self._cue_beep_cache.pop(cue.cue_type, None)
+        self._cue_sounds.pop(cue.cue_type, None)
+        self._cue_bytes_cache.pop(cue.cue_type, None)
+
+        if self._audio_module == "winsound":
+            self._cue_beep_cache[cue.cue_type] = (
+                int(cue.frequency),
+                int(cue.duration * 1000),
+            )
+        elif self._audio_module in ("pygame", "pyaudio"):
+            try:
+                import numpy  # noqa: F401
+            except ImportError:
+                return
+            self._cue_wave_cache[cue.cue_type] = self._cue_waveform(cue)
+            pcm = self._render_cue_pcm(cue)
+            self._cue_pcm_cache[cue.cue_type] = pcm
+
+            if self._audio_module == "pygame":
+                import pygame
+
+                self._cue_sounds[cue.cue_type] = pygame.sndarray.make_sound(pcm)
+
+    def _cue_waveform(self, cue: AudioCue) -> Any:
+        """Get a cue's waveform at its own volume, generating it if not cached"""
+        audio_data = self._cue_wave_cache.get(cue.cue_type)
+        if audio_data is None:
+            samples = int(cue.duration * self._sample_rate)
+            audio_data = self._generate_audio_data(cue, samples, cue.volume)
+        return audio_data
+
+    def _render_cue_pcm(self, cue: AudioCue) -> Any:
+        """Render a cue at its own volume as int16 PCM"""
+        import numpy as np
+
+        audio_data = self._cue_waveform(cue)
+        pcm = (audio_data * 32767).astype(np.int16)
+
+        if self._audio_module == "pygame":
+            # The pygame mixer is opened in stereo, so centre the cue
+            pcm = np.column_stack((pcm, pcm))
+
+        return pcm
+
     def _start_audio_worker(self) -> None:
         """Start audio processing worker thread"""
         if self._worker_thread and self._worker_thread.is_alive():
@@ -241,25 +415,26 @@ class AudioEngine:
     def _stop_audio_worker(self) -> None:
         """Stop audio processing worker thread"""
         self._running = False
+        self._audio_wakeup.set()
         if self._worker_thread:
             self._worker_thread.join(timeout=1.0)
 
     def _audio_worker_loop(self) -> None:
         """Audio worker thread main loop"""
+        _raise_thread_priority()
+
         while self._running:
-            try:
-                # Get audio cue from queue
-                cue, spatial_pos = self._audio_queue.get(timeout=0.1)
+            # Sleep until play_cue or shutdown signals, then drain the queue
+            self._audio_wakeup.wait()
+            self._audio_wakeup.clear()
+
+            while self._audio_queue:
+                cue, spatial_pos = self._audio_queue.popleft()
 
                 if cue and self._audio_enabled:
+                    # Playback errors are swallowed inside _play_audio_cue
                     self._play_audio_cue(cue, spatial_pos)
 
-            except queue.Empty:
-                continue
-            except Exception:
-                # Continue on errors
-                time.sleep(0.01)
-
     def _play_audio_cue(
         self, cue: AudioCue, spatial_pos: Optional[Tuple[float, float]] = None
     ) -> None:
@@ -272,7 +447,7 @@ class AudioEngine:
                 self._play_pygame_cue(cue, spatial_pos)
             elif self._audio_module == "pyaudio":
                 self._play_pyaudio_cue(cue, spatial_pos)
-            elif hasattr(self._audio_module, "Beep"):  # winsound
+            elif self._audio_module == "winsound":
                 self._play_winsound_cue(cue)
             elif hasattr(self._audio_module, "open"):  # ossaudiodev
                 self._play_oss_cue(cue)
@@ -288,60 +463,57 @@ class AudioEngine:
         import pygame
         import numpy as np
 
-        # Generate audio data
-        samples = int(cue.duration * self._sample_rate)
-        audio_data = self._generate_audio_data(cue, samples)
-
-        # Apply spatial audio if enabled and position provided
         if self._spatial_audio.enabled and spatial_pos:
-            audio_data = self._apply_spatial_audio(audio_data, spatial_pos)
-
-        # Convert to pygame format
-        audio_data = (audio_data * 32767).astype(np.int16)
+            # Only the panning depends on the widget position
+            audio_data = self._cue_waveform(cue)
+            audio_data = self._apply_spatial_audio(audio_data, spatial_pos, 32767)
+            audio_data = audio_data.astype(np.int16)
+            sound = pygame.sndarray.make_sound(audio_data)
+        else:
+            sound = self._cue_sounds.get(cue.cue_type)
+            if sound is None:
+                sound = pygame.sndarray.make_sound(self._render_cue_pcm(cue))
 
-        # Create and play sound
-        sound = pygame.sndarray.make_sound(audio_data)
-        sound.set_volume(cue.volume * self._master_volume * self._cue_volume)
+        sound.set_volume(self._master_volume * self._cue_volume)
         sound.play()
 
     def _play_pyaudio_cue(
         self, cue: AudioCue, spatial_pos: Optional[Tuple[float, float]]
     ) -> None:
         """Play audio cue using PyAudio"""
-        import pyaudio
-
-        # Generate audio data
-        samples = int(cue.duration * self._sample_rate)
-        audio_data = self._generate_audio_data(cue, samples)
-
-        # Apply spatial audio if enabled
+        gain = self._master_volume * self._cue_volume
         if self._spatial_audio.enabled and spatial_pos:
-            audio_data = self._apply_spatial_audio(audio_data, spatial_pos)
-
-        # Convert to bytes
-        audio_bytes = (audio_data * 32767).astype(self._numpy.int16).tobytes()
+            # Only the panning depends on the widget position
+            audio_data = self._cue_waveform(cue)
+            audio_data = self._apply_spatial_audio(
+                audio_data, spatial_pos, 32767 * gain
+            )
+            self._pyaudio_streams[2].write(
+                audio_data.astype(self._numpy.int16).tobytes()
+            )
+            return
 
-        # Play audio
-        stream = self._pyaudio.open(
-            format=pyaudio.paInt16,
-            channels=2 if self._spatial_audio.enabled else 1,
-            rate=self._sample_rate,
-            output=True,
-        )
+        # PyAudio has no volume control, so keep the bytes for the current gain
+        cached = self._cue_bytes_cache.get(cue.cue_type)
+        if cached is None or cached[0] != gain:
+            pcm = self._cue_pcm_cache.get(cue.cue_type)
+            if pcm is None:
+                pcm = self._render_cue_pcm(cue)
+            cached = (gain, (pcm * gain).astype(self._numpy.int16).tobytes())
+            self._cue_bytes_cache[cue.cue_type] = cached
 
-        stream.write(audio_bytes)
-        stream.stop_stream()
-        stream.close()
+        self._pyaudio_streams[1].write(cached[1])
 
     def _play_winsound_cue(self, cue: AudioCue) -> None:
         """Play audio cue using Windows sound"""
         import winsound
 
-        # Use system beep with frequency
-        frequency = int(cue.frequency)
-        duration = int(cue.duration * 1000)  # Convert to milliseconds
+        # Use system beep with frequency and duration in milliseconds
+        beep = self._cue_beep_cache.get(cue.cue_type)
+        if beep is None:
+            beep = (int(cue.frequency), int(cue.duration * 1000))
 
-        winsound.Beep(frequency, duration)
+        winsound.Beep(*beep)
 
     def _play_oss_cue(self, cue: AudioCue) -> None:
         """Play audio cue using OSS (Linux)"""
@@ -349,108 +521,101 @@ class AudioEngine:
         # Real implementation would generate and write audio data
         pass
 
-    def _generate_audio_data(self, cue: AudioCue, samples: int) -> Any:
-        """Generate audio data for a cue"""
+    def _generate_audio_data(
+        self, cue: AudioCue, samples: int, volume: Optional[float] = None
+    ) -> Any:
+        """Generate audio data for a cue, at the current cue volume by default"""
         try:
             import numpy as np
         except ImportError:
             # Return empty array if numpy not available
             return []
 
-        t = np.linspace(0, cue.duration, samples, False)
+        # Single precision is ample for cue audio and halves memory traffic
+        t = np.arange(samples, dtype=np.float32) * np.float32(1.0 / self._sample_rate)
 
-        if cue.pattern == "tone":
-            # Simple sine wave
-            audio = np.sin(2 * np.pi * cue.frequency * t)
+        angular_frequency = 2 * np.pi * cue.frequency
 
-        elif cue.pattern == "beep":
-            # Sine wave with envelope
-            envelope = np.exp(-t * 5)  # Exponential decay
-            audio = np.sin(2 * np.pi * cue.frequency * t) * envelope
-
-        elif cue.pattern == "click":
-            # Short impulse with decay
-            envelope = np.exp(-t * 50)
-            audio = np.sin(2 * np.pi * cue.frequency * t) * envelope
-
-        elif cue.pattern == "buzz":
+        if cue.pattern == "buzz":
             # Square wave for harsh sound
-            audio = np.sign(np.sin(2 * np.pi * cue.frequency * t))
+            audio = np.sign(np.sin(angular_frequency * t))
 
         elif cue.pattern == "chime":
             # Multiple harmonics
             audio = (
-                np.sin(2 * np.pi * cue.frequency * t)
-                + 0.5 * np.sin(2 * np.pi * cue.frequency * 2 * t)
-                + 0.25 * np.sin(2 * np.pi * cue.frequency * 3 * t)
+                np.sin(angular_frequency * t)
+                + 0.5 * np.sin(angular_frequency * 2 * t)
+                + 0.25 * np.sin(angular_frequency * 3 * t)
             )
-            envelope = np.exp(-t * 3)
-            audio *= envelope
-
-        elif cue.pattern == "tick":
-            # Very short click
-            envelope = np.exp(-t * 100)
-            audio = np.sin(2 * np.pi * cue.frequency * t) * envelope
-
-        elif cue.pattern == "thud":
-            # Low frequency with quick decay
-            envelope = np.exp(-t * 20)
-            audio = np.sin(2 * np.pi * (cue.frequency * 0.5) * t) * envelope
+            audio *= np.exp(-t * 3)
 
         else:
-            # Default to tone
-            audio = np.sin(2 * np.pi * cue.frequency * t)
+            # Sine wave with optional exponential decay, defaulting to tone
+            multiplier, decay = _SINE_PATTERNS.get(cue.pattern, (1.0, 0.0))
+            audio = np.sin((angular_frequency * multiplier) * t)
+            if decay:
+                audio *= np.exp(-t * decay)
+
+        # Fade the edges in and out so the cue does not start or stop with a click
+        fade = _fade_in_ramp()
+        edge = min(len(fade), samples // 2)
+        if edge:
+            audio[:edge] *= fade[:edge]
+            audio[samples - edge :] *= fade[edge - 1 :: -1]
 
         # Apply volume
-        audio *= cue.volume * self._master_volume * self._cue_volume
+        if volume is None:
+            volume = cue.volume * self._master_volume * self._cue_volume
+        audio *= volume
 
-        # Ensure audio is in valid range
-        audio = np.clip(audio, -1.0, 1.0)
+        # Ensure audio is in valid range; every later int16 conversion (cached
+        # PCM and panned spatial cues) relies on this instead of clipping again
+        np.clip(audio, -1.0, 1.0, out=audio)
 
         return audio
 
     def _apply_spatial_audio(
-        self, audio_data: Any, position: Tuple[float, float]
+        self, audio_data: Any, position: Tuple[float, float], scale: float = 1.0
     ) -> Any:
-        """Apply spatial audio effects"""
+        """Apply spatial audio effects, scaling the output by ``scale``"""
         import numpy as np
 
-        x, y = position
-
-        # Calculate distance from center
-        distance = math.sqrt(x * x + y * y)
-
-        # Calculate interaural time difference (ITD)
-        # Simplified model: delay based on horizontal position
-        max_delay_samples = int(self._spatial_audio.max_delay * self._sample_rate)
-        delay_samples = int(x * max_delay_samples)
-
-        # Calculate interaural level difference (ILD)
-        # Simplified model: volume difference based on position
-        left_gain = 1.0 - max(0, x) * 0.5
-        right_gain = 1.0 + min(0, x) * 0.5
-
-        # Apply distance attenuation
-        distance_attenuation = 1.0 / (1.0 + distance * 2.0)
-        left_gain *= distance_attenuation
-        right_gain *= distance_attenuation
-
-        # Create stereo audio
-        stereo_audio = np.zeros((len(audio_data), 2))
-
-        # Left channel
-        if delay_samples > 0:
-            # Delay left channel
-            stereo_audio[delay_samples:, 0] = audio_data[:-delay_samples] * left_gain
-        else:
-            stereo_audio[:, 0] = audio_data * left_gain
-
-        # Right channel
-        if delay_samples < 0:
-            # Delay right channel
-            stereo_audio[-delay_samples:, 1] = audio_data[:delay_samples] * right_gain
-        else:
-            stereo_audio[:, 1] = audio_data * right_gain
+        config = self._spatial_audio
+        left_gain, right_gain, delay_samples = _spatial_coefficients(
+            position[0],
+            position[1],
+            config.head_width / 2 / config.sound_speed * self._sample_rate,
+            config.max_delay * self._sample_rate,
+        )
+        left_gain *= scale
+        right_gain *= scale
+
+        # Create stereo audio in the reusable buffer (only valid until next call)
+        samples = len(audio_data)
+        if self._stereo_scratch is None or len(self._stereo_scratch) < samples:
+            self._stereo_scratch = np.empty((samples, 2), dtype=np.float32)
+        stereo_audio = self._stereo_scratch[:samples]
+
+        # Delay the channel facing away from the source, left for positive x.
+        # Both channels take the same path, the near one with a zero delay.
+        # The fractional part of the delay is linearly interpolated, so the
+        # image moves smoothly rather than in whole-sample steps.
+        channels = (
+            (left_gain, max(delay_samples, 0.0)),
+            (right_gain, max(-delay_samples, 0.0)),
+        )
+        for channel, (gain, channel_delay) in enumerate(channels):
+            delay = min(int(channel_delay), samples)
+            fraction = channel_delay - delay
+            delayed = samples - delay
+
+            stereo_audio[:delay, channel] = 0.0
+            channel_audio = stereo_audio[delay:, channel]
+            np.multiply(
+                audio_data[:delayed], gain * (1.0 - fraction), out=channel_audio
+            )
+            if fraction and delayed > 1:
+                channel_audio[1:] += audio_data[: delayed - 1] * (gain * fraction)
 
         return stereo_audio
 
@@ -463,21 +628,43 @@ class AudioEngine:
         if not self._audio_enabled or cue_type not in self._audio_cues:
             return
 
+        # Drop repeats that arrive faster than the cue's rate limit
+        now = time.monotonic_ns()
+        last = self._last_play_ns.get(cue_type)
+        if last is not None and now - last < self._min_interval_ns.get(cue_type, 0):
+            return
+        self._last_play_ns[cue_type] = now
+
         cue = self._audio_cues[cue_type]
 
         # Override spatial position if provided
         if spatial_position:
             cue.spatial_position = spatial_position
 
-        try:
-            self._audio_queue.put_nowait((cue, spatial_position))
-        except queue.Full:
-            # Queue is full, skip this cue
-            pass
+        if self._audio_module == "winsound":
+            # Beep blocks for the whole cue and has no buffer to stream, so
+            # queueing would only serialise cues; give each its own thread
+            threading.Thread(
+                target=self._play_audio_cue, args=(cue,), daemon=True
+            ).start()
+            return
+
+        self._audio_queue.append((cue, spatial_position))
+        self._audio_wakeup.set()
 
     def set_cue_definition(self, cue_type: AudioCueType, cue: AudioCue) -> None:
         """Set custom audio cue definition"""
         self._audio_cues[cue_type] = cue
+        if cue_type not in self._rate_limit_overrides:
+            self._min_interval_ns[cue_type] = (
+                _DEFAULT_RATE_LIMITS_MS.get(cue.pattern, 0) * 1_000_000
+            )
+        self._cache_cue(cue)
+
+    def set_rate_limit(self, cue_type: AudioCueType, ms: float) -> None:
+        """Set minimum interval in milliseconds between plays of a cue"""
+        self._min_interval_ns[cue_type] = int(max(0.0, ms) * 1_000_000)
+        self._rate_limit_overrides.add(cue_type)
 
     def get_cue_definition(self, cue_type: AudioCueType) -> Optional[AudioCue]:
         """Get audio cue definition"""
@@ -535,6 +722,9 @@ class AudioEngine:
         self._stop_audio_worker()
 
         if hasattr(self, "_pyaudio"):
+            for stream in getattr(self, "_pyaudio_streams", {}).values():
+                stream.stop_stream()
+                stream.close()
             self._pyaudio.terminate()
 
 
@@ -544,8 +734,12 @@ class AudioAccessibilityManager:
     def __init__(self, root: tk.Tk):
         self.root = root
         self.audio_engine = AudioEngine()
-        self._widget_positions: Dict[tk.Widget, Tuple[float, float]] = {}
+        # Normalized widget positions and the root's (x, y, width, height),
+        # kept until geometry changes so cues skip the winfo_* round trips
+        self._widget_positions: Dict[tk.Misc, Tuple[float, float]] = {}
+        self._root_geometry: Optional[Tuple[int, int, int, int]] = None
         self._audio_callbacks: Dict[str, List[Callable]] = {}
+        self._traced_checkbuttons: Set[tk.Misc] = set()
         self._setup_widget_tracking()
 
     def _setup_widget_tracking(self) -> None:
@@ -563,6 +757,10 @@ class AudioAccessibilityManager:
         self.root.bind("<Map>", self._on_window_open, add="+")
         self.root.bind("<Unmap>", self._on_window_close, add="+")
 
+        # Geometry events invalidate cached spatial positions
+        self.root.bind_all("<Configure>", self._on_geometry_change, add="+")
+        self.root.bind_all("<Destroy>", self._on_geometry_change, add="+")
+
     def _on_focus_in(self, event: tk.Event) -> None:
         """Handle focus in event"""
         widget = event.widget
@@ -583,32 +781,53 @@ class AudioAccessibilityManager:
             self.audio_engine.play_cue(AudioCueType.BUTTON_PRESS, spatial_pos)
 
         elif widget_class in ["Checkbutton", "TCheckbutton"]:
-            # Determine if checking or unchecking
-            try:
-                var = widget.cget("variable")
-                if var:
-                    # Check state after the click
-                    widget.after(
-                        10, lambda: self._check_checkbox_state(widget, spatial_pos)
-                    )
-            except tk.TclError:
-                pass
+            # The state flips on release; a variable trace reports it exactly
+            if widget not in self._traced_checkbuttons:
+                self._trace_checkbutton(widget)
 
         # Call custom callbacks
         self._trigger_callbacks("button_press", widget)
 
+    def _trace_checkbutton(self, widget: tk.Misc) -> None:
+        """Play check/uncheck cues whenever a checkbutton's variable is written"""
+        self._traced_checkbuttons.add(widget)
+        try:
+            var_name = str(widget.cget("variable"))
+            on_value = widget.cget("onvalue")
+        except tk.TclError:
+            return
+        if not var_name:
+            return
+
+        def on_write(*args: Any) -> None:
+            self._check_checkbox_state(widget, var_name, on_value)
+
+        trace = ("variable", var_name, "write", widget.register(on_write))
+        widget.tk.call("trace", "add", *trace)
+
+        def on_destroy(event: tk.Event) -> None:
+            # The traced command dies with the widget, so drop the trace too
+            widget.tk.call("trace", "remove", *trace)
+            self._traced_checkbuttons.discard(widget)
+
+        widget.bind("<Destroy>", on_destroy, add="+")
+
     def _check_checkbox_state(
-        self, widget: tk.Misc, spatial_pos: Optional[Tuple[float, float]]
+        self, widget: tk.Misc, var_name: str, on_value: Any
     ) -> None:
         """Check checkbox state and play appropriate cue"""
         try:
-            var = widget.cget("variable")
-            if var and var.get():
-                self.audio_engine.play_cue(AudioCueType.CHECKBOX_CHECK, spatial_pos)
-            else:
-                self.audio_engine.play_cue(AudioCueType.CHECKBOX_UNCHECK, spatial_pos)
+            checked = widget.tk.call(
+                "string", "equal", widget.getvar(var_name), on_value
+            )
         except tk.TclError:
-            pass
+            return
+
+        spatial_pos = self._get_widget_spatial_position(widget)
+        if checked:
+            self.audio_engine.play_cue(AudioCueType.CHECKBOX_CHECK, spatial_pos)
+        else:
+            self.audio_engine.play_cue(AudioCueType.CHECKBOX_UNCHECK, spatial_pos)
 
     def _on_key_press(self, event: tk.Event) -> None:
         """Handle key press event"""
@@ -633,6 +852,11 @@ class AudioAccessibilityManager:
         self.audio_engine.play_cue(AudioCueType.WINDOW_CLOSE)
         self._trigger_callbacks("window_close", event.widget)
 
+    def _on_geometry_change(self, event: tk.Event) -> None:
+        """Forget cached widget positions after a move, resize or destroy"""
+        self._widget_positions.clear()
+        self._root_geometry = None
+
     def _get_widget_spatial_position(
         self, widget: tk.Misc
     ) -> Optional[Tuple[float, float]]:
@@ -640,24 +864,36 @@ class AudioAccessibilityManager:
         if not self.audio_engine.is_spatial_audio_enabled():
             return None
 
+        position = self._widget_positions.get(widget)
+        if position is not None:
+            return position
+
         try:
-            # Get widget position relative to root window
-            x = widget.winfo_rootx() - self.root.winfo_rootx()
-            y = widget.winfo_rooty() - self.root.winfo_rooty()
+            # Get root window position and dimensions
+            if self._root_geometry is None:
+                self._root_geometry = (
+                    self.root.winfo_rootx(),
+                    self.root.winfo_rooty(),
+                    self.root.winfo_width(),
+                    self.root.winfo_height(),
+                )
+            root_x, root_y, root_width, root_height = self._root_geometry
 
-            # Get root window dimensions
-            root_width = self.root.winfo_width()
-            root_height = self.root.winfo_height()
+            # Get widget position relative to root window
+            x = widget.winfo_rootx() - root_x
+            y = widget.winfo_rooty() - root_y
 
             # Normalize to -1.0 to 1.0 range
             norm_x = (x / root_width) * 2.0 - 1.0 if root_width > 0 else 0.0
             norm_y = (y / root_height) * 2.0 - 1.0 if root_height > 0 else 0.0
 
-            return (norm_x, norm_y)
-
         except tk.TclError:
             return None
 
+        position = (norm_x, norm_y)
+        self._widget_positions[widget] = position
+        return position
+
     def _trigger_callbacks(self, event_type: str, *args: Any) -> None:
         """Trigger custom callbacks"""
         for callback in self._audio_callbacks.get(event_type, []):
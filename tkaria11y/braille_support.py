@@ -8,8 +8,9 @@ Provides integration with braille displays for tactile feedback and navigation.
 import tkinter as tk
 import threading
 import time
-import queue
-from typing import Dict, List, Optional, Callable, Any
+import weakref
+from collections import deque
+from typing import Dict, List, Optional, Callable, Any, Deque, Tuple
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
@@ -32,7 +33,7 @@ class BrailleDisplayType(Enum):
     EUROBRAILLE = "eurobraille"
 
 
-@dataclass
+@dataclass(frozen=True)
 class BrailleCell:
     """Represents a single braille cell"""
 
@@ -41,73 +42,106 @@ class BrailleCell:
 
     def __post_init__(self) -> None:
         # Ensure dots is within valid range (0-255)
-        self.dots = max(0, min(255, self.dots))
+        object.__setattr__(self, "dots", max(0, min(255, self.dots)))
 
     def to_unicode(self) -> str:
         """Convert braille cell to Unicode braille character"""
         # Unicode braille patterns start at U+2800
         return chr(0x2800 + self.dots)
 
+    @classmethod
+    def get(cls, dots: int, cursor: bool = False) -> "BrailleCell":
+        """Get the shared cell for a 0-255 dot pattern"""
+        return (_CURSOR_CELL_POOL if cursor else _CELL_POOL)[dots]
+
     @classmethod
     def from_char(cls, char: str) -> "BrailleCell":
         """Create braille cell from character"""
         if not char:
-            return cls(0)
-
-        # Convert character to braille using basic ASCII mapping
-        char = char.upper()
-
-        # Basic braille mapping for common characters
-        braille_map = {
-            "A": 0x01,
-            "B": 0x03,
-            "C": 0x09,
-            "D": 0x19,
-            "E": 0x11,
-            "F": 0x0B,
-            "G": 0x1B,
-            "H": 0x13,
-            "I": 0x0A,
-            "J": 0x1A,
-            "K": 0x05,
-            "L": 0x07,
-            "M": 0x0D,
-            "N": 0x1D,
-            "O": 0x15,
-            "P": 0x0F,
-            "Q": 0x1F,
-            "R": 0x17,
-            "S": 0x0E,
-            "T": 0x1E,
-            "U": 0x25,
-            "V": 0x27,
-            "W": 0x3A,
-            "X": 0x2D,
-            "Y": 0x3D,
-            "Z": 0x35,
-            " ": 0x00,
-            ".": 0x2E,
-            ",": 0x02,
-            "?": 0x26,
-            "!": 0x16,
-            "'": 0x04,
-            "-": 0x24,
-            "(": 0x2F,
-            ")": 0x2F,
-            "0": 0x2A,
-            "1": 0x01,
-            "2": 0x03,
-            "3": 0x09,
-            "4": 0x19,
-            "5": 0x11,
-            "6": 0x0B,
-            "7": 0x1B,
-            "8": 0x13,
-            "9": 0x0A,
-        }
-
-        dots = braille_map.get(char.upper(), 0x3F)  # Default to full cell
-        return cls(dots)
+            return _CELL_POOL[0]
+
+        # Single ASCII characters, the common case, index the table directly
+        code = ord(char[0])
+        if len(char) == 1 and code < 128:
+            return _CELL_POOL[_ASCII_TO_DOTS[code]]
+
+        dots = _BRAILLE_MAP.get(char.upper(), 0x3F)  # Default to full cell
+        return _CELL_POOL[dots]
+
+
+# Basic braille mapping for common characters
+_BRAILLE_MAP: Dict[str, int] = {
+    "A": 0x01,
+    "B": 0x03,
+    "C": 0x09,
+    "D": 0x19,
+    "E": 0x11,
+    "F": 0x0B,
+    "G": 0x1B,
+    "H": 0x13,
+    "I": 0x0A,
+    "J": 0x1A,
+    "K": 0x05,
+    "L": 0x07,
+    "M": 0x0D,
+    "N": 0x1D,
+    "O": 0x15,
+    "P": 0x0F,
+    "Q": 0x1F,
+    "R": 0x17,
+    "S": 0x0E,
+    "T": 0x1E,
+    "U": 0x25,
+    "V": 0x27,
+    "W": 0x3A,
+    "X": 0x2D,
+    "Y": 0x3D,
+    "Z": 0x35,
+    " ": 0x00,
+    ".": 0x2E,
+    ",": 0x02,
+    "?": 0x26,
+    "!": 0x16,
+    "'": 0x04,
+    "-": 0x24,
+    "(": 0x2F,
+    ")": 0x2F,
+    "0": 0x2A,
+    "1": 0x01,
+    "2": 0x03,
+    "3": 0x09,
+    "4": 0x19,
+    "5": 0x11,
+    "6": 0x0B,
+    "7": 0x1B,
+    "8": 0x13,
+    "9": 0x0A,
+}
+
+# Dot patterns for all ASCII codes, lower case included (0x3F for unmapped)
+_ASCII_TO_DOTS = bytes(_BRAILLE_MAP.get(chr(code).upper(), 0x3F) for code in range(128))
+
+
+class _DotsTranslation(Dict[int, str]):
+    """str.translate table mapping characters to chr(dot pattern)"""
+
+    def __missing__(self, code: int) -> str:
+        # Non-ASCII characters are resolved like from_char and remembered
+        dots = chr(_BRAILLE_MAP.get(chr(code).upper(), 0x3F))
+        self[code] = dots
+        return dots
+
+
+_CHAR_TO_DOTS = _DotsTranslation(
+    (code, chr(dots)) for code, dots in enumerate(_ASCII_TO_DOTS)
+)
+
+# str.translate table mapping chr(dot pattern) to its Unicode braille character
+_DOTS_TO_UNICODE = {dots: 0x2800 + dots for dots in range(256)}
+
+# Shared cells for every dot pattern, so lookups do not allocate
+_CELL_POOL = tuple(BrailleCell(dots) for dots in range(256))
+_CURSOR_CELL_POOL = tuple(BrailleCell(dots, True) for dots in range(256))
 
 
 class BrailleDisplay(ABC):
@@ -117,8 +151,13 @@ class BrailleDisplay(ABC):
         self.display_type = display_type
         self.cell_count = cell_count
         self.connected = False
-        self._cells: List[BrailleCell] = [BrailleCell(0) for _ in range(cell_count)]
+        # Cell state as parallel byte buffers (dot patterns and cursor flags)
+        self._dots = bytearray(cell_count)
+        self._cursor = bytearray(cell_count)
         self._cursor_position = 0
+        # Buffer contents as of the last write sent to the display
+        self._last_sent_dots = b""
+        self._last_sent_cursor = b""
         self._callbacks: Dict[str, List[Callable]] = {
             "key_press": [],
             "routing_key": [],
@@ -145,27 +184,62 @@ class BrailleDisplay(ABC):
         """Read pressed keys from display"""
         pass
 
+    @property
+    def _cells(self) -> List[BrailleCell]:
+        """Snapshot of the display buffer as braille cells"""
+        return [
+            _CURSOR_CELL_POOL[dots] if cursor else _CELL_POOL[dots]
+            for dots, cursor in zip(self._dots, self._cursor)
+        ]
+
+    def _store_cells(self, cells: List[BrailleCell], start_pos: int) -> None:
+        """Copy cells into the display buffer, dropping any past the end"""
+        end = min(start_pos + len(cells), self.cell_count)
+        if start_pos < end:
+            cells = cells[: end - start_pos]
+            self._dots[start_pos:end] = bytes([cell.dots for cell in cells])
+            self._cursor[start_pos:end] = bytes([cell.cursor for cell in cells])
+
+    def _dirty_range(self) -> Optional[Tuple[int, int]]:
+        """Get the cell range changed since the last send, recording it as sent"""
+        dots, cursor = bytes(self._dots), bytes(self._cursor)
+        last_dots, last_cursor = self._last_sent_dots, self._last_sent_cursor
+        if dots == last_dots and cursor == last_cursor:
+            return None
+
+        if len(last_dots) != self.cell_count:
+            # Nothing sent since connecting, so the whole display is stale
+            lo, hi = 0, self.cell_count
+        else:
+            changed = [
+                i
+                for i in range(self.cell_count)
+                if dots[i] != last_dots[i] or cursor[i] != last_cursor[i]
+            ]
+            lo, hi = changed[0], changed[-1] + 1
+
+        self._last_sent_dots = dots
+        self._last_sent_cursor = cursor
+        return lo, hi
+
     def set_text(self, text: str, start_pos: int = 0) -> None:
         """Set text on braille display"""
-        cells = []
-        for i, char in enumerate(text):
-            if start_pos + i >= self.cell_count:
-                break
-            cells.append(BrailleCell.from_char(char))
+        # Translate the part of the text that fits in one C-level pass
+        visible = text[: max(0, self.cell_count - start_pos)]
+        dots = visible.translate(_CHAR_TO_DOTS).encode("latin-1")
 
-        self.write_cells(cells, start_pos)
+        self.write_cells([_CELL_POOL[d] for d in dots], start_pos)
 
     def set_cursor_position(self, position: int) -> None:
         """Set cursor position on display"""
         if 0 <= position < self.cell_count:
             # Clear old cursor
-            if 0 <= self._cursor_position < len(self._cells):
-                self._cells[self._cursor_position].cursor = False
+            if 0 <= self._cursor_position < self.cell_count:
+                self._cursor[self._cursor_position] = 0
 
             # Set new cursor
             self._cursor_position = position
-            if position < len(self._cells):
-                self._cells[position].cursor = True
+            self._cursor[position] = 1
 
             # Update display
             self.write_cells(self._cells)
@@ -212,29 +286,27 @@ class GenericBrailleDisplay(BrailleDisplay):
         """Disconnect from braille display"""
         self.connected = False
         self._simulated_text = ""
+        self._last_sent_dots = b""
+        self._last_sent_cursor = b""
 
     def write_cells(self, cells: List[BrailleCell], start_pos: int = 0) -> bool:
         """Write cells to display"""
         if not self.connected:
             return False
 
-        # Update internal cell buffer
-        for i, cell in enumerate(cells):
-            pos = start_pos + i
-            if pos < len(self._cells):
-                self._cells[pos] = cell
+        # Update internal cell buffer, sending only the cells that changed
+        self._store_cells(cells, start_pos)
+        dirty = self._dirty_range()
+        if dirty is None:
+            return True
 
-        # In simulation mode, convert to text
+        # In simulation mode, render the changed cells as Unicode braille
         if self._simulation_mode:
-            text_chars = []
-            for cell in self._cells:
-                if cell.dots == 0:
-                    text_chars.append(" ")
-                else:
-                    # Convert back to approximate character
-                    text_chars.append(self._dots_to_char(cell.dots))
-
-            self._simulated_text = "".join(text_chars)
+            lo, hi = dirty
+            changed = self._dots[lo:hi].decode("latin-1").translate(_DOTS_TO_UNICODE)
+            self._simulated_text = (
+                self._simulated_text[:lo] + changed + self._simulated_text[hi:]
+            )
 
         return True
 
@@ -247,49 +319,6 @@ class GenericBrailleDisplay(BrailleDisplay):
         """Get simulated braille text (for testing)"""
         return self._simulated_text
 
-    def _dots_to_char(self, dots: int) -> str:
-        """Convert dot pattern back to character (approximate)"""
-        # Reverse mapping for common patterns (letters take precedence)
-        reverse_map = {
-            0x01: "A",
-            0x03: "B",
-            0x09: "C",
-            0x19: "D",
-            0x11: "E",
-            0x0B: "F",
-            0x1B: "G",
-            0x13: "H",
-            0x0A: "I",
-            0x1A: "J",
-            0x05: "K",
-            0x07: "L",
-            0x0D: "M",
-            0x1D: "N",
-            0x15: "O",
-            0x0F: "P",
-            0x1F: "Q",
-            0x17: "R",
-            0x0E: "S",
-            0x1E: "T",
-            0x25: "U",
-            0x27: "V",
-            0x3A: "W",
-            0x2D: "X",
-            0x3D: "Y",
-            0x35: "Z",
-            0x00: " ",
-            0x2E: ".",
-            0x02: ",",
-            0x26: "?",
-            0x16: "!",
-            0x04: "'",
-            0x24: "-",
-            0x2F: "(",
-            0x2A: "0",
-        }
-
-        return reverse_map.get(dots, "?")
-
 
 class BrailleManager:
     """Manages braille display integration"""
@@ -297,11 +326,20 @@ class BrailleManager:
     def __init__(self) -> None:
         self._displays: List[BrailleDisplay] = []
         self._active_display: Optional[BrailleDisplay] = None
-        self._text_queue: queue.Queue = queue.Queue()
+        # Text waiting for the worker. deque append/popleft are atomic, so
+        # updates change hands without a queue lock.
+        self._text_queue: Deque[Tuple[str, int]] = deque()
+        self._text_wakeup = threading.Event()
         self._worker_thread: Optional[threading.Thread] = None
         self._running = False
         self._focus_tracking = True
         self._current_widget: Optional[tk.Misc] = None
+        # Tk classes of widgets seen so far (a widget's class never changes)
+        self._widget_classes: "weakref.WeakKeyDictionary[tk.Misc, str]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Widgets without a "text" option, so cget("text") is not retried
+        self._textless_widgets: "weakref.WeakSet[tk.Misc]" = weakref.WeakSet()
 
         # Braille translation settings
         self._grade = 1  # Grade 1 (uncontracted) braille
@@ -309,6 +347,18 @@ class BrailleManager:
         self._cursor_blink = True
         self._cursor_blink_rate = 0.5  # seconds
 
+        # Navigation keys reported by braille displays
+        self._key_handlers: Dict[str, Callable[[], None]] = {
+            "left": self._pan_left,
+            "pan_left": self._pan_left,
+            "right": self._pan_right,
+            "pan_right": self._pan_right,
+            "up": self._move_cursor_up,
+            "cursor_up": self._move_cursor_up,
+            "down": self._move_cursor_down,
+            "cursor_down": self._move_cursor_down,
+        }
+
         # Auto-detection
         self._auto_detect_displays()
 
@@ -376,6 +426,7 @@ class BrailleManager:
     def _stop_worker_thread(self) -> None:
         """Stop worker thread"""
         self._running = False
+        self._text_wakeup.set()
         if self._worker_thread:
             self._worker_thread.join(timeout=1.0)
 
@@ -385,13 +436,22 @@ class BrailleManager:
         cursor_visible = True
 
         while self._running and self._active_display:
+            display = self._active_display
             try:
-                # Process text queue
-                try:
-                    text, position = self._text_queue.get_nowait()
-                    self._active_display.set_text(text, position)
-                except queue.Empty:
-                    pass
+                # Wait for text, but no longer than the next key poll (100ms)
+                # or cursor blink
+                timeout = 0.1
+                if self._cursor_blink and self._show_cursor:
+                    next_blink = cursor_blink_time + self._cursor_blink_rate
+                    timeout = max(0.0, min(timeout, next_blink - time.time()))
+
+                # Process text queue, draining whatever arrived meanwhile
+                self._text_wakeup.wait(timeout)
+                self._text_wakeup.clear()
+                pending: List[Tuple[str, int]] = []
+                while self._text_queue:
+                    pending.append(self._text_queue.popleft())
+                self._write_pending_text(pending)
 
                 # Handle cursor blinking
                 if self._cursor_blink and self._show_cursor:
@@ -401,47 +461,47 @@ class BrailleManager:
                         cursor_blink_time = current_time
 
                         # Update cursor visibility
-                        if hasattr(self._active_display, "_cursor_position"):
-                            pos = self._active_display._cursor_position
-                            if 0 <= pos < len(self._active_display._cells):
-                                self._active_display._cells[pos].cursor = cursor_visible
-                                self._active_display.write_cells(
-                                    self._active_display._cells
-                                )
+                        pos = display._cursor_position
+                        if 0 <= pos < display.cell_count:
+                            display._cursor[pos] = cursor_visible
+                            display.write_cells(display._cells)
 
                 # Read input from display
-                keys = self._active_display.read_keys()
+                keys = display.read_keys()
                 for key in keys:
                     self._handle_braille_key(key)
 
-                time.sleep(0.1)  # 100ms update rate
-
             except Exception:
                 # Continue on errors
                 time.sleep(0.1)
 
+    def _write_pending_text(self, pending: List[Tuple[str, int]]) -> None:
+        """Write queued texts in order, skipping any a later text overwrites"""
+        display = self._active_display
+        if not display:
+            return
+
+        for i, (text, position) in enumerate(pending):
+            end = min(position + len(text), display.cell_count)
+            if not any(
+                later_position <= position
+                and min(later_position + len(later_text), display.cell_count) >= end
+                for later_text, later_position in pending[i + 1 :]
+            ):
+                display.set_text(text, position)
+
     def _handle_braille_key(self, key: str) -> None:
         """Handle key press from braille display"""
         # Handle common braille display keys
-        if key.startswith("routing_"):
+        handler = self._key_handlers.get(key)
+        if handler:
+            handler()
+        else:
             # Cursor routing key pressed
-            try:
-                position = int(key.split("_")[1])
-                self._handle_cursor_routing(position)
-            except (ValueError, IndexError):
-                pass
-
-        elif key in ["left", "pan_left"]:
-            self._pan_left()
-
-        elif key in ["right", "pan_right"]:
-            self._pan_right()
-
-        elif key in ["up", "cursor_up"]:
-            self._move_cursor_up()
-
-        elif key in ["down", "cursor_down"]:
-            self._move_cursor_down()
+            prefix, _, position = key.partition("_")
+            # isdigit would also accept digits like "²" that int() rejects
+            if prefix == "routing" and position.isdecimal():
+                self._handle_cursor_routing(int(position))
 
         # Trigger callbacks
         if self._active_display:
@@ -482,11 +542,8 @@ class BrailleManager:
     def display_text(self, text: str, position: int = 0) -> None:
         """Display text on braille display"""
         if self._active_display:
-            try:
-                self._text_queue.put_nowait((text, position))
-            except queue.Full:
-                # Queue is full, skip this update
-                pass
+            self._text_queue.append((text, position))
+            self._text_wakeup.set()
 
     def display_widget_info(self, widget: tk.Misc) -> None:
         """Display widget information on braille display"""
@@ -503,14 +560,16 @@ class BrailleManager:
             text_parts.append(widget.accessible_name)
         else:
             # Fallback to widget text or class
-            try:
-                widget_text = widget.cget("text")
-                if widget_text:
-                    text_parts.append(widget_text)
-                else:
-                    text_parts.append(widget.winfo_class())
-            except tk.TclError:
-                text_parts.append(widget.winfo_class())
+            widget_text = ""
+            if widget not in self._textless_widgets:
+                try:
+                    widget_text = widget.cget("text")
+                except tk.TclError:
+                    self._textless_widgets.add(widget)
+            if widget_text:
+                text_parts.append(widget_text)
+            else:
+                text_parts.append(self._get_widget_class(widget))
 
         # Add role information
         if hasattr(widget, "accessible_role") and widget.accessible_role:
@@ -533,12 +592,24 @@ class BrailleManager:
         braille_text = " ".join(text_parts)
         self.display_text(braille_text)
 
+    def _get_widget_class(self, widget: tk.Misc) -> str:
+        """Get widget class, asking Tcl only the first time"""
+        try:
+            return self._widget_classes[widget]
+        except KeyError:
+            widget_class = widget.winfo_class()
+            self._widget_classes[widget] = widget_class
+            return widget_class
+        except TypeError:
+            # Not weakly referenceable, so it cannot be cached
+            return widget.winfo_class()
+
     def _get_widget_state_for_braille(self, widget: tk.Misc) -> str:
         """Get widget state information for braille display"""
         states = []
 
         try:
-            widget_class = widget.winfo_class()
+            widget_class = self._get_widget_class(widget)
 
             # Check common states
             state = widget.cget("state")
@@ -628,15 +699,26 @@ def setup_braille_support(root: tk.Tk) -> None:
 
     root.bind_all("<FocusIn>", on_focus_change, add="+")
 
-    # Set up text change tracking for input widgets
+    # Set up text change tracking for input widgets, debounced so a burst of
+    # keystrokes only shows the latest text
+    pending_text_update: Optional[str] = None
+
+    def show_widget_text(widget: Any) -> None:
+        nonlocal pending_text_update
+        pending_text_update = None
+        try:
+            text = widget.get()
+            braille_manager.display_text(text)
+        except (tk.TclError, TypeError):
+            pass
+
     def on_text_change(event: tk.Event) -> None:
+        nonlocal pending_text_update
         widget = event.widget
         if hasattr(widget, "get") and braille_manager.is_focus_tracking_enabled():
-            try:
-                text = widget.get()
-                braille_manager.display_text(text)
-            except (tk.TclError, TypeError):
-                pass
+            if pending_text_update is not None:
+                root.after_cancel(pending_text_update)
+            pending_text_update = root.after(50, show_widget_text, widget)
 
     root.bind_all("<KeyRelease>", on_text_change, add="+")
 
@@ -7,9 +7,7 @@ around CTK's limitations with traditional event binding.
 """
 
 import tkinter as tk
-from typing import List, Optional, Dict, Callable
-import threading
-import time
+from typing import Any, List, Optional, Dict, Callable, Tuple
 import weakref
 
 try:
@@ -19,6 +17,9 @@ try:
 except ImportError:
     CTK_AVAILABLE = False
 
+# Errors Tk and CTK raise for unsupported options or destroyed widgets
+_WIDGET_ERRORS = (tk.TclError, AttributeError, TypeError, ValueError)
+
 
 class CTKFocusIndicator:
     """Visual focus indicator specifically for CustomTkinter widgets"""
@@ -28,30 +29,44 @@ class CTKFocusIndicator:
         self._current_widget: Optional[tk.Misc] = None
         self._indicator_color = "#FFD700"  # Gold color for high visibility
         self._indicator_width = 3
+        # Widget, color and width of the highlighting currently applied
+        self._applied: Optional[Tuple[tk.Misc, str, int]] = None
+
+        # Use widget highlighting instead of overlay canvas. Weakly keyed so
+        # destroyed widgets are not kept alive.
+        self._original_properties: (
+            "weakref.WeakKeyDictionary[tk.Misc, Dict[str, Any]]"
+        ) = weakref.WeakKeyDictionary()
+
+    def store_original_properties(self, widget: tk.Misc) -> None:
+        """Remember the border a widget has before any focus highlighting"""
+        if widget in self._original_properties:
+            return
 
-        # Use widget highlighting instead of overlay canvas
-        self._original_properties: Dict[tk.Misc, Dict[str, any]] = {}
+        self._original_properties[widget] = {}
+
+        # Try to get original border properties
+        try:
+            if hasattr(widget, "cget"):
+                self._original_properties[widget] = {
+                    "border_width": widget.cget("border_width"),
+                    "border_color": widget.cget("border_color"),
+                }
+        except _WIDGET_ERRORS:
+            pass
 
     def show_focus(self, widget: tk.Misc) -> None:
         """Show focus indicator for CustomTkinter widget"""
         self._current_widget = widget
 
-        try:
-            # Store original properties if not already stored
-            if widget not in self._original_properties:
-                self._original_properties[widget] = {}
+        # Nothing to do if this highlighting is already applied
+        applied = (widget, self._indicator_color, self._indicator_width)
+        if self._applied == applied:
+            return
 
-                # Try to get original border properties
-                try:
-                    if hasattr(widget, "cget"):
-                        self._original_properties[widget]["border_width"] = widget.cget(
-                            "border_width"
-                        )
-                        self._original_properties[widget]["border_color"] = widget.cget(
-                            "border_color"
-                        )
-                except:
-                    pass
+        try:
+            # Store original properties if not already stored at registration
+            self.store_original_properties(widget)
 
             # Apply focus highlighting using CTK's border system
             try:
@@ -60,7 +75,8 @@ class CTKFocusIndicator:
                         border_width=self._indicator_width,
                         border_color=self._indicator_color,
                     )
-            except:
+                    self._applied = applied
+            except _WIDGET_ERRORS:
                 # Fallback: try to use standard Tkinter highlighting
                 try:
                     widget.configure(
@@ -68,9 +84,10 @@ class CTKFocusIndicator:
                         highlightcolor=self._indicator_color,
                         highlightbackground=self._indicator_color,
                     )
-                except:
+                    self._applied = applied
+                except _WIDGET_ERRORS:
                     pass
-        except:
+        except _WIDGET_ERRORS:
             pass
 
     def hide_focus(self) -> None:
@@ -81,27 +98,22 @@ class CTKFocusIndicator:
                 original = self._original_properties[self._current_widget]
 
                 if hasattr(self._current_widget, "configure"):
-                    # Restore CTK border properties
-                    if "border_width" in original:
-                        self._current_widget.configure(
-                            border_width=original["border_width"]
-                        )
-                    if "border_color" in original:
-                        self._current_widget.configure(
-                            border_color=original["border_color"]
-                        )
+                    # Restore CTK border properties in one call
+                    if original:
+                        self._current_widget.configure(**original)
 
                     # Also try to reset standard highlighting
                     try:
                         self._current_widget.configure(
                             highlightthickness=0, highlightcolor="SystemWindowFrame"
                         )
-                    except:
+                    except _WIDGET_ERRORS:
                         pass
-            except:
+            except _WIDGET_ERRORS:
                 pass
 
         self._current_widget = None
+        self._applied = None
 
     def update_focus(self) -> None:
         """Update focus indicator position"""
@@ -120,58 +132,46 @@ class CTKFocusManager:
 
     def __init__(self, root: tk.Tk):
         self.root = root
-        self._focus_order: List[tk.Misc] = []
+        # Weak references, so widgets drop out of the order once collected
+        self._focus_order: List[weakref.ref] = []
+        # Index of each registered widget in _focus_order, keyed by id()
+        self._focus_positions: Dict[int, int] = {}
         self._current_focus_index = 0
+        # id() of the widget Tk last reported as focused, None when focus left it
+        self._focused_id: Optional[int] = None
         self._focus_indicator = CTKFocusIndicator(root)
-        self._focus_callbacks: Dict[tk.Misc, List[Callable]] = {}
+        self._focus_callbacks: "weakref.WeakKeyDictionary[tk.Misc, List[Callable]]" = (
+            weakref.WeakKeyDictionary()
+        )
         self._monitoring = True
 
-        # Track widgets using weak references
-        self._widget_refs: weakref.WeakSet = weakref.WeakSet()
-
-        # Start focus monitoring thread
-        self._monitor_thread = threading.Thread(target=self._monitor_focus, daemon=True)
-        self._monitor_thread.start()
-
-        # Set up keyboard navigation
+        # Set up keyboard navigation and focus tracking
         self._setup_keyboard_navigation()
 
     def _setup_keyboard_navigation(self) -> None:
         """Set up keyboard navigation for CTK widgets"""
-        # Bind to root window since CTK widgets don't support individual binding
+        # Tab traversal is left to Tk and the main focus manager, and arrow keys
+        # are bound on each registered widget in register_widget
         try:
-            self.root.bind_all("<Tab>", self._handle_tab, add="+")
-            self.root.bind_all("<Shift-Tab>", self._handle_shift_tab, add="+")
-            self.root.bind_all("<Up>", self._handle_up_arrow, add="+")
-            self.root.bind_all("<Down>", self._handle_down_arrow, add="+")
-            self.root.bind_all("<Left>", self._handle_left_arrow, add="+")
-            self.root.bind_all("<Right>", self._handle_right_arrow, add="+")
-        except:
+            # Follow focus changes as Tk reports them
+            self.root.bind_all("<FocusIn>", self._handle_focus_in, add="+")
+            self.root.bind_all("<FocusOut>", self._handle_focus_out, add="+")
+        except tk.TclError:
             pass
 
-    def _monitor_focus(self) -> None:
-        """Monitor focus changes across all registered widgets"""
-        last_focused_widget = None
-
-        while self._monitoring:
-            try:
-                # Get currently focused widget
-                current_focus = self.root.focus_get()
-
-                if current_focus != last_focused_widget:
-                    # Focus changed
-                    if last_focused_widget:
-                        self._on_widget_focus_lost(last_focused_widget)
-
-                    if current_focus and current_focus in self._focus_order:
-                        self._on_widget_focus_gained(current_focus)
-                        self._update_focus_index(current_focus)
-
-                    last_focused_widget = current_focus
+    def _handle_focus_in(self, event: tk.Event) -> None:
+        """Handle FocusIn event"""
+        widget = event.widget
+        self._focused_id = id(widget)
+        if self._monitoring and id(widget) in self._focus_positions:
+            self._on_widget_focus_gained(widget)
+            self._update_focus_index(widget)
 
-                time.sleep(0.1)  # Check every 100ms
-            except:
-                break
+    def _handle_focus_out(self, event: tk.Event) -> None:
+        """Handle FocusOut event"""
+        self._focused_id = None
+        if self._monitoring:
+            self._on_widget_focus_lost(event.widget)
 
     def _on_widget_focus_gained(self, widget: tk.Misc) -> None:
         """Handle when a widget gains focus"""
@@ -183,7 +183,7 @@ class CTKFocusManager:
             for callback in self._focus_callbacks[widget]:
                 try:
                     callback()
-                except:
+                except Exception:
                     pass
 
     def _on_widget_focus_lost(self, widget: tk.Misc) -> None:
@@ -195,18 +195,38 @@ class CTKFocusManager:
         self, widget: tk.Misc, focus_group: Optional[str] = None
     ) -> None:
         """Register a CustomTkinter widget for focus management"""
-        if widget not in self._focus_order:
-            self._focus_order.append(widget)
-            self._widget_refs.add(widget)
+        if id(widget) not in self._focus_positions:
+            self._focus_positions[id(widget)] = len(self._focus_order)
+            self._focus_order.append(weakref.ref(widget, self._remove_from_order))
+            self._focus_indicator.store_original_properties(widget)
+            try:
+                widget.bind("<Up>", self._handle_up_arrow, add="+")
+                widget.bind("<Down>", self._handle_down_arrow, add="+")
+            except _WIDGET_ERRORS:
+                pass
 
     def unregister_widget(self, widget: tk.Misc) -> None:
         """Unregister a widget from focus management"""
-        if widget in self._focus_order:
-            self._focus_order.remove(widget)
+        position = self._focus_positions.get(id(widget))
+        if position is not None:
+            self._remove_from_order(self._focus_order[position])
 
         if widget in self._focus_callbacks:
             del self._focus_callbacks[widget]
 
+    def _remove_from_order(self, ref: weakref.ref) -> None:
+        """Remove a widget reference from the focus order and reindex it"""
+        try:
+            self._focus_order.remove(ref)
+        except ValueError:
+            return
+
+        self._focus_positions = {}
+        for index, other in enumerate(self._focus_order):
+            widget = other()
+            if widget is not None:
+                self._focus_positions[id(widget)] = index
+
     def add_focus_callback(self, widget: tk.Misc, callback: Callable) -> None:
         """Add a callback to be called when widget receives focus"""
         if widget not in self._focus_callbacks:
@@ -252,50 +272,36 @@ class CTKFocusManager:
     def _focus_widget_at_index(self, index: int) -> bool:
         """Focus widget at specific index"""
         if 0 <= index < len(self._focus_order):
-            widget = self._focus_order[index]
+            widget = self._focus_order[index]()
+            if widget is None:
+                return False
             try:
                 widget.focus_set()
                 return True
-            except:
+            except _WIDGET_ERRORS:
                 return False
         return False
 
     def _update_focus_index(self, widget: tk.Misc) -> None:
         """Update current focus index based on focused widget"""
-        try:
-            self._current_focus_index = self._focus_order.index(widget)
-        except ValueError:
-            pass
+        self._current_focus_index = self._focus_positions.get(
+            id(widget), self._current_focus_index
+        )
 
     def get_current_focus(self) -> Optional[tk.Misc]:
         """Get currently focused widget"""
         try:
             return self.root.focus_get()
-        except:
+        except (KeyError, tk.TclError):
+            # focus_get raises KeyError for Tk-internal widgets like popdowns
             return None
 
     # Event handlers for keyboard navigation
-    def _handle_tab(self, event: tk.Event) -> str:
-        """Handle Tab key press"""
-        # Only handle if focus is on a registered CTK widget
-        current_focus = self.get_current_focus()
-        if current_focus in self._focus_order:
-            if self.focus_next():
-                return "break"
-        return ""
-
-    def _handle_shift_tab(self, event: tk.Event) -> str:
-        """Handle Shift+Tab key press"""
-        current_focus = self.get_current_focus()
-        if current_focus in self._focus_order:
-            if self.focus_previous():
-                return "break"
-        return ""
-
     def _handle_up_arrow(self, event: tk.Event) -> str:
         """Handle Up arrow key press"""
-        current_focus = self.get_current_focus()
-        if current_focus in self._focus_order:
+        # Only handle while the widget is still registered, as tracked from
+        # FocusIn/FocusOut since bindings are not removed on unregister
+        if self._focused_id in self._focus_positions:
             # For CTK widgets, up arrow can also navigate
             if self.focus_previous():
                 return "break"
@@ -303,23 +309,12 @@ class CTKFocusManager:
 
     def _handle_down_arrow(self, event: tk.Event) -> str:
         """Handle Down arrow key press"""
-        current_focus = self.get_current_focus()
-        if current_focus in self._focus_order:
+        if self._focused_id in self._focus_positions:
             # For CTK widgets, down arrow can also navigate
             if self.focus_next():
                 return "break"
         return ""
 
-    def _handle_left_arrow(self, event: tk.Event) -> str:
-        """Handle Left arrow key press"""
-        # Let the widget handle this normally
-        return ""
-
-    def _handle_right_arrow(self, event: tk.Event) -> str:
-        """Handle Right arrow key press"""
-        # Let the widget handle this normally
-        return ""
-
     def destroy(self) -> None:
         """Clean up the focus manager"""
         self._monitoring = False
@@ -8,8 +8,8 @@ that work around CTK's limitations with traditional event binding.
 
 import tkinter as tk
 from typing import Optional, Callable, Any, Dict
-import threading
-import time
+import weakref
+from functools import lru_cache
 
 try:
     import customtkinter as ctk
@@ -49,8 +49,52 @@ except ImportError:
 
 
 from .a11y_engine import speak
+from .focus_manager import get_focus_manager
 from .platform_adapter import set_accessible_name, set_accessible_description
 
+# Errors Tk and CTK raise for unsupported options or destroyed widgets
+_WIDGET_ERRORS = (tk.TclError, AttributeError, TypeError, ValueError)
+
+# Accessible CTK widgets following focus, and the roots whose focus events
+# are routed to them
+_focus_tracked_widgets: weakref.WeakSet = weakref.WeakSet()
+_focus_tracked_roots: weakref.WeakSet = weakref.WeakSet()
+
+
+def _dispatch_focus_in(event: tk.Event) -> None:
+    """Tell an accessible CTK widget it gained focus"""
+    widget: Any = event.widget
+    if widget in _focus_tracked_widgets and not widget._has_focus:
+        widget._on_focus_gained()
+
+
+def _dispatch_focus_out(event: tk.Event) -> None:
+    """Tell an accessible CTK widget it lost focus"""
+    widget: Any = event.widget
+    if widget in _focus_tracked_widgets and widget._has_focus:
+        widget._on_focus_lost()
+
+
+@lru_cache(maxsize=None)
+def _widget_type_announcement(class_name: str) -> str:
+    """Get the spoken widget type for an accessible CTK widget class"""
+    if "Button" in class_name:
+        return "button"
+    elif "Entry" in class_name:
+        return "text field"
+    elif "Label" in class_name:
+        return "label"
+    elif "CheckBox" in class_name:
+        return "checkbox"
+    elif "RadioButton" in class_name:
+        return "radio button"
+    elif "Slider" in class_name:
+        return "slider"
+    elif "Frame" in class_name:
+        return "group"
+    else:
+        return "control"
+
 
 class CTKAccessibilityMixin:
     """Accessibility mixin specifically designed for CustomTkinter widgets"""
@@ -67,12 +111,26 @@ class CTKAccessibilityMixin:
         # Set up accessibility features
         self._setup_ctk_accessibility()
 
+        # Announcement parts fixed at construction: the accessible name with the
+        # widget type (None when the name comes from the widget text) and the
+        # description
+        self._announcement_prefix: Optional[str] = None
+        if self.accessible_name:
+            self._announcement_prefix = ", ".join(
+                filter(
+                    None, (self.accessible_name, self._get_widget_type_announcement())
+                )
+            )
+        self._announcement_suffix = self.accessible_description
+        # Cleared once the widget turns out not to have a state option
+        self._supports_state = True
+
         # Focus tracking
         self._has_focus = False
         self._focus_callbacks: list[Callable] = []
 
-        # Manual event simulation since CTK doesn't support binding
-        self._setup_manual_events()
+        # Follow focus through the shared root-level focus events
+        self._setup_focus_tracking()
 
         # Register with focus manager
         self._register_with_focus_manager()
@@ -82,51 +140,28 @@ class CTKAccessibilityMixin:
         if self.accessible_name:
             try:
                 set_accessible_name(self, self.accessible_name)
-            except:
+            except Exception:
                 pass
 
         if self.accessible_description:
             try:
                 set_accessible_description(self, self.accessible_description)
-            except:
+            except Exception:
                 pass
 
-    def _setup_manual_events(self) -> None:
-        """Set up manual event handling since CTK doesn't support traditional binding"""
-        # Start a background thread to monitor focus changes
-        self._monitoring = True
-        self._monitor_thread = threading.Thread(target=self._monitor_focus, daemon=True)
-        self._monitor_thread.start()
-
-    def _monitor_focus(self) -> None:
-        """Monitor focus changes manually"""
-        last_focus_state = False
-
-        while self._monitoring:
-            try:
-                # Check if this widget has focus
-                current_focus = self._check_focus()
-
-                if current_focus != last_focus_state:
-                    if current_focus:
-                        self._on_focus_gained()
-                    else:
-                        self._on_focus_lost()
-                    last_focus_state = current_focus
-
-                time.sleep(0.1)  # Check every 100ms
-            except:
-                break
-
-    def _check_focus(self) -> bool:
-        """Check if this widget currently has focus"""
+    def _setup_focus_tracking(self) -> None:
+        """Route focus changes to this widget, since CTK doesn't support binding"""
+        # Focus changes reach this widget through one root-level binding shared
+        # by all accessible CTK widgets
+        _focus_tracked_widgets.add(self)
         try:
-            # For CTK widgets, we need to check focus differently
-            root = self.winfo_toplevel()
-            focused_widget = root.focus_get()
-            return focused_widget == self
-        except:
-            return False
+            root = self._root()  # type: ignore
+            if root not in _focus_tracked_roots:
+                root.bind_all("<FocusIn>", _dispatch_focus_in, add="+")
+                root.bind_all("<FocusOut>", _dispatch_focus_out, add="+")
+                _focus_tracked_roots.add(root)
+        except tk.TclError:
+            pass
 
     def _on_focus_gained(self) -> None:
         """Handle focus gained event"""
@@ -141,7 +176,7 @@ class CTKAccessibilityMixin:
         for callback in self._focus_callbacks:
             try:
                 callback()
-            except:
+            except Exception:
                 pass
 
     def _on_focus_lost(self) -> None:
@@ -150,82 +185,51 @@ class CTKAccessibilityMixin:
 
     def _get_focus_announcement(self) -> str:
         """Get announcement text when widget receives focus"""
-        parts = []
-
-        # Widget name
-        if self.accessible_name:
-            parts.append(self.accessible_name)
-        elif hasattr(self, "cget"):
-            try:
-                text = self.cget("text")
-                if text:
-                    parts.append(text)
-            except:
-                pass
-
-        # Widget type
-        widget_type = self._get_widget_type_announcement()
-        if widget_type:
-            parts.append(widget_type)
+        prefix = self._announcement_prefix
+        if prefix is None:
+            # Without an accessible name, the widget is named by its current text
+            text = None
+            if hasattr(self, "cget"):
+                try:
+                    text = self.cget("text")
+                except _WIDGET_ERRORS:
+                    pass
+            prefix = ", ".join(
+                filter(None, (text, self._get_widget_type_announcement()))
+            )
 
-        # Widget state
+        # Only the widget state changes between announcements
         state = self._get_state_announcement()
-        if state:
-            parts.append(state)
-
-        # Description
-        if self.accessible_description:
-            parts.append(self.accessible_description)
-
-        return ", ".join(parts)
+        return ", ".join(filter(None, (prefix, state, self._announcement_suffix)))
 
     def _get_widget_type_announcement(self) -> str:
         """Get widget type for announcement"""
-        class_name = self.__class__.__name__
-
-        if "Button" in class_name:
-            return "button"
-        elif "Entry" in class_name:
-            return "text field"
-        elif "Label" in class_name:
-            return "label"
-        elif "CheckBox" in class_name:
-            return "checkbox"
-        elif "RadioButton" in class_name:
-            return "radio button"
-        elif "Slider" in class_name:
-            return "slider"
-        elif "Frame" in class_name:
-            return "group"
-        else:
-            return "control"
+        # The type only depends on the class name, so it is worked out once
+        return _widget_type_announcement(self.__class__.__name__)
 
     def _get_state_announcement(self) -> str:
         """Get current state for announcement"""
         states = []
 
-        try:
-            # Check disabled state
-            if hasattr(self, "cget"):
-                try:
-                    if self.cget("state") == "disabled":
-                        states.append("disabled")
-                except:
-                    pass
+        # Check disabled state
+        if self._supports_state and hasattr(self, "cget"):
+            try:
+                if self.cget("state") == "disabled":
+                    states.append("disabled")
+            except _WIDGET_ERRORS:
+                self._supports_state = False
 
-            # Check checkbox/radio button state
-            if hasattr(self, "get"):
-                try:
-                    value = self.get()
-                    if isinstance(value, (bool, int)):
-                        if value:
-                            states.append("checked")
-                        else:
-                            states.append("unchecked")
-                except:
-                    pass
-        except:
-            pass
+        # Check checkbox/radio button state
+        if hasattr(self, "get"):
+            try:
+                value = self.get()
+                if isinstance(value, (bool, int)):
+                    if value:
+                        states.append("checked")
+                    else:
+                        states.append("unchecked")
+            except _WIDGET_ERRORS:
+                pass
 
         return ", ".join(states)
 
@@ -243,21 +247,21 @@ class CTKAccessibilityMixin:
     def _register_with_focus_manager(self) -> None:
         """Register this widget with the main focus manager"""
         try:
-            from .focus_manager import get_focus_manager
-
-            root = self.winfo_toplevel()
+            # The focus manager is shared by the whole application, so the
+            # root is found without asking Tk for the widget's toplevel
+            root = self._root()  # type: ignore
             focus_manager = get_focus_manager(root)
 
             # Only register if this is a focusable widget
             if focus_manager._is_focusable_widget(self):
                 focus_manager.register_widget(self)
-        except (AttributeError, ImportError, tk.TclError):
-            # Focus manager not available or widget not ready
+        except (AttributeError, tk.TclError):
+            # Widget not ready
             pass
 
     def destroy(self) -> None:
         """Clean up when widget is destroyed"""
-        self._monitoring = False
+        _focus_tracked_widgets.discard(self)
         super().destroy()
 
 
@@ -280,11 +284,13 @@ class AccessibleCTKButton(CTKAccessibilityMixin, ctk.CTkButton):
 
         super().__init__(*args, **kwargs)
 
+        # Announcement spoken on every activation
+        self._activation_announcement = f"{self.accessible_name or 'Button'} activated"
+
     def _accessible_command(self) -> None:
         """Wrapped command that adds accessibility feedback"""
         # Announce button activation
-        announcement = f"{self.accessible_name or 'Button'} activated"
-        speak(announcement)
+        speak(self._activation_announcement)
 
         # Call original command
         if self._original_command:
@@ -303,32 +309,76 @@ class AccessibleCTKEntry(CTKAccessibilityMixin, ctk.CTkEntry):
 
     def _setup_text_monitoring(self) -> None:
         """Monitor text changes since CTK doesn't support text change events"""
+        # Writes to the entry's text variable are traced while the entry has
+        # focus. The inner Tk entry gets a variable holding its current text if
+        # the caller didn't pass any.
+        variable = self._textvariable
+        if not isinstance(variable, tk.Variable):
+            variable = tk.StringVar(self._entry, value=self._entry.get())
+            self._entry.configure(textvariable=variable)
 
-        def monitor_text():
-            while self._monitoring:
-                try:
-                    current_text = self.get()
-                    if current_text != self._last_text:
-                        self._on_text_changed(current_text)
-                        self._last_text = current_text
-                    time.sleep(0.2)  # Check every 200ms
-                except:
-                    break
+        self._text_variable = variable
+        self._text_trace: Optional[str] = None
 
-        threading.Thread(target=monitor_text, daemon=True).start()
+    def _on_focus_gained(self) -> None:
+        """Start tracing text changes when the entry gains focus"""
+        # Edits made while unfocused aren't announced, so start from the
+        # current text
+        try:
+            self._last_text = self.get()
+        except tk.TclError:
+            pass
+        if self._text_trace is None:
+            self._text_trace = self._text_variable.trace_add(
+                "write", self._check_text_change
+            )
+
+        super()._on_focus_gained()
+
+    def _on_focus_lost(self) -> None:
+        """Stop tracing text changes when the entry loses focus"""
+        super()._on_focus_lost()
+        self._stop_text_trace()
+
+    def _stop_text_trace(self) -> None:
+        """Remove the text variable trace, if any"""
+        if self._text_trace is not None:
+            try:
+                self._text_variable.trace_remove("write", self._text_trace)
+            except tk.TclError:
+                pass
+            self._text_trace = None
+
+    def _check_text_change(self, *args: Any) -> None:
+        """Announce the entry text if it changed"""
+        try:
+            current_text = self.get()
+        except tk.TclError:
+            return
+
+        if current_text != self._last_text:
+            self._on_text_changed(current_text)
+            self._last_text = current_text
 
     def _on_text_changed(self, new_text: str) -> None:
         """Handle text change"""
-        if self._has_focus:
-            # Announce text changes for screen readers
-            if len(new_text) > len(self._last_text):
-                # Text was added
-                added_text = new_text[len(self._last_text) :]
-                if len(added_text) == 1:
-                    speak(added_text)
-            elif len(new_text) < len(self._last_text):
-                # Text was removed
-                speak("deleted")
+        # Only traced while focused, so announce text changes for screen readers
+        if len(new_text) == len(self._last_text) + 1:
+            # A character was typed, so it sits just before the cursor
+            try:
+                position = self.index("insert")
+            except tk.TclError:
+                return
+            if position > 0:
+                speak(new_text[position - 1])
+        elif len(new_text) < len(self._last_text):
+            # Text was removed
+            speak("deleted")
+
+    def destroy(self) -> None:
+        """Stop tracing the text variable when the entry is destroyed"""
+        self._stop_text_trace()
+        super().destroy()
 
 
 class AccessibleCTKLabel(CTKAccessibilityMixin, ctk.CTkLabel):
@@ -350,15 +400,20 @@ class AccessibleCTKCheckBox(CTKAccessibilityMixin, ctk.CTkCheckBox):
 
         super().__init__(*args, **kwargs)
 
+        # Announcements spoken on every state change
+        name = self.accessible_name or "Checkbox"
+        self._checked_announcement = f"{name} checked"
+        self._unchecked_announcement = f"{name} unchecked"
+
     def _accessible_command(self) -> None:
         """Wrapped command that adds accessibility feedback"""
         # Announce checkbox state change
         try:
-            checked = self.get()
-            state = "checked" if checked else "unchecked"
-            announcement = f"{self.accessible_name or 'Checkbox'} {state}"
-            speak(announcement)
-        except:
+            if self.get():
+                speak(self._checked_announcement)
+            else:
+                speak(self._unchecked_announcement)
+        except _WIDGET_ERRORS:
             pass
 
         # Call original command
@@ -379,11 +434,15 @@ class AccessibleCTKRadioButton(CTKAccessibilityMixin, ctk.CTkRadioButton):
 
         super().__init__(*args, **kwargs)
 
+        # Announcement spoken on every selection
+        self._selection_announcement = (
+            f"{self.accessible_name or 'Radio button'} selected"
+        )
+
     def _accessible_command(self) -> None:
         """Wrapped command that adds accessibility feedback"""
         # Announce radio button selection
-        announcement = f"{self.accessible_name or 'Radio button'} selected"
-        speak(announcement)
+        speak(self._selection_announcement)
 
         # Call original command
         if self._original_command:
@@ -405,32 +464,39 @@ class AccessibleCTKSlider(CTKAccessibilityMixin, ctk.CTkSlider):
 
         # Track last announced value to avoid spam
         self._last_announced_value = None
-        self._announce_timer = None
+        self._announce_after_id: Optional[str] = None
 
     def _accessible_command(self, value: float) -> None:
         """Wrapped command that adds accessibility feedback"""
         # Debounce announcements
-        if self._announce_timer:
-            self._announce_timer.cancel()
+        if self._announce_after_id:
+            self.after_cancel(self._announce_after_id)
 
         def announce_value():
+            self._announce_after_id = None
             try:
                 int_value = int(value)
                 if self._last_announced_value != int_value:
                     announcement = f"{self.accessible_name or 'Slider'} {int_value}"
                     speak(announcement)
                     self._last_announced_value = int_value
-            except:
+            except _WIDGET_ERRORS:
                 pass
 
         # Delay announcement to avoid spam during dragging
-        self._announce_timer = threading.Timer(0.5, announce_value)
-        self._announce_timer.start()
+        self._announce_after_id = self.after(500, announce_value)
 
         # Call original command
         if self._original_command:
             self._original_command(value)
 
+    def destroy(self) -> None:
+        """Cancel any pending value announcement when the slider is destroyed"""
+        if self._announce_after_id:
+            self.after_cancel(self._announce_after_id)
+            self._announce_after_id = None
+        super().destroy()
+
 
 class AccessibleCTKTabview(CTKAccessibilityMixin, ctk.CTkTabview):
     """Accessible CustomTkinter Tabview"""
@@ -36,6 +36,7 @@ except ImportError:
 
 
 from .a11y_engine import speak
+from .focus_manager import get_focus_manager
 from .platform_adapter import set_accessible_name, set_accessible_description
 
 
@@ -47,6 +48,7 @@ class EnhancedCTKButton(ctk.CTkButton if CTK_AVAILABLE else object):
         self.accessible_name = kwargs.pop("accessible_name", None)
         self.accessible_description = kwargs.pop("accessible_description", None)
         self.accessible_role = kwargs.pop("accessible_role", "button")
+        self._update_announcements()
 
         # Store original command
         self._original_command = kwargs.get("command", None)
@@ -60,9 +62,9 @@ class EnhancedCTKButton(ctk.CTkButton if CTK_AVAILABLE else object):
 
         # Focus management
         self._has_focus = False
-        self._focus_callbacks = []
-        self._focus_in_callbacks = []
-        self._focus_out_callbacks = []
+        # Focus-in callbacks as dict keys, kept in insertion order
+        self._focus_callbacks: Dict[Callable, None] = {}
+        self._focus_out_callbacks: list[Callable] = []
 
         # Set up accessibility
         self._setup_accessibility()
@@ -122,11 +124,23 @@ class EnhancedCTKButton(ctk.CTkButton if CTK_AVAILABLE else object):
                 # Some widgets might not support binding
                 pass
 
+    def _update_announcements(self) -> None:
+        """Build the announcements spoken on focus and activation"""
+        # Only the accessible name and description go into them, so they are
+        # rebuilt when those change rather than on every event
+        self._focus_announcement: Optional[str] = None
+        self._activation_announcement: Optional[str] = None
+        if self.accessible_name:
+            self._focus_announcement = f"{self.accessible_name}, button"
+            if self.accessible_description:
+                self._focus_announcement += f", {self.accessible_description}"
+            self._activation_announcement = f"{self.accessible_name} activated"
+
     def _enhanced_command(self):
         """Enhanced command that includes accessibility feedback"""
         # Announce button activation
-        if self.accessible_name:
-            speak(f"{self.accessible_name} activated")
+        if self._activation_announcement:
+            speak(self._activation_announcement)
 
         # Call original command
         if self._original_command:
@@ -141,14 +155,11 @@ class EnhancedCTKButton(ctk.CTkButton if CTK_AVAILABLE else object):
             self._has_focus = True
 
             # Announce focus
-            if self.accessible_name:
-                announcement = f"{self.accessible_name}, button"
-                if self.accessible_description:
-                    announcement += f", {self.accessible_description}"
-                speak(announcement)
+            if self._focus_announcement:
+                speak(self._focus_announcement)
 
             # Call focus callbacks
-            for callback in self._focus_in_callbacks:
+            for callback in list(self._focus_callbacks):
                 try:
                     callback(self)
                 except Exception:
@@ -226,16 +237,11 @@ class EnhancedCTKButton(ctk.CTkButton if CTK_AVAILABLE else object):
 
     def add_focus_callback(self, callback: Callable):
         """Add a callback for focus events"""
-        if callback not in self._focus_callbacks:
-            self._focus_callbacks.append(callback)
-            self._focus_in_callbacks.append(callback)
+        self._focus_callbacks[callback] = None
 
     def remove_focus_callback(self, callback: Callable):
         """Remove a focus callback"""
-        if callback in self._focus_callbacks:
-            self._focus_callbacks.remove(callback)
-        if callback in self._focus_in_callbacks:
-            self._focus_in_callbacks.remove(callback)
+        self._focus_callbacks.pop(callback, None)
 
     def has_focus(self) -> bool:
         """Check if this widget has focus"""
@@ -252,6 +258,8 @@ class EnhancedCTKButton(ctk.CTkButton if CTK_AVAILABLE else object):
             self.accessible_description = kwargs.pop("accessible_description")
             set_accessible_description(self, self.accessible_description)
 
+        self._update_announcements()
+
         if "command" in kwargs:
             self._original_command = kwargs["command"]
             kwargs["command"] = self._enhanced_command
@@ -262,13 +270,13 @@ class EnhancedCTKButton(ctk.CTkButton if CTK_AVAILABLE else object):
     def _register_with_focus_manager(self):
         """Register this widget with the focus manager"""
         try:
-            from .focus_manager import get_focus_manager
-
-            root = self.winfo_toplevel()
+            # The focus manager is shared by the whole application, so the
+            # root is found without asking Tk for the widget's toplevel
+            root = self._root()
             focus_manager = get_focus_manager(root)
             focus_manager.register_widget(self)
-        except (AttributeError, ImportError, tk.TclError):
-            # Focus manager not available or widget not ready
+        except (AttributeError, tk.TclError):
+            # Widget not ready
             pass
 
 
@@ -280,15 +288,16 @@ class EnhancedCTKEntry(ctk.CTkEntry if CTK_AVAILABLE else object):
         self.accessible_name = kwargs.pop("accessible_name", None)
         self.accessible_description = kwargs.pop("accessible_description", None)
         self.accessible_role = kwargs.pop("accessible_role", "textbox")
+        self._update_announcements()
 
         # Initialize the CTK entry
         super().__init__(master, **kwargs)
 
         # Focus management
         self._has_focus = False
-        self._focus_callbacks = []
-        self._focus_in_callbacks = []
-        self._focus_out_callbacks = []
+        # Focus-in callbacks as dict keys, kept in insertion order
+        self._focus_callbacks: Dict[Callable, None] = {}
+        self._focus_out_callbacks: list[Callable] = []
 
         # Set up accessibility
         self._setup_accessibility()
@@ -306,6 +315,14 @@ class EnhancedCTKEntry(ctk.CTkEntry if CTK_AVAILABLE else object):
         if self.accessible_description:
             set_accessible_description(self, self.accessible_description)
 
+    def _update_announcements(self) -> None:
+        """Build the fixed part of the announcement spoken on focus"""
+        self._focus_announcement: Optional[str] = None
+        if self.accessible_name:
+            self._focus_announcement = f"{self.accessible_name}, text field"
+            if self.accessible_description:
+                self._focus_announcement += f", {self.accessible_description}"
+
     def _setup_focus_handling(self):
         """Set up enhanced focus handling"""
         # Bind focus events to internal entry widget
@@ -323,10 +340,8 @@ class EnhancedCTKEntry(ctk.CTkEntry if CTK_AVAILABLE else object):
             self._has_focus = True
 
             # Announce focus
-            if self.accessible_name:
-                announcement = f"{self.accessible_name}, text field"
-                if self.accessible_description:
-                    announcement += f", {self.accessible_description}"
+            if self._focus_announcement:
+                announcement = self._focus_announcement
 
                 # Include current value if any
                 current_value = self.get()
@@ -336,7 +351,7 @@ class EnhancedCTKEntry(ctk.CTkEntry if CTK_AVAILABLE else object):
                 speak(announcement)
 
             # Call focus callbacks
-            for callback in self._focus_in_callbacks:
+            for callback in list(self._focus_callbacks):
                 try:
                     callback(self)
                 except Exception:
@@ -392,16 +407,11 @@ class EnhancedCTKEntry(ctk.CTkEntry if CTK_AVAILABLE else object):
 
     def add_focus_callback(self, callback: Callable):
         """Add a callback for focus events"""
-        if callback not in self._focus_callbacks:
-            self._focus_callbacks.append(callback)
-            self._focus_in_callbacks.append(callback)
+        self._focus_callbacks[callback] = None
 
     def remove_focus_callback(self, callback: Callable):
         """Remove a focus callback"""
-        if callback in self._focus_callbacks:
-            self._focus_callbacks.remove(callback)
-        if callback in self._focus_in_callbacks:
-            self._focus_in_callbacks.remove(callback)
+        self._focus_callbacks.pop(callback, None)
 
     def has_focus(self) -> bool:
         """Check if this widget has focus"""
@@ -418,19 +428,21 @@ class EnhancedCTKEntry(ctk.CTkEntry if CTK_AVAILABLE else object):
             self.accessible_description = kwargs.pop("accessible_description")
             set_accessible_description(self, self.accessible_description)
 
+        self._update_announcements()
+
         # Call parent configure
         super().configure(**kwargs)
 
     def _register_with_focus_manager(self):
         """Register this widget with the focus manager"""
         try:
-            from .focus_manager import get_focus_manager
-
-            root = self.winfo_toplevel()
+            # The focus manager is shared by the whole application, so the
+            # root is found without asking Tk for the widget's toplevel
+            root = self._root()
             focus_manager = get_focus_manager(root)
             focus_manager.register_widget(self)
-        except (AttributeError, ImportError, tk.TclError):
-            # Focus manager not available or widget not ready
+        except (AttributeError, tk.TclError):
+            # Widget not ready
             pass
 
 